@@ -7,8 +7,8 @@ from app.api.dependencies.authentication import get_current_user_authorizer
 from app.api.dependencies.database import get_repository
 from app.db.errors import EntityDoesNotExist
 from app.db.repositories.articles import ArticlesRepository
-from app.models.domain.articles import Article
-from app.models.domain.users import User
+from app.models.domain.articles import Article, ArticleReference
+from app.models.domain.users import UserInDB
 from app.models.schemas.articles import (
     DEFAULT_ARTICLES_LIMIT,
     DEFAULT_ARTICLES_OFFSET,
@@ -16,14 +16,16 @@ from app.models.schemas.articles import (
 )
 from app.resources import strings
 from app.services.articles import check_user_can_modify_article
+from app.services.etags import make_etag
 
 
-def get_articles_filters(
+def get_articles_filters(  # noqa: WPS211
     tag: Optional[str] = None,
     author: Optional[str] = None,
     favorited: Optional[str] = None,
     limit: int = Query(DEFAULT_ARTICLES_LIMIT, ge=1),
     offset: int = Query(DEFAULT_ARTICLES_OFFSET, ge=0),
+    include_body: bool = True,
 ) -> ArticlesFilters:
     return ArticlesFilters(
         tag=tag,
@@ -31,12 +33,13 @@ def get_articles_filters(
         favorited=favorited,
         limit=limit,
         offset=offset,
+        include_body=include_body,
     )
 
 
 async def get_article_by_slug_from_path(
     slug: str = Path(..., min_length=1),
-    user: Optional[User] = Depends(get_current_user_authorizer(required=False)),
+    user: Optional[UserInDB] = Depends(get_current_user_authorizer(required=False)),
     articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
 ) -> Article:
     try:
@@ -48,12 +51,59 @@ async def get_article_by_slug_from_path(
         )
 
 
+async def get_article_etag_from_path(
+    slug: str = Path(..., min_length=1),
+    user: Optional[UserInDB] = Depends(get_current_user_authorizer(required=False)),
+    articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+) -> str:
+    try:
+        article_version = await articles_repo.get_article_version_by_slug(
+            slug=slug,
+            requested_user=user,
+        )
+    except EntityDoesNotExist:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=strings.ARTICLE_DOES_NOT_EXIST_ERROR,
+        )
+
+    return make_etag(*article_version)
+
+
+async def get_article_reference_by_slug_from_path(
+    slug: str = Path(..., min_length=1),
+    articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+) -> ArticleReference:
+    try:
+        return await articles_repo.get_article_reference_by_slug(slug=slug)
+    except EntityDoesNotExist:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=strings.ARTICLE_DOES_NOT_EXIST_ERROR,
+        )
+
+
 def check_article_modification_permissions(
-    current_article: Article = Depends(get_article_by_slug_from_path),
-    user: User = Depends(get_current_user_authorizer()),
+    current_article: ArticleReference = Depends(
+        get_article_reference_by_slug_from_path,
+    ),
+    user: UserInDB = Depends(get_current_user_authorizer()),
 ) -> None:
-    if not check_user_can_modify_article(current_article, user):
+    if not check_user_can_modify_article(current_article.author_username, user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=strings.USER_IS_NOT_AUTHOR_OF_ARTICLE,
+        )
+
+
+def get_article_for_modification_from_path(
+    current_article: Article = Depends(get_article_by_slug_from_path),
+    user: UserInDB = Depends(get_current_user_authorizer()),
+) -> Article:
+    if not check_user_can_modify_article(current_article.author.username, user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=strings.USER_IS_NOT_AUTHOR_OF_ARTICLE,
         )
+
+    return current_article
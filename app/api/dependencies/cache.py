@@ -0,0 +1,11 @@
+from starlette.requests import Request
+
+from app.services.cache import TTLCache
+
+
+def get_autocomplete_cache(request: Request) -> TTLCache:
+    return request.app.state.autocomplete_cache
+
+
+def get_response_cache(request: Request) -> TTLCache:
+    return request.app.state.response_cache
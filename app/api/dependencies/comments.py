@@ -6,17 +6,20 @@ from starlette import status
 from app.api.dependencies import articles, authentication, database
 from app.db.errors import EntityDoesNotExist
 from app.db.repositories.comments import CommentsRepository
-from app.models.domain.articles import Article
+from app.models.domain.articles import ArticleReference
 from app.models.domain.comments import Comment
-from app.models.domain.users import User
+from app.models.domain.users import UserInDB
 from app.resources import strings
 from app.services.comments import check_user_can_modify_comment
+from app.services.etags import make_etag
 
 
 async def get_comment_by_id_from_path(
     comment_id: int = Path(..., ge=1),
-    article: Article = Depends(articles.get_article_by_slug_from_path),
-    user: Optional[User] = Depends(
+    article: ArticleReference = Depends(
+        articles.get_article_reference_by_slug_from_path,
+    ),
+    user: Optional[UserInDB] = Depends(
         authentication.get_current_user_authorizer(required=False),
     ),
     comments_repo: CommentsRepository = Depends(
@@ -36,9 +39,27 @@ async def get_comment_by_id_from_path(
         )
 
 
+async def get_comments_etag_for_article(
+    article: ArticleReference = Depends(
+        articles.get_article_reference_by_slug_from_path,
+    ),
+    user: Optional[UserInDB] = Depends(
+        authentication.get_current_user_authorizer(required=False),
+    ),
+    comments_repo: CommentsRepository = Depends(
+        database.get_repository(CommentsRepository),
+    ),
+) -> str:
+    comments_version = await comments_repo.get_comments_version_for_article(
+        article=article,
+        user=user,
+    )
+    return make_etag(article.id_, *comments_version)
+
+
 def check_comment_modification_permissions(
     comment: Comment = Depends(get_comment_by_id_from_path),
-    user: User = Depends(authentication.get_current_user_authorizer()),
+    user: UserInDB = Depends(authentication.get_current_user_authorizer()),
 ) -> None:
     if not check_user_can_modify_comment(comment, user):
         raise HTTPException(
@@ -0,0 +1,7 @@
+from starlette.requests import Request
+
+from app.db.health import DatabaseHealthMonitor
+
+
+def get_database_health_monitor(request: Request) -> DatabaseHealthMonitor:
+    return request.app.state.database_health_monitor
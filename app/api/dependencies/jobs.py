@@ -0,0 +1,7 @@
+from starlette.requests import Request
+
+from app.db.jobs import JobRunner
+
+
+def get_job_runner(request: Request) -> JobRunner:
+    return request.app.state.job_runner
@@ -8,13 +8,14 @@ from app.api.dependencies.database import get_repository
 from app.db.errors import EntityDoesNotExist
 from app.db.repositories.profiles import ProfilesRepository
 from app.models.domain.profiles import Profile
-from app.models.domain.users import User
+from app.models.domain.users import UserInDB
 from app.resources import strings
+from app.services.etags import make_etag
 
 
 async def get_profile_by_username_from_path(
     username: str = Path(..., min_length=1),
-    user: Optional[User] = Depends(get_current_user_authorizer(required=False)),
+    user: Optional[UserInDB] = Depends(get_current_user_authorizer(required=False)),
     profiles_repo: ProfilesRepository = Depends(get_repository(ProfilesRepository)),
 ) -> Profile:
     try:
@@ -27,3 +28,22 @@ async def get_profile_by_username_from_path(
             status_code=HTTP_404_NOT_FOUND,
             detail=strings.USER_DOES_NOT_EXIST_ERROR,
         )
+
+
+async def get_profile_etag_from_path(
+    username: str = Path(..., min_length=1),
+    user: Optional[UserInDB] = Depends(get_current_user_authorizer(required=False)),
+    profiles_repo: ProfilesRepository = Depends(get_repository(ProfilesRepository)),
+) -> str:
+    try:
+        profile_version = await profiles_repo.get_profile_version_by_username(
+            username=username,
+            requested_user=user,
+        )
+    except EntityDoesNotExist:
+        raise HTTPException(
+            status_code=HTTP_404_NOT_FOUND,
+            detail=strings.USER_DOES_NOT_EXIST_ERROR,
+        )
+
+    return make_etag(*profile_version)
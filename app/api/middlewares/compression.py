@@ -0,0 +1,54 @@
+from functools import partial
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware import gzip as starlette_gzip
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.compression import GZIP_ENCODING, accepts_gzip
+
+WEAK_ETAG_PREFIX = "W/"
+
+
+class GZipResponder(starlette_gzip.GZipResponder):
+    def __init__(self, app: ASGIApp, minimum_size: int, compresslevel: int) -> None:
+        super().__init__(app, minimum_size, compresslevel=compresslevel)
+        self.already_encoded = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await super().__call__(scope, receive, partial(self.send_encoded, send))
+
+    async def send_with_gzip(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.already_encoded = "content-encoding" in Headers(
+                raw=message["headers"],
+            )
+
+        if self.already_encoded:
+            await self.send(message)
+        else:
+            await super().send_with_gzip(message)
+
+    async def send_encoded(self, send: Send, message: Message) -> None:
+        if message["type"] == "http.response.start" and not self.already_encoded:
+            _weaken_etag_of_gzipped_response(MutableHeaders(raw=message["headers"]))
+
+        await send(message)
+
+
+class CompressionMiddleware(starlette_gzip.GZipMiddleware):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and accepts_gzip(Headers(scope=scope)):
+            responder = GZipResponder(self.app, self.minimum_size, self.compresslevel)
+            await responder(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+def _weaken_etag_of_gzipped_response(headers: MutableHeaders) -> None:
+    # gzipped body is not byte-for-byte equal to the one the strong ETag was made for
+    etag = headers.get("ETag")
+    if etag and headers.get("Content-Encoding") == GZIP_ENCODING:
+        headers["ETag"] = "{0}{1}".format(
+            WEAK_ETAG_PREFIX,
+            etag.removeprefix(WEAK_ETAG_PREFIX),
+        )
@@ -1,16 +1,49 @@
-from fastapi import APIRouter
+from fastapi import FastAPI
 
-from app.api.routes import authentication, comments, profiles, tags, users
-from app.api.routes.articles import api as articles
+from app.api.routes import authentication, autocomplete, comments, profiles, tags, users
+from app.api.routes.articles import articles_common, articles_resource
 
-router = APIRouter()
-router.include_router(authentication.router, tags=["authentication"], prefix="/users")
-router.include_router(users.router, tags=["users"], prefix="/user")
-router.include_router(profiles.router, tags=["profiles"], prefix="/profiles")
-router.include_router(articles.router, tags=["articles"])
-router.include_router(
-    comments.router,
-    tags=["comments"],
-    prefix="/articles/{slug}/comments",
-)
-router.include_router(tags.router, tags=["tags"], prefix="/tags")
+
+def include_api_routers(application: FastAPI, *, prefix: str) -> None:
+    # every include_router call rebuilds all included routes, so routers are
+    # included into the application directly instead of into each other
+    application.include_router(
+        authentication.router,
+        tags=["authentication"],
+        prefix="{0}/users".format(prefix),
+    )
+    application.include_router(
+        users.router,
+        tags=["users"],
+        prefix="{0}/user".format(prefix),
+    )
+    application.include_router(
+        profiles.router,
+        tags=["profiles"],
+        prefix="{0}/profiles".format(prefix),
+    )
+    application.include_router(
+        articles_common.router,
+        tags=["articles"],
+        prefix="{0}/articles".format(prefix),
+    )
+    application.include_router(
+        articles_resource.router,
+        tags=["articles"],
+        prefix="{0}/articles".format(prefix),
+    )
+    application.include_router(
+        comments.router,
+        tags=["comments"],
+        prefix="{0}/articles/{{slug}}/comments".format(prefix),
+    )
+    application.include_router(
+        tags.router,
+        tags=["tags"],
+        prefix="{0}/tags".format(prefix),
+    )
+    application.include_router(
+        autocomplete.router,
+        tags=["autocomplete"],
+        prefix="{0}/autocomplete".format(prefix),
+    )
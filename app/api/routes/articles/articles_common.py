@@ -1,20 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query
 from starlette import status
 
 from app.api.dependencies.articles import get_article_by_slug_from_path
 from app.api.dependencies.authentication import get_current_user_authorizer
+from app.api.dependencies.cache import get_response_cache
 from app.api.dependencies.database import get_repository
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.db.errors import EntityDoesNotExist
 from app.db.repositories.articles import ArticlesRepository
-from app.models.domain.articles import Article
-from app.models.domain.users import User
+from app.models.domain.users import UserInDB
 from app.models.schemas.articles import (
     DEFAULT_ARTICLES_LIMIT,
     DEFAULT_ARTICLES_OFFSET,
+    MAX_ARTICLES_BATCH_SIZE,
+    MAX_FAVORITES_BATCH_SIZE,
     ArticleForResponse,
     ArticleInResponse,
+    ArticlesBatchInResponse,
+    ArticlesSearchResultsInResponse,
+    FavoriteInBatch,
+    FavoriteInBatchResult,
+    FavoritesBatchInResponse,
     ListOfArticlesInResponse,
 )
 from app.resources import strings
+from app.services.articles import decode_search_cursor, encode_search_cursor
+from app.services.batches import get_batch_item_status
+from app.services.cache import TTLCache
 
 router = APIRouter()
 
@@ -27,13 +42,15 @@ router = APIRouter()
 async def get_articles_for_user_feed(
     limit: int = Query(DEFAULT_ARTICLES_LIMIT, ge=1),
     offset: int = Query(DEFAULT_ARTICLES_OFFSET, ge=0),
-    user: User = Depends(get_current_user_authorizer()),
+    user: UserInDB = Depends(get_current_user_authorizer()),
     articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+    settings: AppSettings = Depends(get_app_settings),
 ) -> ListOfArticlesInResponse:
     articles = await articles_repo.get_articles_for_user_feed(
         user=user,
         limit=limit,
         offset=offset,
+        materialized=settings.feed_fan_out_enabled,
     )
     articles_for_response = [
         ArticleForResponse(**article.dict()) for article in articles
@@ -44,34 +61,144 @@ async def get_articles_for_user_feed(
     )
 
 
+@router.get(
+    "/search",
+    response_model=ArticlesSearchResultsInResponse,
+    name="articles:search-articles",
+)
+async def search_articles(
+    query: str = Query(..., alias="q", min_length=1),
+    limit: int = Query(DEFAULT_ARTICLES_LIMIT, ge=1),
+    cursor: Optional[str] = None,
+    user: Optional[UserInDB] = Depends(get_current_user_authorizer(required=False)),
+    articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+) -> ArticlesSearchResultsInResponse:
+    try:
+        after = decode_search_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=strings.MALFORMED_SEARCH_CURSOR,
+        )
+
+    articles, next_key = await articles_repo.search_articles(
+        query=query,
+        limit=limit,
+        after=after,
+        requested_user=user,
+    )
+    return ArticlesSearchResultsInResponse(
+        articles=[ArticleForResponse.from_orm(article) for article in articles],
+        articles_count=len(articles),
+        next_cursor=encode_search_cursor(*next_key) if next_key else None,
+    )
+
+
+@router.get(
+    "/batch",
+    response_model=ArticlesBatchInResponse,
+    name="articles:get-articles-batch",
+)
+async def get_articles_batch(
+    slugs: List[str] = Query(
+        ...,
+        alias="slug",
+        min_items=1,
+        max_items=MAX_ARTICLES_BATCH_SIZE,
+    ),
+    user: Optional[UserInDB] = Depends(get_current_user_authorizer(required=False)),
+    articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+) -> ArticlesBatchInResponse:
+    articles, missing_slugs = await articles_repo.get_articles_by_slugs(
+        slugs=slugs,
+        requested_user=user,
+    )
+    return ArticlesBatchInResponse(
+        articles=[ArticleForResponse.from_orm(article) for article in articles],
+        articles_count=len(articles),
+        missing_slugs=missing_slugs,
+    )
+
+
+@router.post(
+    "/favorites/batch",
+    response_model=FavoritesBatchInResponse,
+    name="articles:change-favorites-batch",
+)
+async def change_favorites_batch(
+    favorites: List[FavoriteInBatch] = Body(
+        ...,
+        embed=True,
+        min_items=1,
+        max_items=MAX_FAVORITES_BATCH_SIZE,
+    ),
+    user: UserInDB = Depends(get_current_user_authorizer()),
+    articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+    response_cache: TTLCache = Depends(get_response_cache),
+) -> FavoritesBatchInResponse:
+    favorited_by_slugs = {favorite.slug: favorite.favorited for favorite in favorites}
+    changed_slugs, missing_slugs = await articles_repo.change_favorites_by_slugs(
+        user=user,
+        favorited_by_slugs=favorited_by_slugs,
+    )
+    if changed_slugs:
+        response_cache.clear()
+
+    return FavoritesBatchInResponse(
+        favorites=[
+            FavoriteInBatchResult(
+                slug=slug,
+                favorited=favorited,
+                status=get_batch_item_status(
+                    slug,
+                    changed=changed_slugs,
+                    missing=missing_slugs,
+                ),
+            )
+            for slug, favorited in favorited_by_slugs.items()
+        ],
+    )
+
+
 @router.post(
     "/{slug}/favorite",
     response_model=ArticleInResponse,
     name="articles:mark-article-favorite",
 )
 async def mark_article_as_favorite(
-    article: Article = Depends(get_article_by_slug_from_path),
-    user: User = Depends(get_current_user_authorizer()),
+    slug: str = Path(..., min_length=1),
+    user: UserInDB = Depends(get_current_user_authorizer()),
     articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+    response_cache: TTLCache = Depends(get_response_cache),
 ) -> ArticleInResponse:
-    if not article.favorited:
-        await articles_repo.add_article_into_favorites(article=article, user=user)
-
-        return ArticleInResponse(
-            article=ArticleForResponse.from_orm(
-                article.copy(
-                    update={
-                        "favorited": True,
-                        "favorites_count": article.favorites_count + 1,
-                    },
-                ),
-            ),
+    try:
+        favorited, favorites_count = await articles_repo.change_article_favorite_state(
+            slug=slug,
+            user=user,
+            favorited=True,
+        )
+    except EntityDoesNotExist:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=strings.ARTICLE_DOES_NOT_EXIST_ERROR,
         )
 
-    raise HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        detail=strings.ARTICLE_IS_ALREADY_FAVORITED,
+    if not favorited:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=strings.ARTICLE_IS_ALREADY_FAVORITED,
+        )
+
+    response_cache.clear()
+    article = await get_article_by_slug_from_path(
+        slug=slug,
+        user=user,
+        articles_repo=articles_repo,
     )
+    article = article.copy(
+        update={"favorited": True, "favorites_count": favorites_count},
+    )
+    return ArticleInResponse(article=ArticleForResponse.from_orm(article))
 
 
 @router.delete(
@@ -80,25 +207,39 @@ async def mark_article_as_favorite(
     name="articles:unmark-article-favorite",
 )
 async def remove_article_from_favorites(
-    article: Article = Depends(get_article_by_slug_from_path),
-    user: User = Depends(get_current_user_authorizer()),
+    slug: str = Path(..., min_length=1),
+    user: UserInDB = Depends(get_current_user_authorizer()),
     articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+    response_cache: TTLCache = Depends(get_response_cache),
 ) -> ArticleInResponse:
-    if article.favorited:
-        await articles_repo.remove_article_from_favorites(article=article, user=user)
-
-        return ArticleInResponse(
-            article=ArticleForResponse.from_orm(
-                article.copy(
-                    update={
-                        "favorited": False,
-                        "favorites_count": article.favorites_count - 1,
-                    },
-                ),
-            ),
+    try:
+        (
+            unfavorited,
+            favorites_count,
+        ) = await articles_repo.change_article_favorite_state(
+            slug=slug,
+            user=user,
+            favorited=False,
+        )
+    except EntityDoesNotExist:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=strings.ARTICLE_DOES_NOT_EXIST_ERROR,
+        )
+
+    if not unfavorited:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=strings.ARTICLE_IS_NOT_FAVORITED,
         )
 
-    raise HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        detail=strings.ARTICLE_IS_NOT_FAVORITED,
+    response_cache.clear()
+    article = await get_article_by_slug_from_path(
+        slug=slug,
+        user=user,
+        articles_repo=articles_repo,
+    )
+    article = article.copy(
+        update={"favorited": False, "favorites_count": favorites_count},
     )
+    return ArticleInResponse(article=ArticleForResponse.from_orm(article))
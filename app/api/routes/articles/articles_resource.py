@@ -1,53 +1,72 @@
-from typing import Optional
+from functools import partial
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Response
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Path, Response
 from starlette import status
+from starlette.requests import Request
 
 from app.api.dependencies.articles import (
     check_article_modification_permissions,
     get_article_by_slug_from_path,
+    get_article_etag_from_path,
+    get_article_for_modification_from_path,
+    get_article_reference_by_slug_from_path,
     get_articles_filters,
 )
 from app.api.dependencies.authentication import get_current_user_authorizer
+from app.api.dependencies.cache import get_response_cache
 from app.api.dependencies.database import get_repository
+from app.api.dependencies.jobs import get_job_runner
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.db import feed_jobs
+from app.db.errors import EntityAlreadyExists
+from app.db.jobs import JobRunner
 from app.db.repositories.articles import ArticlesRepository
-from app.models.domain.articles import Article
-from app.models.domain.users import User
+from app.models.domain.articles import Article, ArticleReference
+from app.models.domain.users import UserInDB
 from app.models.schemas.articles import (
     ArticleForResponse,
     ArticleInCreate,
     ArticleInResponse,
     ArticleInUpdate,
+    ArticlePreviewForResponse,
     ArticlesFilters,
     ListOfArticlesInResponse,
 )
 from app.resources import strings
-from app.services.articles import check_article_exists, get_slug_for_article
+from app.services.articles import get_slug_for_article, make_article_etag
+from app.services.cache import TTLCache
+from app.services.compression import precompress_response
+from app.services.etags import etag_matches
 
 router = APIRouter()
 
 
 @router.get("", response_model=ListOfArticlesInResponse, name="articles:list-articles")
-async def list_articles(
+async def list_articles(  # noqa: WPS211
+    request: Request,
     articles_filters: ArticlesFilters = Depends(get_articles_filters),
-    user: Optional[User] = Depends(get_current_user_authorizer(required=False)),
+    user: Optional[UserInDB] = Depends(get_current_user_authorizer(required=False)),
     articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
-) -> ListOfArticlesInResponse:
-    articles = await articles_repo.filter_articles(
-        tag=articles_filters.tag,
-        author=articles_filters.author,
-        favorited=articles_filters.favorited,
-        limit=articles_filters.limit,
-        offset=articles_filters.offset,
+    response_cache: TTLCache = Depends(get_response_cache),
+    settings: AppSettings = Depends(get_app_settings),
+) -> Union[ListOfArticlesInResponse, Response]:
+    load_articles = partial(
+        _get_articles_for_response,
+        articles_filters=articles_filters,
         requested_user=user,
+        articles_repo=articles_repo,
     )
-    articles_for_response = [
-        ArticleForResponse.from_orm(article) for article in articles
-    ]
-    return ListOfArticlesInResponse(
-        articles=articles_for_response,
-        articles_count=len(articles),
+    if user:
+        return await load_articles()
+
+    cache_key = ("articles:list-articles", *articles_filters.dict().values())
+    cached_response = await response_cache.get_or_load(
+        cache_key,
+        partial(precompress_response, load_articles, settings=settings),
     )
+    return cached_response.to_response(request.headers)
 
 
 @router.post(
@@ -56,33 +75,67 @@ async def list_articles(
     response_model=ArticleInResponse,
     name="articles:create-article",
 )
-async def create_new_article(
+async def create_new_article(  # noqa: WPS211
     article_create: ArticleInCreate = Body(..., embed=True, alias="article"),
-    user: User = Depends(get_current_user_authorizer()),
+    user: UserInDB = Depends(get_current_user_authorizer()),
     articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+    job_runner: JobRunner = Depends(get_job_runner),
+    settings: AppSettings = Depends(get_app_settings),
+    response_cache: TTLCache = Depends(get_response_cache),
 ) -> ArticleInResponse:
-    slug = get_slug_for_article(article_create.title)
-    if await check_article_exists(articles_repo, slug):
+    try:
+        article = await articles_repo.create_article(
+            slug=get_slug_for_article(article_create.title),
+            title=article_create.title,
+            description=article_create.description,
+            body=article_create.body,
+            author=user,
+            tags=article_create.tags,
+        )
+    except EntityAlreadyExists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=strings.ARTICLE_ALREADY_EXISTS,
         )
 
-    article = await articles_repo.create_article(
-        slug=slug,
-        title=article_create.title,
-        description=article_create.description,
-        body=article_create.body,
-        author=user,
-        tags=article_create.tags,
-    )
+    response_cache.clear()
+
+    if settings.feed_fan_out_enabled:
+        await job_runner.submit(
+            feed_jobs.FAN_OUT_ARTICLE,
+            {
+                "article_id": article.id_,
+                "author_id": user.id_,
+                "max_items": settings.feed_max_items,
+                "followers_threshold": settings.feed_fan_out_followers_threshold,
+            },
+        )
+
     return ArticleInResponse(article=ArticleForResponse.from_orm(article))
 
 
 @router.get("/{slug}", response_model=ArticleInResponse, name="articles:get-article")
-async def retrieve_article_by_slug(
-    article: Article = Depends(get_article_by_slug_from_path),
-) -> ArticleInResponse:
+async def retrieve_article_by_slug(  # noqa: WPS211
+    response: Response,
+    slug: str = Path(..., min_length=1),
+    etag: str = Depends(get_article_etag_from_path),
+    if_none_match: Optional[str] = Header(None),
+    user: Optional[UserInDB] = Depends(get_current_user_authorizer(required=False)),
+    articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+) -> Union[ArticleInResponse, Response]:
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag},
+        )
+
+    article = await get_article_by_slug_from_path(
+        slug=slug,
+        user=user,
+        articles_repo=articles_repo,
+    )
+    # the loaded article may be older or newer than the checked version
+    response.headers["ETag"] = make_article_etag(article)
     return ArticleInResponse(article=ArticleForResponse.from_orm(article))
 
 
@@ -90,19 +143,22 @@ async def retrieve_article_by_slug(
     "/{slug}",
     response_model=ArticleInResponse,
     name="articles:update-article",
-    dependencies=[Depends(check_article_modification_permissions)],
 )
 async def update_article_by_slug(
     article_update: ArticleInUpdate = Body(..., embed=True, alias="article"),
-    current_article: Article = Depends(get_article_by_slug_from_path),
+    current_article: Article = Depends(get_article_for_modification_from_path),
+    user: UserInDB = Depends(get_current_user_authorizer()),
     articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+    response_cache: TTLCache = Depends(get_response_cache),
 ) -> ArticleInResponse:
     slug = get_slug_for_article(article_update.title) if article_update.title else None
     article = await articles_repo.update_article(
         article=current_article,
+        author_id=user.id_,
         slug=slug,
         **article_update.dict(),
     )
+    response_cache.clear()
     return ArticleInResponse(article=ArticleForResponse.from_orm(article))
 
 
@@ -114,7 +170,39 @@ async def update_article_by_slug(
     response_class=Response,
 )
 async def delete_article_by_slug(
-    article: Article = Depends(get_article_by_slug_from_path),
+    article: ArticleReference = Depends(get_article_reference_by_slug_from_path),
+    user: UserInDB = Depends(get_current_user_authorizer()),
     articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+    response_cache: TTLCache = Depends(get_response_cache),
 ) -> None:
-    await articles_repo.delete_article(article=article)
+    await articles_repo.delete_article(article=article, author_id=user.id_)
+    response_cache.clear()
+
+
+async def _get_articles_for_response(
+    *,
+    articles_filters: ArticlesFilters,
+    requested_user: Optional[UserInDB],
+    articles_repo: ArticlesRepository,
+) -> ListOfArticlesInResponse:
+    articles = await articles_repo.filter_articles(
+        tag=articles_filters.tag,
+        author=articles_filters.author,
+        favorited=articles_filters.favorited,
+        limit=articles_filters.limit,
+        offset=articles_filters.offset,
+        requested_user=requested_user,
+        include_body=articles_filters.include_body,
+    )
+    articles_for_response: List[
+        Union[ArticleForResponse, ArticlePreviewForResponse]
+    ] = [
+        ArticleForResponse.from_orm(article)
+        if articles_filters.include_body
+        else ArticlePreviewForResponse.from_orm(article)
+        for article in articles
+    ]
+    return ListOfArticlesInResponse(
+        articles=articles_for_response,
+        articles_count=len(articles),
+    )
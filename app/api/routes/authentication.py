@@ -4,7 +4,7 @@ from starlette.status import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
 from app.api.dependencies.database import get_repository
 from app.core.config import get_app_settings
 from app.core.settings.app import AppSettings
-from app.db.errors import EntityDoesNotExist
+from app.db.errors import EntityAlreadyExists, EntityDoesNotExist
 from app.db.repositories.users import UsersRepository
 from app.models.schemas.users import (
     UserInCreate,
@@ -14,7 +14,6 @@ from app.models.schemas.users import (
 )
 from app.resources import strings
 from app.services import jwt
-from app.services.authentication import check_email_is_taken, check_username_is_taken
 
 router = APIRouter()
 
@@ -64,20 +63,17 @@ async def register(
     users_repo: UsersRepository = Depends(get_repository(UsersRepository)),
     settings: AppSettings = Depends(get_app_settings),
 ) -> UserInResponse:
-    if await check_username_is_taken(users_repo, user_create.username):
-        raise HTTPException(
-            status_code=HTTP_400_BAD_REQUEST,
-            detail=strings.USERNAME_TAKEN,
+    try:
+        user = await users_repo.create_user(**user_create.dict())
+    except EntityAlreadyExists:
+        username_taken, _ = await users_repo.check_credentials_are_taken(
+            username=user_create.username,
         )
-
-    if await check_email_is_taken(users_repo, user_create.email):
         raise HTTPException(
             status_code=HTTP_400_BAD_REQUEST,
-            detail=strings.EMAIL_TAKEN,
+            detail=strings.USERNAME_TAKEN if username_taken else strings.EMAIL_TAKEN,
         )
 
-    user = await users_repo.create_user(**user_create.dict())
-
     token = jwt.create_access_token_for_user(
         user,
         str(settings.secret_key.get_secret_value()),
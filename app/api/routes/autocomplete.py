@@ -0,0 +1,50 @@
+from functools import partial
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.dependencies.cache import get_autocomplete_cache
+from app.api.dependencies.database import get_repository
+from app.db.repositories.tags import TagsRepository
+from app.db.repositories.users import UsersRepository
+from app.models.schemas.profiles import UsernamesInList
+from app.models.schemas.tags import TagsInList
+from app.services.cache import TTLCache
+
+DEFAULT_AUTOCOMPLETE_LIMIT = 10
+MAX_AUTOCOMPLETE_LIMIT = 50
+
+router = APIRouter()
+
+
+@router.get("/tags", response_model=TagsInList, name="autocomplete:tags")
+async def autocomplete_tags(
+    prefix: str = Query(..., alias="q", min_length=1),
+    limit: int = Query(DEFAULT_AUTOCOMPLETE_LIMIT, ge=1, le=MAX_AUTOCOMPLETE_LIMIT),
+    cache: TTLCache = Depends(get_autocomplete_cache),
+    tags_repo: TagsRepository = Depends(get_repository(TagsRepository)),
+) -> TagsInList:
+    cache_key = ("tags", prefix.lower(), limit)
+    tags = await cache.get_or_load(
+        cache_key,
+        partial(tags_repo.get_tags_for_autocomplete, prefix=prefix, limit=limit),
+    )
+    return TagsInList(tags=tags)
+
+
+@router.get(
+    "/usernames",
+    response_model=UsernamesInList,
+    name="autocomplete:usernames",
+)
+async def autocomplete_usernames(
+    prefix: str = Query(..., alias="q", min_length=1),
+    limit: int = Query(DEFAULT_AUTOCOMPLETE_LIMIT, ge=1, le=MAX_AUTOCOMPLETE_LIMIT),
+    cache: TTLCache = Depends(get_autocomplete_cache),
+    users_repo: UsersRepository = Depends(get_repository(UsersRepository)),
+) -> UsernamesInList:
+    cache_key = ("usernames", prefix.lower(), limit)
+    usernames = await cache.get_or_load(
+        cache_key,
+        partial(users_repo.get_usernames_for_autocomplete, prefix=prefix, limit=limit),
+    )
+    return UsernamesInList(usernames=usernames)
@@ -1,24 +1,26 @@
-from typing import Optional
+from typing import Optional, Union
 
-from fastapi import APIRouter, Body, Depends, Response
+from fastapi import APIRouter, Body, Depends, Header, Response
 from starlette import status
 
-from app.api.dependencies.articles import get_article_by_slug_from_path
+from app.api.dependencies.articles import get_article_reference_by_slug_from_path
 from app.api.dependencies.authentication import get_current_user_authorizer
 from app.api.dependencies.comments import (
     check_comment_modification_permissions,
     get_comment_by_id_from_path,
+    get_comments_etag_for_article,
 )
 from app.api.dependencies.database import get_repository
 from app.db.repositories.comments import CommentsRepository
-from app.models.domain.articles import Article
+from app.models.domain.articles import ArticleReference
 from app.models.domain.comments import Comment
-from app.models.domain.users import User
+from app.models.domain.users import UserInDB
 from app.models.schemas.comments import (
     CommentInCreate,
     CommentInResponse,
     ListOfCommentsInResponse,
 )
+from app.services.etags import etag_matches
 
 router = APIRouter()
 
@@ -28,12 +30,22 @@ router = APIRouter()
     response_model=ListOfCommentsInResponse,
     name="comments:get-comments-for-article",
 )
-async def list_comments_for_article(
-    article: Article = Depends(get_article_by_slug_from_path),
-    user: Optional[User] = Depends(get_current_user_authorizer(required=False)),
+async def list_comments_for_article(  # noqa: WPS211
+    response: Response,
+    etag: str = Depends(get_comments_etag_for_article),
+    if_none_match: Optional[str] = Header(None),
+    article: ArticleReference = Depends(get_article_reference_by_slug_from_path),
+    user: Optional[UserInDB] = Depends(get_current_user_authorizer(required=False)),
     comments_repo: CommentsRepository = Depends(get_repository(CommentsRepository)),
-) -> ListOfCommentsInResponse:
+) -> Union[ListOfCommentsInResponse, Response]:
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag},
+        )
+
     comments = await comments_repo.get_comments_for_article(article=article, user=user)
+    response.headers["ETag"] = etag
     return ListOfCommentsInResponse(comments=comments)
 
 
@@ -45,8 +57,8 @@ async def list_comments_for_article(
 )
 async def create_comment_for_article(
     comment_create: CommentInCreate = Body(..., embed=True, alias="comment"),
-    article: Article = Depends(get_article_by_slug_from_path),
-    user: User = Depends(get_current_user_authorizer()),
+    article: ArticleReference = Depends(get_article_reference_by_slug_from_path),
+    user: UserInDB = Depends(get_current_user_authorizer()),
     comments_repo: CommentsRepository = Depends(get_repository(CommentsRepository)),
 ) -> CommentInResponse:
     comment = await comments_repo.create_comment_for_article(
@@ -66,6 +78,7 @@ async def create_comment_for_article(
 )
 async def delete_comment_from_article(
     comment: Comment = Depends(get_comment_by_id_from_path),
+    user: UserInDB = Depends(get_current_user_authorizer()),
     comments_repo: CommentsRepository = Depends(get_repository(CommentsRepository)),
 ) -> None:
-    await comments_repo.delete_comment(comment=comment)
+    await comments_repo.delete_comment(comment=comment, user=user)
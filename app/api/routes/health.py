@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Response
+from starlette.requests import Request
+from starlette.status import HTTP_503_SERVICE_UNAVAILABLE
+
+from app.api.dependencies.health import get_database_health_monitor
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.db.health import DatabaseHealthMonitor
+from app.models.schemas.health import DatabaseHealth, HealthInResponse, HealthStatus
+
+router = APIRouter()
+
+
+@router.get("/live", response_model=HealthInResponse, name="health:live")
+async def check_liveness() -> HealthInResponse:
+    return HealthInResponse(status=HealthStatus.alive)
+
+
+@router.get("/ready", response_model=HealthInResponse, name="health:ready")
+async def check_readiness(
+    request: Request,
+    response: Response,
+    monitor: DatabaseHealthMonitor = Depends(get_database_health_monitor),
+    settings: AppSettings = Depends(get_app_settings),
+) -> HealthInResponse:
+    if not request.app.state.ready:
+        response.status_code = HTTP_503_SERVICE_UNAVAILABLE
+        return HealthInResponse(status=HealthStatus.starting)
+
+    health_status = _get_database_health_status(monitor, settings=settings)
+    if health_status == HealthStatus.unavailable:
+        response.status_code = HTTP_503_SERVICE_UNAVAILABLE
+        return HealthInResponse(status=health_status)
+
+    return HealthInResponse(
+        status=health_status,
+        database=DatabaseHealth(
+            latency=monitor.latency,
+            pool_wait=monitor.pool_wait,
+            pool_size=monitor.pool_size,
+            pool_idle_size=monitor.pool_idle_size,
+        ),
+    )
+
+
+def _get_database_health_status(
+    monitor: DatabaseHealthMonitor,
+    *,
+    settings: AppSettings,
+) -> HealthStatus:
+    check_age = monitor.check_age
+    if check_age is None or check_age > settings.health_check_max_age:
+        return HealthStatus.unavailable
+
+    if monitor.pool_wait > settings.health_pool_wait_threshold:
+        return HealthStatus.degraded
+
+    return HealthStatus.ready
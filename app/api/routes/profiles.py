@@ -1,26 +1,122 @@
-from fastapi import APIRouter, Depends, HTTPException
-from starlette.status import HTTP_400_BAD_REQUEST
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Path, Response
+from starlette.status import (
+    HTTP_304_NOT_MODIFIED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+)
 
 from app.api.dependencies.authentication import get_current_user_authorizer
 from app.api.dependencies.database import get_repository
-from app.api.dependencies.profiles import get_profile_by_username_from_path
+from app.api.dependencies.jobs import get_job_runner
+from app.api.dependencies.profiles import (
+    get_profile_by_username_from_path,
+    get_profile_etag_from_path,
+)
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.db import feed_jobs
+from app.db.errors import EntityDoesNotExist
+from app.db.jobs import JobRunner
 from app.db.repositories.profiles import ProfilesRepository
-from app.models.domain.profiles import Profile
-from app.models.domain.users import User
-from app.models.schemas.profiles import ProfileInResponse
+from app.models.domain.users import UserInDB
+from app.models.schemas.batches import BatchItemStatus
+from app.models.schemas.profiles import (
+    MAX_FOLLOWS_BATCH_SIZE,
+    FollowInBatch,
+    FollowInBatchResult,
+    FollowsBatchInResponse,
+    ProfileInResponse,
+)
 from app.resources import strings
+from app.services.batches import get_batch_item_status
+from app.services.etags import etag_matches
 
 router = APIRouter()
 
 
+@router.post(
+    "/follows/batch",
+    response_model=FollowsBatchInResponse,
+    name="profiles:change-follows-batch",
+)
+async def change_follows_batch(
+    follows: List[FollowInBatch] = Body(
+        ...,
+        embed=True,
+        min_items=1,
+        max_items=MAX_FOLLOWS_BATCH_SIZE,
+    ),
+    user: UserInDB = Depends(get_current_user_authorizer()),
+    profiles_repo: ProfilesRepository = Depends(get_repository(ProfilesRepository)),
+    job_runner: JobRunner = Depends(get_job_runner),
+    settings: AppSettings = Depends(get_app_settings),
+) -> FollowsBatchInResponse:
+    following_by_usernames = {follow.username: follow.following for follow in follows}
+    (
+        changed_usernames,
+        missing_usernames,
+    ) = await profiles_repo.change_followings_by_usernames(
+        requested_user=user,
+        following_by_usernames={
+            username: following
+            for username, following in following_by_usernames.items()
+            if username != user.username
+        },
+    )
+
+    if settings.feed_fan_out_enabled:
+        await feed_jobs.submit_following_changes(
+            job_runner,
+            user_id=user.id_,
+            following_by_usernames={
+                changed_username: following_by_usernames[changed_username]
+                for changed_username in changed_usernames
+            },
+            max_items=settings.feed_max_items,
+        )
+
+    return FollowsBatchInResponse(
+        follows=[
+            FollowInBatchResult(
+                username=username,
+                following=following,
+                status=BatchItemStatus.rejected
+                if username == user.username
+                else get_batch_item_status(
+                    username,
+                    changed=changed_usernames,
+                    missing=missing_usernames,
+                ),
+            )
+            for username, following in following_by_usernames.items()
+        ],
+    )
+
+
 @router.get(
     "/{username}",
     response_model=ProfileInResponse,
     name="profiles:get-profile",
 )
-async def retrieve_profile_by_username(
-    profile: Profile = Depends(get_profile_by_username_from_path),
-) -> ProfileInResponse:
+async def retrieve_profile_by_username(  # noqa: WPS211
+    response: Response,
+    username: str = Path(..., min_length=1),
+    etag: str = Depends(get_profile_etag_from_path),
+    if_none_match: Optional[str] = Header(None),
+    user: Optional[UserInDB] = Depends(get_current_user_authorizer(required=False)),
+    profiles_repo: ProfilesRepository = Depends(get_repository(ProfilesRepository)),
+) -> Union[ProfileInResponse, Response]:
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    profile = await get_profile_by_username_from_path(
+        username=username,
+        user=user,
+        profiles_repo=profiles_repo,
+    )
+    response.headers["ETag"] = etag
     return ProfileInResponse(profile=profile)
 
 
@@ -30,27 +126,49 @@ async def retrieve_profile_by_username(
     name="profiles:follow-user",
 )
 async def follow_for_user(
-    profile: Profile = Depends(get_profile_by_username_from_path),
-    user: User = Depends(get_current_user_authorizer()),
+    username: str = Path(..., min_length=1),
+    user: UserInDB = Depends(get_current_user_authorizer()),
     profiles_repo: ProfilesRepository = Depends(get_repository(ProfilesRepository)),
+    job_runner: JobRunner = Depends(get_job_runner),
+    settings: AppSettings = Depends(get_app_settings),
 ) -> ProfileInResponse:
-    if user.username == profile.username:
+    if user.username == username:
         raise HTTPException(
             status_code=HTTP_400_BAD_REQUEST,
             detail=strings.UNABLE_TO_FOLLOW_YOURSELF,
         )
 
-    if profile.following:
+    try:
+        followed = await profiles_repo.change_following_state(
+            username=username,
+            requested_user=user,
+            following=True,
+        )
+    except EntityDoesNotExist:
+        raise HTTPException(
+            status_code=HTTP_404_NOT_FOUND,
+            detail=strings.USER_DOES_NOT_EXIST_ERROR,
+        )
+
+    if not followed:
         raise HTTPException(
             status_code=HTTP_400_BAD_REQUEST,
             detail=strings.USER_IS_ALREADY_FOLLOWED,
         )
 
-    await profiles_repo.add_user_into_followers(
-        target_user=profile,
-        requested_user=user,
-    )
+    if settings.feed_fan_out_enabled:
+        await feed_jobs.submit_following_changes(
+            job_runner,
+            user_id=user.id_,
+            following_by_usernames={username: True},
+            max_items=settings.feed_max_items,
+        )
 
+    profile = await get_profile_by_username_from_path(
+        username=username,
+        user=None,
+        profiles_repo=profiles_repo,
+    )
     return ProfileInResponse(profile=profile.copy(update={"following": True}))
 
 
@@ -60,25 +178,47 @@ async def follow_for_user(
     name="profiles:unsubscribe-from-user",
 )
 async def unsubscribe_from_user(
-    profile: Profile = Depends(get_profile_by_username_from_path),
-    user: User = Depends(get_current_user_authorizer()),
+    username: str = Path(..., min_length=1),
+    user: UserInDB = Depends(get_current_user_authorizer()),
     profiles_repo: ProfilesRepository = Depends(get_repository(ProfilesRepository)),
+    job_runner: JobRunner = Depends(get_job_runner),
+    settings: AppSettings = Depends(get_app_settings),
 ) -> ProfileInResponse:
-    if user.username == profile.username:
+    if user.username == username:
         raise HTTPException(
             status_code=HTTP_400_BAD_REQUEST,
             detail=strings.UNABLE_TO_UNSUBSCRIBE_FROM_YOURSELF,
         )
 
-    if not profile.following:
+    try:
+        unsubscribed = await profiles_repo.change_following_state(
+            username=username,
+            requested_user=user,
+            following=False,
+        )
+    except EntityDoesNotExist:
+        raise HTTPException(
+            status_code=HTTP_404_NOT_FOUND,
+            detail=strings.USER_DOES_NOT_EXIST_ERROR,
+        )
+
+    if not unsubscribed:
         raise HTTPException(
             status_code=HTTP_400_BAD_REQUEST,
             detail=strings.USER_IS_NOT_FOLLOWED,
         )
 
-    await profiles_repo.remove_user_from_followers(
-        target_user=profile,
-        requested_user=user,
-    )
+    if settings.feed_fan_out_enabled:
+        await feed_jobs.submit_following_changes(
+            job_runner,
+            user_id=user.id_,
+            following_by_usernames={username: False},
+            max_items=settings.feed_max_items,
+        )
 
-    return ProfileInResponse(profile=profile.copy(update={"following": False}))
+    profile = await get_profile_by_username_from_path(
+        username=username,
+        user=None,
+        profiles_repo=profiles_repo,
+    )
+    return ProfileInResponse(profile=profile)
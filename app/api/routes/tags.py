@@ -1,15 +1,44 @@
-from fastapi import APIRouter, Depends
+from functools import partial
+from typing import Optional, Union
 
+from fastapi import APIRouter, Depends, Header, Response
+from starlette.requests import Request
+
+from app.api.dependencies.cache import get_response_cache
 from app.api.dependencies.database import get_repository
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
 from app.db.repositories.tags import TagsRepository
 from app.models.schemas.tags import TagsInList
+from app.services.cache import TTLCache
+from app.services.compression import precompress_response
 
 router = APIRouter()
 
 
 @router.get("", response_model=TagsInList, name="tags:get-all")
 async def get_all_tags(
+    request: Request,
+    authorization: Optional[str] = Header(None),
     tags_repo: TagsRepository = Depends(get_repository(TagsRepository)),
-) -> TagsInList:
+    response_cache: TTLCache = Depends(get_response_cache),
+    settings: AppSettings = Depends(get_app_settings),
+) -> Union[TagsInList, Response]:
+    if authorization:
+        return await _get_tags_for_response(tags_repo)
+
+    cache_key = ("tags:get-all",)
+    cached_response = await response_cache.get_or_load(
+        cache_key,
+        partial(
+            precompress_response,
+            partial(_get_tags_for_response, tags_repo),
+            settings=settings,
+        ),
+    )
+    return cached_response.to_response(request.headers)
+
+
+async def _get_tags_for_response(tags_repo: TagsRepository) -> TagsInList:
     tags = await tags_repo.get_all_tags()
     return TagsInList(tags=tags)
@@ -1,23 +1,26 @@
+from typing import Optional
+
 from fastapi import APIRouter, Body, Depends, HTTPException
 from starlette.status import HTTP_400_BAD_REQUEST
 
 from app.api.dependencies.authentication import get_current_user_authorizer
+from app.api.dependencies.cache import get_response_cache
 from app.api.dependencies.database import get_repository
 from app.core.config import get_app_settings
 from app.core.settings.app import AppSettings
 from app.db.repositories.users import UsersRepository
-from app.models.domain.users import User
+from app.models.domain.users import UserInDB
 from app.models.schemas.users import UserInResponse, UserInUpdate, UserWithToken
 from app.resources import strings
 from app.services import jwt
-from app.services.authentication import check_email_is_taken, check_username_is_taken
+from app.services.cache import TTLCache
 
 router = APIRouter()
 
 
 @router.get("", response_model=UserInResponse, name="users:get-current-user")
 async def retrieve_current_user(
-    user: User = Depends(get_current_user_authorizer()),
+    user: UserInDB = Depends(get_current_user_authorizer()),
     settings: AppSettings = Depends(get_app_settings),
 ) -> UserInResponse:
     token = jwt.create_access_token_for_user(
@@ -38,25 +41,30 @@ async def retrieve_current_user(
 @router.put("", response_model=UserInResponse, name="users:update-current-user")
 async def update_current_user(
     user_update: UserInUpdate = Body(..., embed=True, alias="user"),
-    current_user: User = Depends(get_current_user_authorizer()),
+    current_user: UserInDB = Depends(get_current_user_authorizer()),
     users_repo: UsersRepository = Depends(get_repository(UsersRepository)),
     settings: AppSettings = Depends(get_app_settings),
+    response_cache: TTLCache = Depends(get_response_cache),
 ) -> UserInResponse:
-    if user_update.username and user_update.username != current_user.username:
-        if await check_username_is_taken(users_repo, user_update.username):
-            raise HTTPException(
-                status_code=HTTP_400_BAD_REQUEST,
-                detail=strings.USERNAME_TAKEN,
-            )
+    username_taken, email_taken = await users_repo.check_credentials_are_taken(
+        username=_get_changed_value(user_update.username, current_user.username),
+        email=_get_changed_value(user_update.email, current_user.email),
+    )
+
+    if username_taken:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=strings.USERNAME_TAKEN,
+        )
 
-    if user_update.email and user_update.email != current_user.email:
-        if await check_email_is_taken(users_repo, user_update.email):
-            raise HTTPException(
-                status_code=HTTP_400_BAD_REQUEST,
-                detail=strings.EMAIL_TAKEN,
-            )
+    if email_taken:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=strings.EMAIL_TAKEN,
+        )
 
     user = await users_repo.update_user(user=current_user, **user_update.dict())
+    response_cache.clear()
 
     token = jwt.create_access_token_for_user(
         user,
@@ -71,3 +79,7 @@ async def update_current_user(
             token=token,
         ),
     )
+
+
+def _get_changed_value(new_value: Optional[str], old_value: str) -> Optional[str]:
+    return None if new_value == old_value else new_value
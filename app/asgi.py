@@ -0,0 +1,3 @@
+from app.main import get_application
+
+app = get_application()
@@ -0,0 +1,46 @@
+import asyncio
+from typing import Optional
+
+from asyncpg import Connection, create_pool
+from loguru import logger
+
+from app.core.config import get_app_settings
+from app.db.repositories.feeds import FeedsRepository
+
+BACKFILL_BATCH_SIZE = 500
+
+
+async def backfill_feeds(
+    conn: Connection,
+    *,
+    max_items: int,
+    batch_size: int = BACKFILL_BATCH_SIZE,
+) -> None:
+    feeds_repo = FeedsRepository(conn)
+    last_user_id: Optional[int] = 0
+    while last_user_id is not None:
+        logger.info("Backfilling feeds of users after {0}", last_user_id)
+        last_user_id = await feeds_repo.backfill_feeds(
+            after_user_id=last_user_id,
+            limit=batch_size,
+            max_items=max_items,
+        )
+
+
+async def run_backfill() -> None:
+    settings = get_app_settings()
+    async with create_pool(
+        str(settings.database_url),
+        min_size=1,
+        max_size=1,
+    ) as pool:
+        async with pool.acquire() as conn:
+            await backfill_feeds(conn, max_items=settings.feed_max_items)
+
+
+def main() -> None:
+    asyncio.run(run_backfill())
+
+
+if __name__ == "__main__":
+    main()
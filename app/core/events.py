@@ -4,7 +4,19 @@ from fastapi import FastAPI
 from loguru import logger
 
 from app.core.settings.app import AppSettings
+from app.core.warm_up import warm_up_application
 from app.db.events import close_db_connection, connect_to_db
+from app.db.feed_jobs import FEED_JOBS
+from app.db.health import DatabaseHealthMonitor
+from app.db.invalidation import InvalidationBus
+from app.db.jobs import JobRunner
+from app.db.purger import DeletedArticlesPurger
+from app.db.repositories.articles import forget_article_loads
+from app.services.cache import TTLCache
+
+RESPONSE_CACHE_TABLES = ("articles", "favorites", "tags", "users")
+AUTOCOMPLETE_CACHE_TABLES = ("tags", "users")
+ARTICLE_LOADS_TABLES = ("articles", "favorites", "users")
 
 
 def create_start_app_handler(
@@ -12,7 +24,24 @@ def create_start_app_handler(
     settings: AppSettings,
 ) -> Callable:  # type: ignore
     async def start_app() -> None:
+        app.state.ready = False
         await connect_to_db(app, settings)
+        app.state.autocomplete_cache = TTLCache(
+            maxsize=settings.autocomplete_cache_size,
+            ttl=settings.autocomplete_cache_ttl,
+        )
+        app.state.response_cache = TTLCache(
+            maxsize=settings.response_cache_size,
+            ttl=settings.response_cache_ttl,
+        )
+        start_invalidation_bus(app, settings)
+        start_deleted_articles_purger(app, settings)
+        start_job_runner(app, settings)
+        await start_database_health_monitor(app, settings)
+        if settings.warm_up_enabled:
+            await warm_up_application(app)
+
+        app.state.ready = True
 
     return start_app
 
@@ -20,6 +49,67 @@ def create_start_app_handler(
 def create_stop_app_handler(app: FastAPI) -> Callable:  # type: ignore
     @logger.catch
     async def stop_app() -> None:
+        app.state.ready = False
+        await app.state.database_health_monitor.stop()
+        await app.state.job_runner.stop()
+        await app.state.deleted_articles_purger.stop()
+        await app.state.invalidation_bus.stop()
         await close_db_connection(app)
 
     return stop_app
+
+
+def start_invalidation_bus(app: FastAPI, settings: AppSettings) -> None:
+    invalidation_bus = InvalidationBus(str(settings.database_url))
+    for response_table in RESPONSE_CACHE_TABLES:
+        invalidation_bus.subscribe(response_table, app.state.response_cache.clear)
+    for autocomplete_table in AUTOCOMPLETE_CACHE_TABLES:
+        invalidation_bus.subscribe(
+            autocomplete_table,
+            app.state.autocomplete_cache.clear,
+        )
+    for article_table in ARTICLE_LOADS_TABLES:
+        invalidation_bus.subscribe(article_table, forget_article_loads)
+
+    invalidation_bus.start()
+    app.state.invalidation_bus = invalidation_bus
+
+
+def start_deleted_articles_purger(app: FastAPI, settings: AppSettings) -> None:
+    deleted_articles_purger = DeletedArticlesPurger(
+        app.state.pool,
+        batch_size=settings.articles_purge_batch_size,
+        interval=settings.articles_purge_interval,
+        pause=settings.articles_purge_pause,
+    )
+    deleted_articles_purger.start()
+    app.state.deleted_articles_purger = deleted_articles_purger
+
+
+def start_job_runner(app: FastAPI, settings: AppSettings) -> None:
+    job_runner = JobRunner(
+        app.state.pool,
+        workers=settings.jobs_workers,
+        queue_size=settings.jobs_queue_size,
+        max_attempts=settings.jobs_max_attempts,
+        retry_delay=settings.jobs_retry_delay,
+        drain_timeout=settings.jobs_drain_timeout,
+        durable=settings.jobs_durable,
+        poll_interval=settings.jobs_poll_interval,
+        eager=settings.jobs_eager,
+    )
+    for job_name, job_handler in FEED_JOBS.items():
+        job_runner.register(job_name, job_handler)
+
+    job_runner.start()
+    app.state.job_runner = job_runner
+
+
+async def start_database_health_monitor(app: FastAPI, settings: AppSettings) -> None:
+    database_health_monitor = DatabaseHealthMonitor(
+        app.state.pool,
+        interval=settings.health_check_interval,
+    )
+    await database_health_monitor.check()
+    database_health_monitor.start()
+    app.state.database_health_monitor = database_health_monitor
@@ -1,6 +1,6 @@
 import logging
 import sys
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 from pydantic import PostgresDsn, SecretStr
@@ -21,11 +21,49 @@ class AppSettings(BaseAppSettings):
     database_url: PostgresDsn
     max_connection_count: int = 10
     min_connection_count: int = 10
+    database_connection_budget: Optional[int] = None
+
+    warm_up_enabled: bool = True
+
+    health_check_interval: float = 5
+    health_check_max_age: float = 15
+    health_pool_wait_threshold: float = 0.1
 
     secret_key: SecretStr
 
     api_prefix: str = "/api"
 
+    server_host: str = "0.0.0.0"  # noqa: S104
+    server_port: int = 8000
+    server_workers: Optional[int] = None
+    server_keep_alive: int = 75
+    server_backlog: int = 2048
+
+    feed_fan_out_enabled: bool = False
+    feed_max_items: int = 1000
+    feed_fan_out_followers_threshold: int = 10000
+
+    autocomplete_cache_size: int = 1024
+    autocomplete_cache_ttl: float = 30
+    response_cache_size: int = 512
+    response_cache_ttl: float = 5
+
+    articles_purge_batch_size: int = 1000
+    articles_purge_interval: float = 60
+    articles_purge_pause: float = 0.1
+
+    jobs_workers: int = 2
+    jobs_queue_size: int = 1000
+    jobs_max_attempts: int = 3
+    jobs_retry_delay: float = 0.5
+    jobs_drain_timeout: float = 10
+    jobs_durable: bool = False
+    jobs_poll_interval: float = 1
+    jobs_eager: bool = False
+
+    compression_minimum_size: int = 1024
+    compression_level: int = 6
+
     jwt_token_prefix: str = "Token"
 
     allowed_hosts: List[str] = ["*"]
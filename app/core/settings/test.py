@@ -16,4 +16,8 @@ class TestAppSettings(AppSettings):
     max_connection_count: int = 5
     min_connection_count: int = 5
 
+    warm_up_enabled: bool = False
+
+    jobs_eager: bool = True
+
     logging_level: int = logging.DEBUG
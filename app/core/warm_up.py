@@ -0,0 +1,53 @@
+import asyncio
+from typing import Any, Dict
+
+from fastapi import FastAPI
+from loguru import logger
+from starlette.types import Message
+
+WARM_UP_ROUTES = ("tags:get-all", "articles:list-articles")
+INVALIDATION_BUS_CONNECT_TIMEOUT = 5
+
+
+async def warm_up_application(app: FastAPI) -> None:
+    logger.info("Warming up application")
+
+    app.openapi()
+
+    # the bus flushes caches once connected, so prime them only after that
+    bus_connected = asyncio.ensure_future(app.state.invalidation_bus.connected.wait())
+    await asyncio.wait([bus_connected], timeout=INVALIDATION_BUS_CONNECT_TIMEOUT)
+    bus_connected.cancel()
+
+    for route_name in WARM_UP_ROUTES:
+        status_code = await send_local_request(app, app.url_path_for(route_name))
+        logger.info("Warm-up request to {0}: {1}", route_name, status_code)
+
+    logger.info("Application warmed up")
+
+
+async def send_local_request(app: FastAPI, path: str) -> int:
+    response_start: Dict[str, Any] = {}
+    request_messages: "asyncio.Queue[Message]" = asyncio.Queue()
+    request_messages.put_nowait({"type": "http.request", "body": b""})
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost"), (b"accept-encoding", b"gzip")],
+        "client": None,
+        "server": None,
+    }
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            response_start.update(message)
+
+    await app(scope, request_messages.get, send)
+    return response_start["status"]
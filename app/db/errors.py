@@ -1,2 +1,6 @@
 class EntityDoesNotExist(Exception):
     """Raised when entity was not found in database."""
+
+
+class EntityAlreadyExists(Exception):  # noqa: N818
+    """Raised when entity with the same unique key already exists in database."""
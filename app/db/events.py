@@ -1,8 +1,12 @@
+from functools import partial
+from typing import Iterable
+
 import asyncpg
 from fastapi import FastAPI
 from loguru import logger
 
 from app.core.settings.app import AppSettings
+from app.db.queries.queries import get_queries_sql
 
 
 async def connect_to_db(app: FastAPI, settings: AppSettings) -> None:
@@ -12,6 +16,9 @@ async def connect_to_db(app: FastAPI, settings: AppSettings) -> None:
         str(settings.database_url),
         min_size=settings.min_connection_count,
         max_size=settings.max_connection_count,
+        init=partial(prepare_statements, statements=get_queries_sql())
+        if settings.warm_up_enabled
+        else None,
     )
 
     logger.info("Connection established")
@@ -23,3 +30,17 @@ async def close_db_connection(app: FastAPI) -> None:
     await app.state.pool.close()
 
     logger.info("Connection closed")
+
+
+async def prepare_statements(
+    conn: asyncpg.Connection,
+    *,
+    statements: Iterable[str],
+) -> None:
+    for statement in statements:
+        try:
+            # public prepare() bypasses the statement cache used by queries,
+            # asyncpg is pinned to a minor version and a test checks _prepare
+            await conn._prepare(statement, use_cache=True)  # noqa: WPS437
+        except asyncpg.PostgresError as error:
+            logger.warning("Unable to prepare statement: {0}", error)
@@ -0,0 +1,50 @@
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+from asyncpg import Connection
+
+from app.db.jobs import JobHandler, JobRunner
+from app.db.repositories.feeds import FeedsRepository
+
+FAN_OUT_ARTICLE = "feeds:fan-out-article"
+ADD_AUTHOR_INTO_FEED = "feeds:add-author-into-feed"
+REMOVE_AUTHOR_FROM_FEED = "feeds:remove-author-from-feed"
+
+
+async def fan_out_article(conn: Connection, payload: Dict[str, Any]) -> None:
+    await FeedsRepository(conn).fan_out_article(**payload)
+
+
+async def add_author_into_feed(conn: Connection, payload: Dict[str, Any]) -> None:
+    await FeedsRepository(conn).add_author_into_feed(**payload)
+
+
+async def remove_author_from_feed(conn: Connection, payload: Dict[str, Any]) -> None:
+    await FeedsRepository(conn).remove_author_from_feed(**payload)
+
+
+async def submit_following_changes(
+    job_runner: JobRunner,
+    *,
+    user_id: int,
+    following_by_usernames: Dict[str, bool],
+    max_items: int,
+) -> None:
+    for author_username, following in following_by_usernames.items():
+        payload = {"user_id": user_id, "author_username": author_username}
+        if following:
+            await job_runner.submit(
+                ADD_AUTHOR_INTO_FEED,
+                {**payload, "max_items": max_items},
+            )
+        else:
+            await job_runner.submit(REMOVE_AUTHOR_FROM_FEED, payload)
+
+
+FEED_JOBS: Mapping[str, JobHandler] = MappingProxyType(
+    {
+        FAN_OUT_ARTICLE: fan_out_article,
+        ADD_AUTHOR_INTO_FEED: add_author_into_feed,
+        REMOVE_AUTHOR_FROM_FEED: remove_author_from_feed,
+    },
+)
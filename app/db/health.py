@@ -0,0 +1,73 @@
+import asyncio
+import time
+from typing import Optional
+
+import asyncpg
+from asyncpg.pool import Pool
+from loguru import logger
+
+HEALTH_CHECK_QUERY = "SELECT 1"
+
+
+class DatabaseHealthMonitor:
+    def __init__(self, pool: Pool, *, interval: float = 5) -> None:
+        self._pool = pool
+        self._interval = interval
+        self.latency: float = 0
+        self.pool_wait: float = 0
+        self.pool_size = 0
+        self.pool_idle_size = 0
+        self.checked_at: Optional[float] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def check_age(self) -> Optional[float]:
+        if self.checked_at is None:
+            return None
+
+        return time.monotonic() - self.checked_at
+
+    def start(self) -> None:
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker:
+            self._worker.cancel()
+            await asyncio.wait([self._worker])
+
+    async def check(self) -> None:
+        started_at = time.monotonic()
+        acquired_at: Optional[float] = None
+        try:
+            async with self._pool.acquire(timeout=self._interval) as conn:
+                acquired_at = time.monotonic()
+                await conn.fetchval(HEALTH_CHECK_QUERY, timeout=self._interval)
+        except (
+            OSError,
+            asyncio.TimeoutError,
+            asyncpg.PostgresError,
+            asyncpg.InterfaceError,
+        ) as error:
+            if acquired_at is None and isinstance(error, asyncio.TimeoutError):
+                # all connections are busy, so the database is slow to reach, not down
+                logger.warning("Database pool is saturated")
+                self._record_check(time.monotonic(), pool_wait=self._interval)
+            else:
+                logger.warning("Database health check failed: {0}", error)
+                self.checked_at = None
+            return
+
+        checked_at = time.monotonic()
+        self.latency = checked_at - acquired_at
+        self._record_check(checked_at, pool_wait=acquired_at - started_at)
+
+    def _record_check(self, checked_at: float, *, pool_wait: float) -> None:
+        self.checked_at = checked_at
+        self.pool_wait = pool_wait
+        self.pool_size = self._pool.get_size()
+        self.pool_idle_size = self._pool.get_idle_size()
+
+    async def _run(self) -> None:
+        while True:  # noqa: WPS457
+            await asyncio.sleep(self._interval)
+            await self.check()
@@ -0,0 +1,104 @@
+import asyncio
+from contextlib import suppress
+from typing import Callable, List, Optional, Tuple
+
+import asyncpg
+from asyncpg.connection import Connection
+from loguru import logger
+
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+InvalidationCallback = Callable[[], None]
+
+
+class InvalidationBus:  # noqa: WPS214
+    def __init__(
+        self,
+        database_url: str,
+        *,
+        application_name: str = "cache_invalidation_bus",
+        reconnect_delay: float = 1,
+        health_check_interval: float = 30,
+    ) -> None:
+        self.connected = asyncio.Event()
+        self._database_url = database_url
+        self._application_name = application_name
+        self._reconnect_delay = reconnect_delay
+        self._health_check_interval = health_check_interval
+        self._subscribers: List[Tuple[str, InvalidationCallback]] = []
+        self._listener: Optional["asyncio.Task[None]"] = None
+        self._disconnected = asyncio.Event()
+
+    def subscribe(self, key_prefix: str, callback: InvalidationCallback) -> None:
+        self._subscribers.append((key_prefix, callback))
+
+    def invalidate(self, key: str) -> None:
+        for key_prefix, callback in self._subscribers:
+            if key.startswith(key_prefix):
+                callback()
+
+    def flush(self) -> None:
+        for _, callback in self._subscribers:
+            callback()
+
+    def start(self) -> None:
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._listener
+
+    async def _listen(self) -> None:
+        while True:  # noqa: WPS457
+            try:
+                await self._listen_until_disconnected()
+            except (
+                OSError,
+                asyncio.TimeoutError,
+                asyncpg.PostgresError,
+                asyncpg.InterfaceError,
+            ) as error:
+                logger.warning("Invalidation bus connection error: {0}", error)
+
+            self.connected.clear()
+            await asyncio.sleep(self._reconnect_delay)
+
+    async def _listen_until_disconnected(self) -> None:
+        conn = await asyncpg.connect(
+            self._database_url,
+            server_settings={"application_name": self._application_name},
+        )
+        # close the connection on cancellation too, errors are logged by _listen
+        try:  # noqa: WPS501
+            await self._receive_notifications(conn)
+        finally:
+            await conn.close()
+
+    async def _receive_notifications(self, conn: Connection) -> None:
+        self._disconnected.clear()
+        conn.add_termination_listener(self._on_termination)
+        await conn.add_listener(INVALIDATION_CHANNEL, self._on_notification)
+        self.flush()
+        self.connected.set()
+        while not self._disconnected.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._disconnected.wait(),
+                    timeout=self._health_check_interval,
+                )
+            except asyncio.TimeoutError:
+                await conn.execute("SELECT 1", timeout=self._health_check_interval)
+
+    def _on_termination(self, conn: Connection) -> None:
+        self._disconnected.set()
+
+    def _on_notification(
+        self,
+        conn: Connection,
+        pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        self.invalidate(payload)
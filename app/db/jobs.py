@@ -0,0 +1,205 @@
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, DefaultDict, Dict, List, Tuple
+
+from asyncpg import Connection, InterfaceError, PostgresError
+from asyncpg.pool import Pool
+from loguru import logger
+
+from app.db.repositories.background_jobs import BackgroundJobsRepository
+from app.models.domain.jobs import BackgroundJob
+
+JobPayload = Dict[str, Any]
+JobHandler = Callable[[Connection, JobPayload], Awaitable[None]]
+
+
+class JobMetrics:
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.succeeded = 0
+        self.retried = 0
+        self.failed = 0
+        self.duration: float = 0
+
+    @property
+    def average_duration(self) -> float:
+        executions = self.succeeded + self.retried + self.failed
+        return self.duration / executions if executions else 0
+
+
+class JobRunner:  # noqa: WPS214
+    def __init__(  # noqa: WPS211
+        self,
+        pool: Pool,
+        *,
+        workers: int = 2,
+        queue_size: int = 1000,
+        max_attempts: int = 3,
+        retry_delay: float = 0.5,
+        drain_timeout: float = 10,
+        durable: bool = False,
+        poll_interval: float = 1,
+        eager: bool = False,
+    ) -> None:
+        self.pool = pool
+        self.metrics: DefaultDict[str, JobMetrics] = defaultdict(JobMetrics)
+        self._handlers: Dict[str, JobHandler] = {}
+        self._queue: "asyncio.Queue[Tuple[str, JobPayload]]" = asyncio.Queue(
+            maxsize=queue_size,
+        )
+        self._workers_count = workers
+        self._workers: List["asyncio.Task[None]"] = []
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._drain_timeout = drain_timeout
+        self._durable = durable
+        self._poll_interval = poll_interval
+        self._eager = eager
+        self._stopping = False
+
+    def register(self, name: str, job_handler: JobHandler) -> None:
+        self._handlers[name] = job_handler
+
+    def start(self) -> None:
+        if self._eager:
+            return
+
+        run_worker = self._run_durable_worker if self._durable else self._run_worker
+        self._workers = [
+            asyncio.create_task(run_worker()) for _ in range(self._workers_count)
+        ]
+
+    async def stop(self) -> None:
+        self._stopping = True
+        drained = asyncio.ensure_future(self._drain())
+        await asyncio.wait([drained], timeout=self._drain_timeout)
+        if not drained.done():
+            logger.warning(
+                "Background jobs were not drained, {0} left in queue",
+                self._queue.qsize(),
+            )
+
+        tasks = [drained, *self._workers]
+        for task in tasks:
+            task.cancel()
+        await asyncio.wait(tasks)
+
+    async def submit(self, name: str, payload: JobPayload) -> None:
+        self.metrics[name].submitted += 1
+        if self._eager:
+            await self._run_with_retries(name, payload)
+        elif self._durable:
+            async with self.pool.acquire() as conn:
+                await BackgroundJobsRepository(conn).enqueue_job(
+                    name=name,
+                    payload=payload,
+                )
+        else:
+            await self._queue.put((name, payload))
+
+    async def process_durable_job(self) -> bool:
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                job = await BackgroundJobsRepository(conn).take_job()
+                if job is None:
+                    return False
+
+                await self._run_durable_job(conn, job)
+
+        return True
+
+    async def _drain(self) -> None:
+        await self._queue.join()
+        if self._durable:
+            await asyncio.gather(*self._workers)
+
+    async def _run_worker(self) -> None:
+        while True:  # noqa: WPS457
+            name, payload = await self._queue.get()
+            await self._run_with_retries(name, payload)
+            self._queue.task_done()
+
+    async def _run_durable_worker(self) -> None:
+        while not self._stopping:
+            try:
+                processed = await self.process_durable_job()
+            except (OSError, PostgresError, InterfaceError) as error:
+                logger.warning("Background jobs polling failed: {0}", error)
+                processed = False
+
+            if not processed:
+                await asyncio.sleep(self._poll_interval)
+
+    async def _run_durable_job(self, conn: Connection, job: BackgroundJob) -> None:
+        jobs_repo = BackgroundJobsRepository(conn)
+        try:
+            async with conn.transaction():
+                await self._execute(conn, job.name, job.payload)
+        except Exception as error:
+            attempts = job.attempts + 1
+            if self._should_retry(job.name, attempts, error):
+                await jobs_repo.reschedule_job(
+                    job=job,
+                    error=repr(error),
+                    delay=self._get_retry_delay(attempts),
+                )
+            else:
+                # failed jobs stay in the table for inspection and manual retry
+                await jobs_repo.fail_job(job=job, error=repr(error))
+        else:
+            await jobs_repo.delete_job(job=job)
+
+    async def _run_with_retries(self, name: str, payload: JobPayload) -> None:
+        attempts = 1
+        while await self._run_attempt(name, payload, attempts):
+            await asyncio.sleep(self._get_retry_delay(attempts))
+            attempts += 1
+
+    async def _run_attempt(self, name: str, payload: JobPayload, attempts: int) -> bool:
+        try:
+            async with self.pool.acquire() as conn:
+                await self._execute(conn, name, payload)
+        except Exception as error:
+            return self._should_retry(name, attempts, error)
+
+        return False
+
+    async def _execute(
+        self,
+        conn: Connection,
+        name: str,
+        payload: JobPayload,
+    ) -> None:
+        metrics = self.metrics[name]
+        started_at = time.monotonic()
+        # failed and cancelled runs are counted in the duration too
+        try:  # noqa: WPS501
+            await self._handlers[name](conn, payload)
+        finally:
+            metrics.duration += time.monotonic() - started_at
+
+        metrics.succeeded += 1
+
+    def _should_retry(self, name: str, attempts: int, error: Exception) -> bool:
+        if attempts < self._max_attempts:
+            self.metrics[name].retried += 1
+            logger.warning(
+                "Background job {0} failed, attempt {1}: {2!r}",
+                name,
+                attempts,
+                error,
+            )
+            return True
+
+        self.metrics[name].failed += 1
+        logger.error(
+            "Background job {0} failed after {1} attempts: {2!r}",
+            name,
+            attempts,
+            error,
+        )
+        return False
+
+    def _get_retry_delay(self, attempts: int) -> float:
+        return self._retry_delay * 2 ** (attempts - 1)
@@ -0,0 +1,76 @@
+"""materialized feed
+
+Revision ID: 3a9c1f2b7d45
+Revises: fdf8821871d7
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "3a9c1f2b7d45"
+down_revision = "fdf8821871d7"
+branch_labels = None
+depends_on = None
+
+
+def create_feed_items_table() -> None:
+    op.create_table(
+        "feed_items",
+        sa.Column(
+            "user_id",
+            sa.Integer,
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "article_id",
+            sa.Integer,
+            sa.ForeignKey("articles.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "author_id",
+            sa.Integer,
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=False),
+    )
+    op.create_primary_key("pk_feed_items", "feed_items", ["user_id", "article_id"])
+    op.create_index(
+        "ix_feed_items_user_id_created_at",
+        "feed_items",
+        ["user_id", "created_at"],
+    )
+
+
+def create_feed_pulled_authors_table() -> None:
+    op.create_table(
+        "feed_pulled_authors",
+        sa.Column(
+            "author_id",
+            sa.Integer,
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+    )
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_followers_to_followings_following_id",
+        "followers_to_followings",
+        ["following_id"],
+    )
+    create_feed_items_table()
+    create_feed_pulled_authors_table()
+
+
+def downgrade() -> None:
+    op.drop_table("feed_pulled_authors")
+    op.drop_table("feed_items")
+    op.drop_index(
+        "ix_followers_to_followings_following_id",
+        table_name="followers_to_followings",
+    )
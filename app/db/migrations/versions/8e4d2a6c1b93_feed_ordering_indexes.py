@@ -0,0 +1,40 @@
+"""feed ordering indexes
+
+Revision ID: 8e4d2a6c1b93
+Revises: 3a9c1f2b7d45
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from alembic import op
+
+revision = "8e4d2a6c1b93"
+down_revision = "3a9c1f2b7d45"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_articles_author_id_created_at_id",
+        "articles",
+        ["author_id", "created_at", "id"],
+    )
+    op.drop_index("ix_feed_items_user_id_created_at", table_name="feed_items")
+    op.create_index(
+        "ix_feed_items_user_id_created_at_article_id",
+        "feed_items",
+        ["user_id", "created_at", "article_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_feed_items_user_id_created_at_article_id",
+        table_name="feed_items",
+    )
+    op.create_index(
+        "ix_feed_items_user_id_created_at",
+        "feed_items",
+        ["user_id", "created_at"],
+    )
+    op.drop_index("ix_articles_author_id_created_at_id", table_name="articles")
@@ -0,0 +1,45 @@
+"""background jobs
+
+Revision ID: a4c8e2f6b1d7
+Revises: f3b8d1c6a4e9
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "a4c8e2f6b1d7"
+down_revision = "f3b8d1c6a4e9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "background_jobs",
+        sa.Column("id", sa.BigInteger, primary_key=True),
+        sa.Column("name", sa.Text, nullable=False),
+        sa.Column("payload", JSONB, nullable=False),
+        sa.Column("attempts", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("last_error", sa.Text),
+        sa.Column(
+            "run_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
+    )
+    op.create_index("ix_background_jobs_run_at_id", "background_jobs", ["run_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_background_jobs_run_at_id", table_name="background_jobs")
+    op.drop_table("background_jobs")
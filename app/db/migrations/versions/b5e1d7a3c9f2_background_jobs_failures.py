@@ -0,0 +1,34 @@
+"""keep failed background jobs
+
+Revision ID: b5e1d7a3c9f2
+Revises: a4c8e2f6b1d7
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "b5e1d7a3c9f2"
+down_revision = "a4c8e2f6b1d7"
+branch_labels = None
+depends_on = None
+
+JOBS_TABLE = "background_jobs"
+RUN_AT_INDEX = "ix_background_jobs_run_at_id"
+
+
+def upgrade() -> None:
+    op.add_column(JOBS_TABLE, sa.Column("failed_at", sa.TIMESTAMP(timezone=True)))
+    op.drop_index(RUN_AT_INDEX, table_name=JOBS_TABLE)
+    op.create_index(
+        RUN_AT_INDEX,
+        JOBS_TABLE,
+        ["run_at", "id"],
+        postgresql_where=sa.text("failed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(RUN_AT_INDEX, table_name=JOBS_TABLE)
+    op.create_index(RUN_AT_INDEX, JOBS_TABLE, ["run_at", "id"])
+    op.drop_column(JOBS_TABLE, "failed_at")
@@ -0,0 +1,37 @@
+"""articles full-text search
+
+Revision ID: c5f7e9a1d2b4
+Revises: 8e4d2a6c1b93
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+
+revision = "c5f7e9a1d2b4"
+down_revision = "8e4d2a6c1b93"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE articles
+            ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+                        setweight(to_tsvector('english', title), 'A') ||
+                        setweight(to_tsvector('english', description), 'B') ||
+                        setweight(to_tsvector('english', body), 'C')
+                ) STORED;
+        """
+    )
+    op.create_index(
+        "ix_articles_search_vector",
+        "articles",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_search_vector", table_name="articles")
+    op.drop_column("articles", "search_vector")
@@ -0,0 +1,37 @@
+"""trigram indexes for autocomplete
+
+Revision ID: d2a8b6e4f1c3
+Revises: c5f7e9a1d2b4
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+
+revision = "d2a8b6e4f1c3"
+down_revision = "c5f7e9a1d2b4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_tags_tag_trgm",
+        "tags",
+        ["tag"],
+        postgresql_using="gin",
+        postgresql_ops={"tag": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_users_username_trgm",
+        "users",
+        ["username"],
+        postgresql_using="gin",
+        postgresql_ops={"username": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_username_trgm", table_name="users")
+    op.drop_index("ix_tags_tag_trgm", table_name="tags")
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
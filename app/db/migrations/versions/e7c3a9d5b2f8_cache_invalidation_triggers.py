@@ -0,0 +1,48 @@
+"""cache invalidation notifications
+
+Revision ID: e7c3a9d5b2f8
+Revises: d2a8b6e4f1c3
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+
+revision = "e7c3a9d5b2f8"
+down_revision = "d2a8b6e4f1c3"
+branch_labels = None
+depends_on = None
+
+CACHED_TABLES = ("users", "articles", "tags", "articles_to_tags", "favorites")
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+    CREATE FUNCTION notify_cache_invalidation()
+        RETURNS TRIGGER AS
+    $$
+    BEGIN
+        PERFORM pg_notify('cache_invalidation', TG_TABLE_NAME);
+        RETURN NULL;
+    END;
+    $$ language 'plpgsql';
+    """
+    )
+    for table in CACHED_TABLES:
+        op.execute(
+            """
+            CREATE TRIGGER {0}_cache_invalidation
+                AFTER INSERT OR UPDATE OR DELETE
+                ON {0}
+                FOR EACH STATEMENT
+            EXECUTE PROCEDURE notify_cache_invalidation();
+            """.format(
+                table,
+            ),
+        )
+
+
+def downgrade() -> None:
+    for table in CACHED_TABLES:
+        op.execute("DROP TRIGGER {0}_cache_invalidation ON {0}".format(table))
+    op.execute("DROP FUNCTION notify_cache_invalidation")
@@ -0,0 +1,91 @@
+"""articles soft delete
+
+Revision ID: f3b8d1c6a4e9
+Revises: e7c3a9d5b2f8
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "f3b8d1c6a4e9"
+down_revision = "e7c3a9d5b2f8"
+branch_labels = None
+depends_on = None
+
+NOT_DELETED = sa.text("deleted_at IS NULL")
+
+ARTICLES_DEPENDENTS = ("favorites", "commentaries", "feed_items")
+
+
+def upgrade() -> None:
+    op.add_column(
+        "articles",
+        sa.Column("deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+
+    op.drop_index("ix_articles_slug", table_name="articles")
+    op.create_index(
+        "ix_articles_slug",
+        "articles",
+        ["slug"],
+        unique=True,
+        postgresql_where=NOT_DELETED,
+    )
+    op.drop_index("ix_articles_author_id_created_at_id", table_name="articles")
+    op.create_index(
+        "ix_articles_author_id_created_at_id",
+        "articles",
+        ["author_id", "created_at", "id"],
+        postgresql_where=NOT_DELETED,
+    )
+    op.drop_index("ix_articles_search_vector", table_name="articles")
+    op.create_index(
+        "ix_articles_search_vector",
+        "articles",
+        ["search_vector"],
+        postgresql_using="gin",
+        postgresql_where=NOT_DELETED,
+    )
+    op.create_index(
+        "ix_articles_deleted_at",
+        "articles",
+        ["deleted_at"],
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+    )
+
+    for dependent_table in ARTICLES_DEPENDENTS:
+        op.create_index(
+            "ix_{0}_article_id".format(dependent_table),
+            dependent_table,
+            ["article_id"],
+        )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM articles WHERE deleted_at IS NOT NULL")
+
+    for dependent_table in ARTICLES_DEPENDENTS:
+        op.drop_index(
+            "ix_{0}_article_id".format(dependent_table),
+            table_name=dependent_table,
+        )
+
+    op.drop_index("ix_articles_deleted_at", table_name="articles")
+    op.drop_index("ix_articles_search_vector", table_name="articles")
+    op.create_index(
+        "ix_articles_search_vector",
+        "articles",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.drop_index("ix_articles_author_id_created_at_id", table_name="articles")
+    op.create_index(
+        "ix_articles_author_id_created_at_id",
+        "articles",
+        ["author_id", "created_at", "id"],
+    )
+    op.drop_index("ix_articles_slug", table_name="articles")
+    op.create_index("ix_articles_slug", "articles", ["slug"], unique=True)
+
+    op.drop_column("articles", "deleted_at")
@@ -0,0 +1,57 @@
+import asyncio
+from typing import Optional
+
+import asyncpg
+from asyncpg.pool import Pool
+from loguru import logger
+
+from app.db.repositories.articles import ArticlesRepository
+
+
+class DeletedArticlesPurger:
+    def __init__(
+        self,
+        pool: Pool,
+        *,
+        batch_size: int = 1000,
+        interval: float = 60,
+        pause: float = 0.1,
+    ) -> None:
+        self._pool = pool
+        self._batch_size = batch_size
+        self._interval = interval
+        self._pause = pause
+        self.purged_count = 0
+        self._worker: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker:
+            self._worker.cancel()
+            await asyncio.wait([self._worker])
+
+    async def purge(self) -> int:
+        purged_count = 0
+        while True:  # noqa: WPS457
+            async with self._pool.acquire() as conn:
+                batch_count = await ArticlesRepository(conn).purge_deleted_articles(
+                    batch_size=self._batch_size,
+                )
+
+            if not batch_count:
+                return purged_count
+
+            purged_count += batch_count
+            await asyncio.sleep(self._pause)
+
+    async def _run(self) -> None:
+        while True:  # noqa: WPS457
+            await asyncio.sleep(self._interval)
+            try:
+                purged_count = await self.purge()
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as error:
+                logger.warning("Deleted articles purge failed: {0}", error)
+            else:
+                self.purged_count += purged_count
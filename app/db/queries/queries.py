@@ -1,5 +1,12 @@
 import pathlib
+from typing import Set
 
 import aiosql
 
 queries = aiosql.from_path(pathlib.Path(__file__).parent / "sql", "asyncpg")
+
+
+def get_queries_sql() -> Set[str]:
+    return {
+        getattr(queries, query_name).sql for query_name in queries.available_queries
+    }
@@ -1,20 +1,26 @@
 """Typings for queries generated by aiosql"""
 
-from typing import Dict, Optional, Sequence
+from typing import Optional, Sequence, Set
 
 from asyncpg import Connection, Record
 
 class TagsQueriesMixin:
     async def get_all_tags(self, conn: Connection) -> Record: ...
-    async def create_new_tags(
-        self, conn: Connection, tags: Sequence[Dict[str, str]]
-    ) -> None: ...
+    async def get_tags_for_autocomplete(
+        self, conn: Connection, *, pattern: str, prefix: str, limit: int
+    ) -> Record: ...
 
 class UsersQueriesMixin:
     async def get_user_by_email(self, conn: Connection, *, email: str) -> Record: ...
+    async def get_usernames_for_autocomplete(
+        self, conn: Connection, *, pattern: str, prefix: str, limit: int
+    ) -> Record: ...
     async def get_user_by_username(
         self, conn: Connection, *, username: str
     ) -> Record: ...
+    async def check_credentials_are_taken(
+        self, conn: Connection, *, username: Optional[str], email: Optional[str]
+    ) -> Record: ...
     async def create_new_user(
         self,
         conn: Connection,
@@ -24,11 +30,11 @@ class UsersQueriesMixin:
         salt: str,
         hashed_password: str
     ) -> Record: ...
-    async def update_user_by_username(
+    async def update_user_by_id(
         self,
         conn: Connection,
         *,
-        username: str,
+        user_id: int,
         new_username: str,
         new_email: str,
         new_salt: str,
@@ -38,47 +44,65 @@ class UsersQueriesMixin:
     ) -> Record: ...
 
 class ProfilesQueriesMixin:
+    async def get_profiles_by_usernames(
+        self, conn: Connection, *, usernames: Sequence[str], follower_id: Optional[int]
+    ) -> Record: ...
+    async def get_profile_version_by_username(
+        self, conn: Connection, *, username: str, follower_id: Optional[int]
+    ) -> Record: ...
     async def is_user_following_for_another(
-        self, conn: Connection, *, follower_username: str, following_username: str
+        self, conn: Connection, *, follower_id: int, following_id: int
+    ) -> Record: ...
+    async def subscribe_user_to_others_by_usernames(
+        self, conn: Connection, *, follower_id: int, usernames: Sequence[str]
+    ) -> Record: ...
+    async def unsubscribe_user_from_others_by_usernames(
+        self, conn: Connection, *, follower_id: int, usernames: Sequence[str]
     ) -> Record: ...
-    async def subscribe_user_to_another(
-        self, conn: Connection, *, follower_username: str, following_username: str
-    ) -> None: ...
-    async def unsubscribe_user_from_another(
-        self, conn: Connection, *, follower_username: str, following_username: str
-    ) -> None: ...
 
 class CommentsQueriesMixin:
-    async def get_comments_for_article_by_slug(
-        self, conn: Connection, *, slug: str
+    async def get_comments_for_article_by_id(
+        self, conn: Connection, *, article_id: int
+    ) -> Record: ...
+    async def get_comments_version_for_article_by_id(
+        self, conn: Connection, *, article_id: int, follower_id: Optional[int]
     ) -> Record: ...
-    async def get_comment_by_id_and_slug(
-        self, conn: Connection, *, comment_id: int, article_slug: str
+    async def get_comment_by_id_and_article_id(
+        self, conn: Connection, *, comment_id: int, article_id: int
     ) -> Record: ...
     async def create_new_comment(
-        self, conn: Connection, *, body: str, article_slug: str, author_username: str
+        self, conn: Connection, *, body: str, author_id: int, article_id: int
     ) -> Record: ...
     async def delete_comment_by_id(
-        self, conn: Connection, *, comment_id: int, author_username: str
+        self, conn: Connection, *, comment_id: int, author_id: int
     ) -> None: ...
 
 class ArticlesQueriesMixin:
-    async def add_article_to_favorites(
-        self, conn: Connection, *, username: str, slug: str
-    ) -> None: ...
-    async def remove_article_from_favorites(
-        self, conn: Connection, *, username: str, slug: str
-    ) -> None: ...
-    async def is_article_in_favorites(
-        self, conn: Connection, *, username: str, slug: str
+    async def add_articles_to_favorites_by_slugs(
+        self, conn: Connection, *, user_id: int, slugs: Sequence[str]
     ) -> Record: ...
-    async def get_favorites_count_for_article(
-        self, conn: Connection, *, slug: str
+    async def remove_articles_from_favorites_by_slugs(
+        self, conn: Connection, *, user_id: int, slugs: Sequence[str]
     ) -> Record: ...
-    async def get_tags_for_article_by_slug(
-        self, conn: Connection, *, slug: str
+    async def get_favorites_for_articles_by_ids(
+        self, conn: Connection, *, articles_ids: Sequence[int], user_id: Optional[int]
+    ) -> Record: ...
+    async def get_tags_for_articles_by_ids(
+        self, conn: Connection, *, articles_ids: Sequence[int]
     ) -> Record: ...
     async def get_article_by_slug(self, conn: Connection, *, slug: str) -> Record: ...
+    async def get_articles_by_slugs(
+        self, conn: Connection, *, slugs: Sequence[str]
+    ) -> Record: ...
+    async def get_article_reference_by_slug(
+        self, conn: Connection, *, slug: str
+    ) -> Record: ...
+    async def get_article_flags_for_user(
+        self, conn: Connection, *, article_id: int, user_id: int
+    ) -> Record: ...
+    async def get_article_version_by_slug(
+        self, conn: Connection, *, slug: str, user_id: Optional[int]
+    ) -> Record: ...
     async def create_new_article(
         self,
         conn: Connection,
@@ -87,28 +111,97 @@ class ArticlesQueriesMixin:
         title: str,
         description: str,
         body: str,
-        author_username: str
+        author_id: int
     ) -> Record: ...
     async def add_tags_to_article(
-        self, conn: Connection, tags_slugs: Sequence[Dict[str, str]]
+        self, conn: Connection, *, article_id: int, tags: Sequence[str]
     ) -> None: ...
     async def update_article(
         self,
         conn: Connection,
         *,
-        slug: str,
-        author_username: str,
+        article_id: int,
+        author_id: int,
         new_slug: str,
         new_title: str,
         new_body: str,
         new_description: str
     ) -> Record: ...
     async def delete_article(
-        self, conn: Connection, *, slug: str, author_username: str
+        self, conn: Connection, *, article_id: int, author_id: int
     ) -> None: ...
+    async def purge_deleted_articles_favorites(
+        self, conn: Connection, *, batch_size: int
+    ) -> Record: ...
+    async def purge_deleted_articles_tags(
+        self, conn: Connection, *, batch_size: int
+    ) -> Record: ...
+    async def purge_deleted_articles_comments(
+        self, conn: Connection, *, batch_size: int
+    ) -> Record: ...
+    async def purge_deleted_articles_feed_items(
+        self, conn: Connection, *, batch_size: int
+    ) -> Record: ...
+    async def purge_deleted_articles(
+        self, conn: Connection, *, batch_size: int
+    ) -> Record: ...
     async def get_articles_for_feed(
-        self, conn: Connection, *, follower_username: str, limit: int, offset: int
+        self, conn: Connection, *, follower_id: int, limit: int, offset: int
+    ) -> Record: ...
+    async def search_articles(
+        self,
+        conn: Connection,
+        *,
+        query: str,
+        after_rank: Optional[float],
+        after_id: Optional[int],
+        limit: int
+    ) -> Record: ...
+
+class FeedsQueriesMixin:
+    async def get_followers_count_for_user(
+        self, conn: Connection, *, user_id: int
+    ) -> Record: ...
+    async def mark_author_as_pulled(
+        self, conn: Connection, *, author_id: int
+    ) -> None: ...
+    async def add_article_to_followers_feeds(
+        self, conn: Connection, *, article_id: int
     ) -> Record: ...
+    async def trim_followers_feeds(
+        self, conn: Connection, *, follower_ids: Sequence[int], max_items: int
+    ) -> None: ...
+    async def get_followers_after_user(
+        self, conn: Connection, *, after_user_id: int, limit: int
+    ) -> Record: ...
+    async def add_followed_authors_articles_to_feeds(
+        self, conn: Connection, *, follower_ids: Sequence[int], max_items: int
+    ) -> None: ...
+    async def add_author_articles_to_feed(
+        self, conn: Connection, *, user_id: int, author_username: str, max_items: int
+    ) -> None: ...
+    async def trim_user_feed(
+        self, conn: Connection, *, user_id: int, max_items: int
+    ) -> None: ...
+    async def remove_author_articles_from_feed(
+        self, conn: Connection, *, user_id: int, author_username: str
+    ) -> None: ...
+    async def get_articles_for_materialized_feed(
+        self, conn: Connection, *, follower_id: int, limit: int, offset: int
+    ) -> Record: ...
+
+class BackgroundJobsQueriesMixin:
+    async def enqueue_background_job(
+        self, conn: Connection, *, name: str, payload: str
+    ) -> None: ...
+    async def take_background_job(self, conn: Connection) -> Record: ...
+    async def reschedule_background_job(
+        self, conn: Connection, *, job_id: int, last_error: str, delay: float
+    ) -> None: ...
+    async def fail_background_job(
+        self, conn: Connection, *, job_id: int, last_error: str
+    ) -> None: ...
+    async def delete_background_job(self, conn: Connection, *, job_id: int) -> None: ...
 
 class Queries(
     TagsQueriesMixin,
@@ -116,6 +209,10 @@ class Queries(
     ProfilesQueriesMixin,
     CommentsQueriesMixin,
     ArticlesQueriesMixin,
+    FeedsQueriesMixin,
+    BackgroundJobsQueriesMixin,
 ): ...
 
 queries: Queries
+
+def get_queries_sql() -> Set[str]: ...
@@ -1,77 +1,176 @@
--- name: add-article-to-favorites!
-INSERT INTO favorites (user_id, article_id)
-VALUES ((SELECT id FROM users WHERE username = :username),
-        (SELECT id FROM articles WHERE slug = :slug))
-ON CONFLICT DO NOTHING;
+-- name: add-articles-to-favorites-by-slugs
+WITH requested AS (
+    SELECT s.slug, a.id
+    FROM unnest(:slugs::text[]) s(slug)
+             LEFT OUTER JOIN articles a ON a.slug = s.slug AND a.deleted_at IS NULL
+), added AS (
+    INSERT INTO favorites (user_id, article_id)
+        SELECT :user_id, id
+        FROM requested
+        WHERE id IS NOT NULL
+        ON CONFLICT DO NOTHING
+        RETURNING article_id
+)
+SELECT r.slug,
+       r.id IS NOT NULL             AS found,
+       added.article_id IS NOT NULL AS changed,
+       (SELECT count(*) FROM favorites f WHERE f.article_id = r.id) +
+       (added.article_id IS NOT NULL)::integer AS favorites_count
+FROM requested r
+         LEFT OUTER JOIN added ON added.article_id = r.id;
 
 
--- name: remove-article-from-favorites!
-DELETE
-FROM favorites
-WHERE user_id = (SELECT id FROM users WHERE username = :username)
-  AND article_id = (SELECT id FROM articles WHERE slug = :slug);
+-- name: remove-articles-from-favorites-by-slugs
+WITH requested AS (
+    SELECT s.slug, a.id
+    FROM unnest(:slugs::text[]) s(slug)
+             LEFT OUTER JOIN articles a ON a.slug = s.slug AND a.deleted_at IS NULL
+), removed AS (
+    DELETE
+        FROM favorites
+        WHERE user_id = :user_id
+            AND article_id = ANY (SELECT id FROM requested)
+        RETURNING article_id
+)
+SELECT r.slug,
+       r.id IS NOT NULL               AS found,
+       removed.article_id IS NOT NULL AS changed,
+       (SELECT count(*) FROM favorites f WHERE f.article_id = r.id) -
+       (removed.article_id IS NOT NULL)::integer AS favorites_count
+FROM requested r
+         LEFT OUTER JOIN removed ON removed.article_id = r.id;
 
 
--- name: is-article-in-favorites^
-SELECT CASE WHEN count(user_id) > 0 THEN TRUE ELSE FALSE END AS favorited
+-- name: get-favorites-for-articles-by-ids
+SELECT article_id,
+       count(*)                                    AS favorites_count,
+       coalesce(bool_or(user_id = :user_id), FALSE) AS favorited
 FROM favorites
-WHERE user_id = (SELECT id FROM users WHERE username = :username)
-  AND article_id = (SELECT id FROM articles WHERE slug = :slug);
+WHERE article_id = ANY (:articles_ids::integer[])
+GROUP BY article_id;
 
 
--- name: get-favorites-count-for-article^
-SELECT count(*) as favorites_count
-FROM favorites
-WHERE article_id = (SELECT id FROM articles WHERE slug = :slug);
+-- name: get-tags-for-articles-by-ids
+SELECT article_id, tag
+FROM articles_to_tags
+WHERE article_id = ANY (:articles_ids::integer[])
+ORDER BY tag;
 
 
--- name: get-tags-for-article-by-slug
-SELECT t.tag
-FROM tags t
-         INNER JOIN articles_to_tags att ON
-        t.tag = att.tag
-        AND
-        att.article_id = (SELECT id FROM articles WHERE slug = :slug);
+-- name: get-article-by-slug^
+SELECT a.id,
+       a.slug,
+       a.title,
+       a.description,
+       a.body,
+       a.created_at,
+       a.updated_at,
+       u.username AS author_username
+FROM articles a
+         LEFT OUTER JOIN users u ON u.id = a.author_id
+WHERE a.slug = :slug
+  AND a.deleted_at IS NULL
+LIMIT 1;
 
 
--- name: get-article-by-slug^
-SELECT id,
-       slug,
-       title,
-       description,
-       body,
-       created_at,
-       updated_at,
-       (SELECT username FROM users WHERE id = author_id) AS author_username
-FROM articles
-WHERE slug = :slug
+-- name: get-articles-by-slugs
+SELECT a.id,
+       a.slug,
+       a.title,
+       a.description,
+       a.body,
+       a.created_at,
+       a.updated_at,
+       u.username AS author_username
+FROM articles a
+         LEFT OUTER JOIN users u ON u.id = a.author_id
+WHERE a.slug = ANY (:slugs::text[])
+  AND a.deleted_at IS NULL;
+
+
+-- name: get-article-reference-by-slug^
+SELECT a.id,
+       a.slug,
+       a.author_id,
+       u.username AS author_username
+FROM articles a
+         LEFT OUTER JOIN users u ON u.id = a.author_id
+WHERE a.slug = :slug
+  AND a.deleted_at IS NULL
+LIMIT 1;
+
+
+-- name: get-article-flags-for-user^
+SELECT EXISTS(
+               SELECT 1
+               FROM favorites f
+               WHERE f.article_id = a.id
+                 AND f.user_id = :user_id
+           ) AS favorited,
+       EXISTS(
+               SELECT 1
+               FROM followers_to_followings f
+               WHERE f.follower_id = :user_id
+                 AND f.following_id = a.author_id
+           ) AS following
+FROM articles a
+WHERE a.id = :article_id;
+
+
+-- name: get-article-version-by-slug^
+SELECT a.id,
+       a.updated_at,
+       u.username AS author_username,
+       u.bio      AS author_bio,
+       u.image    AS author_image,
+       (
+           SELECT count(*)
+           FROM favorites f
+           WHERE f.article_id = a.id
+       )          AS favorites_count,
+       EXISTS(
+               SELECT 1
+               FROM favorites f
+               WHERE f.article_id = a.id
+                 AND f.user_id = :user_id
+           )          AS favorited,
+       EXISTS(
+               SELECT 1
+               FROM followers_to_followings f
+               WHERE f.follower_id = :user_id
+                 AND f.following_id = a.author_id
+           )          AS following
+FROM articles a
+         LEFT OUTER JOIN users u ON u.id = a.author_id
+WHERE a.slug = :slug
+  AND a.deleted_at IS NULL
 LIMIT 1;
 
 
 -- name: create-new-article<!
-WITH author_subquery AS (
-    SELECT id, username
-    FROM users
-    WHERE username = :author_username
-)
 INSERT
 INTO articles (slug, title, description, body, author_id)
-VALUES (:slug, :title, :description, :body, (SELECT id FROM author_subquery))
+VALUES (:slug, :title, :description, :body, :author_id)
+ON CONFLICT (slug) WHERE deleted_at IS NULL DO NOTHING
 RETURNING
     id,
     slug,
     title,
     description,
     body,
-        (SELECT username FROM author_subquery) as author_username,
     created_at,
     updated_at;
 
 
--- name: add-tags-to-article*!
-INSERT INTO articles_to_tags (article_id, tag)
-VALUES ((SELECT id FROM articles WHERE slug = :slug),
-        (SELECT tag FROM tags WHERE tag = :tag))
+-- name: add-tags-to-article!
+WITH tags_subquery AS (
+    INSERT INTO tags (tag)
+    SELECT DISTINCT unnest(:tags::text[])
+    ON CONFLICT DO NOTHING
+)
+INSERT
+INTO articles_to_tags (article_id, tag)
+SELECT DISTINCT :article_id::integer, unnest(:tags::text[])
 ON CONFLICT DO NOTHING;
 
 
@@ -81,16 +180,98 @@ SET slug        = :new_slug,
     title       = :new_title,
     body        = :new_body,
     description = :new_description
-WHERE slug = :slug
-  AND author_id = (SELECT id FROM users WHERE username = :author_username)
+WHERE id = :article_id
+  AND author_id = :author_id
+  AND deleted_at IS NULL
 RETURNING updated_at;
 
 
 -- name: delete-article!
-DELETE
-FROM articles
-WHERE slug = :slug
-  AND author_id = (SELECT id FROM users WHERE username = :author_username);
+UPDATE articles
+SET deleted_at = now()
+WHERE id = :article_id
+  AND author_id = :author_id
+  AND deleted_at IS NULL;
+
+
+-- name: purge-deleted-articles-favorites^
+WITH purged AS (
+    DELETE
+        FROM favorites
+        WHERE ctid = ANY (ARRAY(
+                SELECT d.ctid
+                FROM articles a
+                         INNER JOIN favorites d ON d.article_id = a.id
+                WHERE a.deleted_at IS NOT NULL
+                LIMIT :batch_size))
+        RETURNING 1
+)
+SELECT count(*) AS purged_count
+FROM purged;
+
+
+-- name: purge-deleted-articles-tags^
+WITH purged AS (
+    DELETE
+        FROM articles_to_tags
+        WHERE ctid = ANY (ARRAY(
+                SELECT d.ctid
+                FROM articles a
+                         INNER JOIN articles_to_tags d ON d.article_id = a.id
+                WHERE a.deleted_at IS NOT NULL
+                LIMIT :batch_size))
+        RETURNING 1
+)
+SELECT count(*) AS purged_count
+FROM purged;
+
+
+-- name: purge-deleted-articles-comments^
+WITH purged AS (
+    DELETE
+        FROM commentaries
+        WHERE ctid = ANY (ARRAY(
+                SELECT d.ctid
+                FROM articles a
+                         INNER JOIN commentaries d ON d.article_id = a.id
+                WHERE a.deleted_at IS NOT NULL
+                LIMIT :batch_size))
+        RETURNING 1
+)
+SELECT count(*) AS purged_count
+FROM purged;
+
+
+-- name: purge-deleted-articles-feed-items^
+WITH purged AS (
+    DELETE
+        FROM feed_items
+        WHERE ctid = ANY (ARRAY(
+                SELECT d.ctid
+                FROM articles a
+                         INNER JOIN feed_items d ON d.article_id = a.id
+                WHERE a.deleted_at IS NOT NULL
+                LIMIT :batch_size))
+        RETURNING 1
+)
+SELECT count(*) AS purged_count
+FROM purged;
+
+
+-- name: purge-deleted-articles^
+WITH purged AS (
+    DELETE
+        FROM articles
+        WHERE id = ANY (ARRAY(
+                SELECT id
+                FROM articles
+                WHERE deleted_at IS NOT NULL
+                ORDER BY deleted_at
+                LIMIT :batch_size))
+        RETURNING 1
+)
+SELECT count(*) AS purged_count
+FROM purged;
 
 
 -- name: get-articles-for-feed
@@ -101,16 +282,57 @@ SELECT a.id,
        a.body,
        a.created_at,
        a.updated_at,
-       (
-           SELECT username
-           FROM users
-           WHERE id = a.author_id
-       ) AS author_username
-FROM articles a
-         INNER JOIN followers_to_followings f ON
-        f.following_id = a.author_id AND
-        f.follower_id = (SELECT id FROM users WHERE username = :follower_username)
-ORDER BY a.created_at
+       u.username AS author_username
+FROM followers_to_followings f
+         INNER JOIN users u ON u.id = f.following_id
+         CROSS JOIN LATERAL (
+    SELECT id,
+           slug,
+           title,
+           description,
+           body,
+           created_at,
+           updated_at
+    FROM articles
+    WHERE author_id = f.following_id
+      AND deleted_at IS NULL
+    ORDER BY created_at DESC, id DESC
+    LIMIT :limit::integer + :offset::integer
+    ) a
+WHERE f.follower_id = :follower_id
+ORDER BY a.created_at DESC, a.id DESC
 LIMIT :limit
 OFFSET
 :offset;
+
+
+-- name: search-articles
+SELECT ranked.id,
+       ranked.slug,
+       ranked.title,
+       ranked.description,
+       ranked.body,
+       ranked.created_at,
+       ranked.updated_at,
+       ranked.author_username,
+       ranked.rank
+FROM (
+         SELECT a.id,
+                a.slug,
+                a.title,
+                a.description,
+                a.body,
+                a.created_at,
+                a.updated_at,
+                u.username                       AS author_username,
+                ts_rank(a.search_vector, q.query) AS rank
+         FROM articles a
+                  INNER JOIN users u ON u.id = a.author_id
+                  CROSS JOIN websearch_to_tsquery('english', :query) q(query)
+         WHERE a.search_vector @@ q.query
+           AND a.deleted_at IS NULL
+     ) ranked
+WHERE :after_rank::real IS NULL
+   OR (ranked.rank, ranked.id) < (:after_rank::real, :after_id::integer)
+ORDER BY ranked.rank DESC, ranked.id DESC
+LIMIT :limit;
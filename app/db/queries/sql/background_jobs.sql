@@ -0,0 +1,38 @@
+-- name: enqueue-background-job!
+INSERT INTO background_jobs (name, payload)
+VALUES (:name, :payload::jsonb);
+
+
+-- name: take-background-job^
+SELECT id,
+       name,
+       payload::text AS payload,
+       attempts
+FROM background_jobs
+WHERE run_at <= now()
+  AND failed_at IS NULL
+ORDER BY run_at, id
+LIMIT 1
+FOR UPDATE SKIP LOCKED;
+
+
+-- name: reschedule-background-job!
+UPDATE background_jobs
+SET attempts   = attempts + 1,
+    last_error = :last_error,
+    run_at     = now() + make_interval(secs => :delay)
+WHERE id = :job_id;
+
+
+-- name: fail-background-job!
+UPDATE background_jobs
+SET attempts   = attempts + 1,
+    last_error = :last_error,
+    failed_at  = now()
+WHERE id = :job_id;
+
+
+-- name: delete-background-job!
+DELETE
+FROM background_jobs
+WHERE id = :job_id;
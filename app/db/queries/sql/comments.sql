@@ -1,35 +1,47 @@
--- name: get-comments-for-article-by-slug
+-- name: get-comments-for-article-by-id
 SELECT c.id,
        c.body,
        c.created_at,
        c.updated_at,
-       (SELECT username FROM users WHERE id = c.author_id) as author_username
+       u.username AS author_username
 FROM commentaries c
-         INNER JOIN articles a ON c.article_id = a.id AND (a.slug = :slug);
+         INNER JOIN users u ON u.id = c.author_id
+WHERE c.article_id = :article_id;
 
--- name: get-comment-by-id-and-slug^
+-- name: get-comments-version-for-article-by-id^
+SELECT count(c.id)                                     AS comments_count,
+       max(c.id)                                       AS last_comment_id,
+       max(greatest(c.updated_at, u.updated_at))       AS updated_at,
+       coalesce(array_agg(DISTINCT c.author_id) FILTER (
+           WHERE EXISTS(
+                   SELECT 1
+                   FROM followers_to_followings f
+                   WHERE f.follower_id = :follower_id
+                     AND f.following_id = c.author_id
+               )), '{}')                               AS followed_authors_ids
+FROM commentaries c
+         INNER JOIN users u ON u.id = c.author_id
+WHERE c.article_id = :article_id;
+
+
+-- name: get-comment-by-id-and-article-id^
 SELECT c.id,
        c.body,
        c.created_at,
        c.updated_at,
-       (SELECT username FROM users WHERE id = c.author_id) as author_username
+       u.username AS author_username
 FROM commentaries c
-         INNER JOIN articles a ON c.article_id = a.id AND (a.slug = :article_slug)
-WHERE c.id = :comment_id;
+         INNER JOIN users u ON u.id = c.author_id
+WHERE c.id = :comment_id
+  AND c.article_id = :article_id;
 
 -- name: create-new-comment<!
-WITH users_subquery AS (
-        (SELECT id, username FROM users WHERE username = :author_username)
-)
 INSERT
 INTO commentaries (body, author_id, article_id)
-VALUES (:body,
-        (SELECT id FROM users_subquery),
-        (SELECT id FROM articles WHERE slug = :article_slug))
+VALUES (:body, :author_id, :article_id)
 RETURNING
     id,
     body,
-        (SELECT username FROM users_subquery) AS author_username,
     created_at,
     updated_at;
 
@@ -37,4 +49,4 @@ RETURNING
 DELETE
 FROM commentaries
 WHERE id = :comment_id
-  AND author_id = (SELECT id FROM users WHERE username = :author_username);
+  AND author_id = :author_id;
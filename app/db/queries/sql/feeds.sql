@@ -0,0 +1,138 @@
+-- name: get-followers-count-for-user^
+SELECT count(*) AS followers_count
+FROM followers_to_followings
+WHERE following_id = :user_id;
+
+
+-- name: mark-author-as-pulled!
+INSERT INTO feed_pulled_authors (author_id)
+VALUES (:author_id)
+ON CONFLICT DO NOTHING;
+
+
+-- name: add-article-to-followers-feeds
+INSERT INTO feed_items (user_id, article_id, author_id, created_at)
+SELECT f.follower_id, a.id, a.author_id, a.created_at
+FROM articles a
+         INNER JOIN followers_to_followings f ON f.following_id = a.author_id
+WHERE a.id = :article_id
+  AND a.deleted_at IS NULL
+ON CONFLICT DO NOTHING
+RETURNING user_id;
+
+
+-- name: trim-followers-feeds!
+DELETE
+FROM feed_items fi
+    USING unnest(:follower_ids::integer[]) AS follower(id)
+        CROSS JOIN LATERAL (
+        SELECT article_id
+        FROM feed_items
+        WHERE user_id = follower.id
+        ORDER BY created_at DESC, article_id DESC
+        OFFSET :max_items
+        ) overflow
+WHERE fi.user_id = follower.id
+  AND fi.article_id = overflow.article_id;
+
+
+-- name: get-followers-after-user
+SELECT DISTINCT follower_id
+FROM followers_to_followings
+WHERE follower_id > :after_user_id
+ORDER BY follower_id
+LIMIT :limit;
+
+
+-- name: add-followed-authors-articles-to-feeds!
+INSERT INTO feed_items (user_id, article_id, author_id, created_at)
+SELECT follower.id, a.id, a.author_id, a.created_at
+FROM unnest(:follower_ids::integer[]) AS follower(id)
+         CROSS JOIN LATERAL (
+    SELECT fa.id, fa.author_id, fa.created_at
+    FROM followers_to_followings f
+             CROSS JOIN LATERAL (
+        SELECT id, author_id, created_at
+        FROM articles
+        WHERE author_id = f.following_id
+          AND deleted_at IS NULL
+        ORDER BY created_at DESC, id DESC
+        LIMIT :max_items
+        ) fa
+    WHERE f.follower_id = follower.id
+    ORDER BY fa.created_at DESC, fa.id DESC
+    LIMIT :max_items
+    ) a
+ON CONFLICT DO NOTHING;
+
+
+-- name: add-author-articles-to-feed!
+INSERT INTO feed_items (user_id, article_id, author_id, created_at)
+SELECT f.follower_id, a.id, a.author_id, a.created_at
+FROM followers_to_followings f
+         INNER JOIN articles a ON a.author_id = f.following_id
+WHERE f.follower_id = :user_id
+  AND f.following_id = (SELECT id FROM users WHERE username = :author_username)
+  AND a.deleted_at IS NULL
+ORDER BY a.created_at DESC, a.id DESC
+LIMIT :max_items
+ON CONFLICT DO NOTHING;
+
+
+-- name: trim-user-feed!
+DELETE
+FROM feed_items
+WHERE user_id = :user_id
+  AND article_id IN (
+    SELECT article_id
+    FROM feed_items
+    WHERE user_id = :user_id
+    ORDER BY created_at DESC, article_id DESC
+    OFFSET :max_items);
+
+
+-- name: remove-author-articles-from-feed!
+DELETE
+FROM feed_items
+WHERE user_id = :user_id
+  AND author_id = (SELECT id FROM users WHERE username = :author_username);
+
+
+-- name: get-articles-for-materialized-feed
+SELECT a.id,
+       a.slug,
+       a.title,
+       a.description,
+       a.body,
+       a.created_at,
+       a.updated_at,
+       u.username AS author_username
+FROM (
+         SELECT fi.article_id, fi.created_at
+         FROM feed_items fi
+                  INNER JOIN followers_to_followings f ON
+                 f.following_id = fi.author_id AND
+                 f.follower_id = fi.user_id
+         WHERE fi.user_id = :follower_id
+         UNION
+         SELECT pa.id, pa.created_at
+         FROM feed_pulled_authors p
+                  INNER JOIN followers_to_followings f ON
+                 f.following_id = p.author_id AND
+                 f.follower_id = :follower_id
+                  CROSS JOIN LATERAL (
+             SELECT id, created_at
+             FROM articles
+             WHERE author_id = p.author_id
+               AND deleted_at IS NULL
+             ORDER BY created_at DESC, id DESC
+             LIMIT :limit::integer + :offset::integer
+             ) pa
+     ) feed
+         INNER JOIN articles a ON a.id = feed.article_id
+         INNER JOIN users u ON u.id = a.author_id
+WHERE a.deleted_at IS NULL
+ORDER BY feed.created_at DESC, feed.article_id DESC
+LIMIT :limit
+OFFSET
+:offset;
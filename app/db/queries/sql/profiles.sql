@@ -1,38 +1,73 @@
--- name: is-user-following-for-another^
-SELECT CASE
-           WHEN following_id IS NULL THEN
-               FALSE
-           ELSE
-               TRUE
-           END AS is_following
+-- name: get-profiles-by-usernames
+SELECT u.username,
+       u.bio,
+       u.image,
+       EXISTS(
+               SELECT 1
+               FROM followers_to_followings f
+               WHERE f.follower_id = :follower_id
+                 AND f.following_id = u.id
+           ) AS following
 FROM users u
-         LEFT OUTER JOIN followers_to_followings f ON u.id = f.follower_id
-    AND f.following_id = (
-        SELECT id
-        FROM users
-        WHERE username = :following_username)
-WHERE u.username = :follower_username
+WHERE u.username = ANY (:usernames::text[]);
+
+
+-- name: get-profile-version-by-username^
+SELECT u.updated_at,
+       EXISTS(
+               SELECT 1
+               FROM followers_to_followings f
+               WHERE f.follower_id = :follower_id
+                 AND f.following_id = u.id
+           ) AS following
+FROM users u
+WHERE u.username = :username
 LIMIT 1;
 
 
--- name: subscribe-user-to-another!
-INSERT INTO followers_to_followings (follower_id, following_id)
-VALUES ((
-            SELECT id
-            FROM users
-            WHERE username = :follower_username), (
-            SELECT id
-            FROM users
-            WHERE username = :following_username));
-
--- name: unsubscribe-user-from-another!
-DELETE
-FROM followers_to_followings
-WHERE follower_id = (
-    SELECT id
-    FROM users
-    WHERE username = :follower_username)
-  AND following_id = (
-    SELECT id
-    FROM users
-    WHERE username = :following_username);
+-- name: is-user-following-for-another^
+SELECT EXISTS(
+               SELECT 1
+               FROM followers_to_followings
+               WHERE follower_id = :follower_id
+                 AND following_id = :following_id
+           ) AS is_following;
+
+
+-- name: subscribe-user-to-others-by-usernames
+WITH requested AS (
+    SELECT s.username, u.id
+    FROM unnest(:usernames::text[]) s(username)
+             LEFT OUTER JOIN users u ON u.username = s.username
+), subscribed AS (
+    INSERT INTO followers_to_followings (follower_id, following_id)
+        SELECT :follower_id, id
+        FROM requested
+        WHERE id IS NOT NULL
+        ON CONFLICT DO NOTHING
+        RETURNING following_id
+)
+SELECT r.username,
+       r.id IS NOT NULL                    AS found,
+       subscribed.following_id IS NOT NULL AS changed
+FROM requested r
+         LEFT OUTER JOIN subscribed ON subscribed.following_id = r.id;
+
+
+-- name: unsubscribe-user-from-others-by-usernames
+WITH requested AS (
+    SELECT s.username, u.id
+    FROM unnest(:usernames::text[]) s(username)
+             LEFT OUTER JOIN users u ON u.username = s.username
+), unsubscribed AS (
+    DELETE
+        FROM followers_to_followings
+        WHERE follower_id = :follower_id
+            AND following_id = ANY (SELECT id FROM requested)
+        RETURNING following_id
+)
+SELECT r.username,
+       r.id IS NOT NULL                      AS found,
+       unsubscribed.following_id IS NOT NULL AS changed
+FROM requested r
+         LEFT OUTER JOIN unsubscribed ON unsubscribed.following_id = r.id;
@@ -3,7 +3,12 @@ SELECT tag
 FROM tags;
 
 
--- name: create-new-tags*!
-INSERT INTO tags (tag)
-VALUES (:tag)
-ON CONFLICT DO NOTHING;
+-- name: get-tags-for-autocomplete
+SELECT tag
+FROM tags
+WHERE tag ILIKE :pattern
+   OR tag % :prefix
+ORDER BY tag ILIKE :pattern DESC,
+         similarity(tag, :prefix) DESC,
+         tag
+LIMIT :limit;
@@ -28,14 +28,20 @@ WHERE username = :username
 LIMIT 1;
 
 
+-- name: check-credentials-are-taken^
+SELECT EXISTS(SELECT 1 FROM users WHERE username = :username) AS username_taken,
+       EXISTS(SELECT 1 FROM users WHERE email = :email)       AS email_taken;
+
+
 -- name: create-new-user<!
 INSERT INTO users (username, email, salt, hashed_password)
 VALUES (:username, :email, :salt, :hashed_password)
+ON CONFLICT DO NOTHING
 RETURNING
     id, created_at, updated_at;
 
 
--- name: update-user-by-username<!
+-- name: update-user-by-id<!
 UPDATE
     users
 SET username        = :new_username,
@@ -44,6 +50,17 @@ SET username        = :new_username,
     hashed_password = :new_password,
     bio             = :new_bio,
     image           = :new_image
-WHERE username = :username
+WHERE id = :user_id
 RETURNING
     updated_at;
+
+
+-- name: get-usernames-for-autocomplete
+SELECT username
+FROM users
+WHERE username ILIKE :pattern
+   OR username % :prefix
+ORDER BY username ILIKE :pattern DESC,
+         similarity(username, :prefix) DESC,
+         username
+LIMIT :limit;
@@ -1,35 +1,46 @@
-from typing import List, Optional, Sequence, Union
+from collections import defaultdict
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from asyncpg import Connection, Record
 from pypika import Query
 
-from app.db.errors import EntityDoesNotExist
+from app.db.errors import EntityAlreadyExists, EntityDoesNotExist
 from app.db.queries.queries import queries
 from app.db.queries.tables import (
     Parameter,
     articles,
     articles_to_tags,
     favorites,
-    tags as tags_table,
     users,
 )
 from app.db.repositories.base import BaseRepository
 from app.db.repositories.profiles import ProfilesRepository
-from app.db.repositories.tags import TagsRepository
-from app.models.domain.articles import Article
-from app.models.domain.users import User
+from app.models.domain.articles import Article, ArticlePreview, ArticleReference
+from app.models.domain.profiles import Profile
+from app.models.domain.users import UserInDB
+from app.services.articles import SearchCursor
+from app.services.cache import SingleFlight
 
 AUTHOR_USERNAME_ALIAS = "author_username"
 SLUG_ALIAS = "slug"
 
 CAMEL_OR_SNAKE_CASE_TO_WORDS = r"^[a-z\d_\-]+|[A-Z\d_\-][^A-Z\d_\-]*"
 
+# writes below forget the in-flight load of the article they change,
+# so a read made after a write never joins a load started before it;
+# writes of other workers forget all loads through the invalidation bus
+_article_loads = SingleFlight()
+
+
+def forget_article_loads() -> None:
+    _article_loads.clear()
+
 
 class ArticlesRepository(BaseRepository):  # noqa: WPS214
     def __init__(self, conn: Connection) -> None:
         super().__init__(conn)
         self._profiles_repo = ProfilesRepository(conn)
-        self._tags_repo = TagsRepository(conn)
 
     async def create_article(  # noqa: WPS211
         self,
@@ -38,7 +49,7 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
         title: str,
         description: str,
         body: str,
-        author: User,
+        author: UserInDB,
         tags: Optional[Sequence[str]] = None,
     ) -> Article:
         async with self.connection.transaction():
@@ -48,24 +59,42 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
                 title=title,
                 description=description,
                 body=body,
-                author_username=author.username,
+                author_id=author.id_,
             )
+            if not article_row:
+                raise EntityAlreadyExists(
+                    "article with slug {0} already exists".format(slug),
+                )
 
             if tags:
-                await self._tags_repo.create_tags_that_dont_exist(tags=tags)
-                await self._link_article_with_tags(slug=slug, tags=tags)
+                await self._link_article_with_tags(
+                    article_id=article_row["id"],
+                    tags=tags,
+                )
 
-        return await self._get_article_from_db_record(
-            article_row=article_row,
-            slug=slug,
-            author_username=article_row[AUTHOR_USERNAME_ALIAS],
-            requested_user=author,
+        return Article(
+            id_=article_row["id"],
+            slug=article_row[SLUG_ALIAS],
+            title=article_row["title"],
+            description=article_row["description"],
+            body=article_row["body"],
+            author=Profile(
+                username=author.username,
+                bio=author.bio,
+                image=author.image,
+            ),
+            tags=sorted(set(tags or ())),
+            favorites_count=0,
+            favorited=False,
+            created_at=article_row["created_at"],
+            updated_at=article_row["updated_at"],
         )
 
     async def update_article(  # noqa: WPS211
         self,
         *,
         article: Article,
+        author_id: int,
         slug: Optional[str] = None,
         title: Optional[str] = None,
         body: Optional[str] = None,
@@ -80,24 +109,32 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
         async with self.connection.transaction():
             updated_article.updated_at = await queries.update_article(
                 self.connection,
-                slug=article.slug,
-                author_username=article.author.username,
+                article_id=article.id_,
+                author_id=author_id,
                 new_slug=updated_article.slug,
                 new_title=updated_article.title,
                 new_body=updated_article.body,
                 new_description=updated_article.description,
             )
 
+        _article_loads.forget(article.slug)
         return updated_article
 
-    async def delete_article(self, *, article: Article) -> None:
+    async def delete_article(
+        self,
+        *,
+        article: ArticleReference,
+        author_id: int,
+    ) -> None:
         async with self.connection.transaction():
             await queries.delete_article(
                 self.connection,
-                slug=article.slug,
-                author_username=article.author.username,
+                article_id=article.id_,
+                author_id=author_id,
             )
 
+        _article_loads.forget(article.slug)
+
     async def filter_articles(  # noqa: WPS211
         self,
         *,
@@ -106,20 +143,22 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
         favorited: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
-        requested_user: Optional[User] = None,
-    ) -> List[Article]:
+        requested_user: Optional[UserInDB] = None,
+        include_body: bool = True,
+    ) -> Sequence[ArticlePreview]:
         query_params: List[Union[str, int]] = []
         query_params_count = 0
 
         # fmt: off
         query = Query.from_(
             articles,
+        ).where(
+            articles.field("deleted_at").isnull(),
         ).select(
             articles.id,
             articles.slug,
             articles.title,
             articles.description,
-            articles.body,
             articles.created_at,
             articles.updated_at,
             Query.from_(
@@ -134,6 +173,9 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
         )
         # fmt: on
 
+        if include_body:
+            query = query.select(articles.body)
+
         if tag:
             query_params.append(tag)
             query_params_count += 1
@@ -143,13 +185,7 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
                 articles_to_tags,
             ).on(
                 (articles.id == articles_to_tags.article_id) & (
-                    articles_to_tags.tag == Query.from_(
-                        tags_table,
-                    ).where(
-                        tags_table.tag == Parameter(query_params_count),
-                    ).select(
-                        tags_table.tag,
-                    )
+                    articles_to_tags.tag == Parameter(query_params_count)
                 ),
             )
             # fmt: on
@@ -163,13 +199,7 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
                 users,
             ).on(
                 (articles.author_id == users.id) & (
-                    users.id == Query.from_(
-                        users,
-                    ).where(
-                        users.username == Parameter(query_params_count),
-                    ).select(
-                        users.id,
-                    )
+                    users.username == Parameter(query_params_count)
                 ),
             )
             # fmt: on
@@ -201,130 +231,367 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
 
         articles_rows = await self.connection.fetch(query.get_sql(), *query_params)
 
-        return [
-            await self._get_article_from_db_record(
-                article_row=article_row,
-                slug=article_row[SLUG_ALIAS],
-                author_username=article_row[AUTHOR_USERNAME_ALIAS],
+        if include_body:
+            return await self._get_articles_from_db_records(
+                articles_rows=articles_rows,
                 requested_user=requested_user,
             )
-            for article_row in articles_rows
-        ]
+
+        return await self._get_article_previews_from_db_records(
+            articles_rows=articles_rows,
+            requested_user=requested_user,
+        )
 
     async def get_articles_for_user_feed(
         self,
         *,
-        user: User,
+        user: UserInDB,
         limit: int = 20,
         offset: int = 0,
+        materialized: bool = False,
     ) -> List[Article]:
-        articles_rows = await queries.get_articles_for_feed(
+        get_articles_for_feed = (
+            queries.get_articles_for_materialized_feed
+            if materialized
+            else queries.get_articles_for_feed
+        )
+        articles_rows = await get_articles_for_feed(
             self.connection,
-            follower_username=user.username,
+            follower_id=user.id_,
             limit=limit,
             offset=offset,
         )
-        return [
-            await self._get_article_from_db_record(
-                article_row=article_row,
-                slug=article_row[SLUG_ALIAS],
-                author_username=article_row[AUTHOR_USERNAME_ALIAS],
-                requested_user=user,
-            )
-            for article_row in articles_rows
-        ]
+        return await self._get_articles_from_db_records(
+            articles_rows=articles_rows,
+            requested_user=user,
+        )
+
+    async def search_articles(
+        self,
+        *,
+        query: str,
+        limit: int = 20,
+        after: Optional[SearchCursor] = None,
+        requested_user: Optional[UserInDB] = None,
+    ) -> Tuple[List[Article], Optional[SearchCursor]]:
+        after_rank, after_id = after or (None, None)
+        articles_rows = await queries.search_articles(
+            self.connection,
+            query=query,
+            after_rank=after_rank,
+            after_id=after_id,
+            limit=limit,
+        )
+        found_articles = await self._get_articles_from_db_records(
+            articles_rows=articles_rows,
+            requested_user=requested_user,
+        )
+
+        if len(articles_rows) < limit:
+            return found_articles, None
+
+        last_row = articles_rows[-1]
+        return found_articles, (last_row["rank"], last_row["id"])
 
     async def get_article_by_slug(
         self,
         *,
         slug: str,
-        requested_user: Optional[User] = None,
+        requested_user: Optional[UserInDB] = None,
     ) -> Article:
-        article_row = await queries.get_article_by_slug(self.connection, slug=slug)
-        if article_row:
-            return await self._get_article_from_db_record(
-                article_row=article_row,
-                slug=article_row[SLUG_ALIAS],
-                author_username=article_row[AUTHOR_USERNAME_ALIAS],
+        article = await _article_loads.run(
+            slug,
+            partial(self._load_article_by_slug, slug=slug),
+        )
+        if not requested_user:
+            return article
+
+        flags_row = await queries.get_article_flags_for_user(
+            self.connection,
+            article_id=article.id_,
+            user_id=requested_user.id_,
+        )
+        return article.copy(
+            update={
+                "favorited": flags_row["favorited"],
+                "author": article.author.copy(
+                    update={"following": flags_row["following"]},
+                ),
+            },
+        )
+
+    async def get_articles_by_slugs(
+        self,
+        *,
+        slugs: Sequence[str],
+        requested_user: Optional[UserInDB] = None,
+    ) -> Tuple[List[Article], List[str]]:
+        articles_rows = await queries.get_articles_by_slugs(
+            self.connection,
+            slugs=list(slugs),
+        )
+        articles_by_slugs = {
+            article.slug: article
+            for article in await self._get_articles_from_db_records(
+                articles_rows=articles_rows,
                 requested_user=requested_user,
             )
+        }
+
+        unique_slugs = list(dict.fromkeys(slugs))
+        found_articles = [
+            articles_by_slugs[slug]
+            for slug in unique_slugs
+            if slug in articles_by_slugs
+        ]
+        missing_slugs = [slug for slug in unique_slugs if slug not in articles_by_slugs]
+        return found_articles, missing_slugs
+
+    async def get_article_reference_by_slug(self, *, slug: str) -> ArticleReference:
+        reference_row = await queries.get_article_reference_by_slug(
+            self.connection,
+            slug=slug,
+        )
+        if reference_row:
+            return ArticleReference(**reference_row)
 
         raise EntityDoesNotExist("article with slug {0} does not exist".format(slug))
 
-    async def get_tags_for_article_by_slug(self, *, slug: str) -> List[str]:
-        tag_rows = await queries.get_tags_for_article_by_slug(
+    async def get_article_version_by_slug(
+        self,
+        *,
+        slug: str,
+        requested_user: Optional[UserInDB] = None,
+    ) -> Tuple[Any, ...]:
+        version_row = await queries.get_article_version_by_slug(
             self.connection,
             slug=slug,
+            user_id=requested_user.id_ if requested_user else None,
         )
-        return [row["tag"] for row in tag_rows]
+        if version_row:
+            return tuple(version_row)
 
-    async def get_favorites_count_for_article_by_slug(self, *, slug: str) -> int:
-        return (
-            await queries.get_favorites_count_for_article(self.connection, slug=slug)
-        )["favorites_count"]
+        raise EntityDoesNotExist("article with slug {0} does not exist".format(slug))
 
-    async def is_article_favorited_by_user(self, *, slug: str, user: User) -> bool:
-        return (
-            await queries.is_article_in_favorites(
-                self.connection,
-                username=user.username,
-                slug=slug,
+    async def change_article_favorite_state(
+        self,
+        *,
+        slug: str,
+        user: UserInDB,
+        favorited: bool,
+    ) -> Tuple[bool, int]:
+        result_rows = await self._change_favorites(
+            user=user,
+            favorited_by_slugs={slug: favorited},
+            favorited=favorited,
+        )
+        _article_loads.forget(slug)
+        result_row = result_rows[0]
+        if result_row["found"]:
+            return result_row["changed"], result_row["favorites_count"]
+
+        raise EntityDoesNotExist("article with slug {0} does not exist".format(slug))
+
+    async def change_favorites_by_slugs(
+        self,
+        *,
+        user: UserInDB,
+        favorited_by_slugs: Dict[str, bool],
+    ) -> Tuple[Set[str], Set[str]]:
+        result_rows: List[Record] = []
+        async with self.connection.transaction():
+            for favorited in (True, False):
+                result_rows.extend(
+                    await self._change_favorites(
+                        user=user,
+                        favorited_by_slugs=favorited_by_slugs,
+                        favorited=favorited,
+                    ),
+                )
+
+        changed_slugs = {
+            result_row[SLUG_ALIAS]
+            for result_row in result_rows
+            if result_row["changed"]
+        }
+        missing_slugs = {
+            result_row[SLUG_ALIAS]
+            for result_row in result_rows
+            if not result_row["found"]
+        }
+        for changed_slug in changed_slugs:
+            _article_loads.forget(changed_slug)
+
+        return changed_slugs, missing_slugs
+
+    async def purge_deleted_articles(self, *, batch_size: int) -> int:
+        # rows referencing the deleted articles go first, the articles last
+        purge_queries = (
+            queries.purge_deleted_articles_favorites,
+            queries.purge_deleted_articles_tags,
+            queries.purge_deleted_articles_comments,
+            queries.purge_deleted_articles_feed_items,
+            queries.purge_deleted_articles,
+        )
+        for purge_deleted in purge_queries:
+            purged_row = await purge_deleted(self.connection, batch_size=batch_size)
+            if purged_row["purged_count"]:
+                return purged_row["purged_count"]
+
+        return 0
+
+    async def _get_articles_from_db_records(
+        self,
+        *,
+        articles_rows: Sequence[Record],
+        requested_user: Optional[UserInDB],
+    ) -> List[Article]:
+        previews_fields = await self._get_previews_fields_from_db_records(
+            articles_rows=articles_rows,
+            requested_user=requested_user,
+        )
+        return [
+            Article(**preview_fields, body=article_row["body"])
+            for preview_fields, article_row in zip(previews_fields, articles_rows)
+        ]
+
+    async def _get_article_previews_from_db_records(
+        self,
+        *,
+        articles_rows: Sequence[Record],
+        requested_user: Optional[UserInDB],
+    ) -> List[ArticlePreview]:
+        previews_fields = await self._get_previews_fields_from_db_records(
+            articles_rows=articles_rows,
+            requested_user=requested_user,
+        )
+        return [ArticlePreview(**preview_fields) for preview_fields in previews_fields]
+
+    async def _get_previews_fields_from_db_records(  # noqa: WPS210
+        self,
+        *,
+        articles_rows: Sequence[Record],
+        requested_user: Optional[UserInDB],
+    ) -> List[Dict[str, Any]]:
+        if not articles_rows:
+            return []
+
+        articles_ids = [article_row["id"] for article_row in articles_rows]
+
+        tags = await self._get_tags_by_articles_ids(articles_ids=articles_ids)
+        favorites_by_articles_ids = await self._get_favorites_by_articles_ids(
+            articles_ids=articles_ids,
+            requested_user=requested_user,
+        )
+
+        authors = await self._profiles_repo.get_profiles_by_usernames(
+            usernames={
+                article_row[AUTHOR_USERNAME_ALIAS] for article_row in articles_rows
+            },
+            requested_user=requested_user,
+        )
+
+        previews_fields = []
+        for article_row in articles_rows:
+            favorites_count, favorited = favorites_by_articles_ids.get(
+                article_row["id"],
+                (0, False),
             )
-        )["favorited"]
+            previews_fields.append(
+                {
+                    "id_": article_row["id"],
+                    "slug": article_row[SLUG_ALIAS],
+                    "title": article_row["title"],
+                    "description": article_row["description"],
+                    "author": authors[article_row[AUTHOR_USERNAME_ALIAS]],
+                    "tags": tags[article_row["id"]],
+                    "favorites_count": favorites_count,
+                    "favorited": favorited,
+                    "created_at": article_row["created_at"],
+                    "updated_at": article_row["updated_at"],
+                },
+            )
+
+        return previews_fields
 
-    async def add_article_into_favorites(self, *, article: Article, user: User) -> None:
-        await queries.add_article_to_favorites(
+    async def _get_tags_by_articles_ids(
+        self,
+        *,
+        articles_ids: List[int],
+    ) -> Dict[int, List[str]]:
+        tags_rows = await queries.get_tags_for_articles_by_ids(
             self.connection,
-            username=user.username,
-            slug=article.slug,
+            articles_ids=articles_ids,
         )
+        tags: Dict[int, List[str]] = defaultdict(list)
+        for tag_row in tags_rows:
+            tags[tag_row["article_id"]].append(tag_row["tag"])
+        return tags
 
-    async def remove_article_from_favorites(
+    async def _get_favorites_by_articles_ids(
         self,
         *,
-        article: Article,
-        user: User,
-    ) -> None:
-        await queries.remove_article_from_favorites(
+        articles_ids: List[int],
+        requested_user: Optional[UserInDB],
+    ) -> Dict[int, Tuple[int, bool]]:
+        favorites_rows = await queries.get_favorites_for_articles_by_ids(
             self.connection,
-            username=user.username,
-            slug=article.slug,
+            articles_ids=articles_ids,
+            user_id=requested_user.id_ if requested_user else None,
         )
+        return {
+            favorites_row["article_id"]: (
+                favorites_row["favorites_count"],
+                favorites_row["favorited"],
+            )
+            for favorites_row in favorites_rows
+        }
 
-    async def _get_article_from_db_record(
+    async def _link_article_with_tags(
         self,
         *,
-        article_row: Record,
-        slug: str,
-        author_username: str,
-        requested_user: Optional[User],
-    ) -> Article:
-        return Article(
-            id_=article_row["id"],
-            slug=slug,
-            title=article_row["title"],
-            description=article_row["description"],
-            body=article_row["body"],
-            author=await self._profiles_repo.get_profile_by_username(
-                username=author_username,
-                requested_user=requested_user,
-            ),
-            tags=await self.get_tags_for_article_by_slug(slug=slug),
-            favorites_count=await self.get_favorites_count_for_article_by_slug(
-                slug=slug,
-            ),
-            favorited=await self.is_article_favorited_by_user(
-                slug=slug,
-                user=requested_user,
-            )
-            if requested_user
-            else False,
-            created_at=article_row["created_at"],
-            updated_at=article_row["updated_at"],
+        article_id: int,
+        tags: Sequence[str],
+    ) -> None:
+        await queries.add_tags_to_article(
+            self.connection,
+            article_id=article_id,
+            tags=list(tags),
         )
 
-    async def _link_article_with_tags(self, *, slug: str, tags: Sequence[str]) -> None:
-        await queries.add_tags_to_article(
+    async def _change_favorites(
+        self,
+        *,
+        user: UserInDB,
+        favorited_by_slugs: Dict[str, bool],
+        favorited: bool,
+    ) -> List[Record]:
+        slugs = [
+            slug
+            for slug, should_be_favorited in favorited_by_slugs.items()
+            if should_be_favorited is favorited
+        ]
+        if not slugs:
+            return []
+
+        change_favorites = (
+            queries.add_articles_to_favorites_by_slugs
+            if favorited
+            else queries.remove_articles_from_favorites_by_slugs
+        )
+        return await change_favorites(
             self.connection,
-            [{SLUG_ALIAS: slug, "tag": tag} for tag in tags],
+            user_id=user.id_,
+            slugs=slugs,
         )
+
+    async def _load_article_by_slug(self, *, slug: str) -> Article:
+        article_row = await queries.get_article_by_slug(self.connection, slug=slug)
+        if article_row:
+            loaded_articles = await self._get_articles_from_db_records(
+                articles_rows=[article_row],
+                requested_user=None,
+            )
+            return loaded_articles[0]
+
+        raise EntityDoesNotExist("article with slug {0} does not exist".format(slug))
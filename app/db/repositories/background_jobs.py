@@ -0,0 +1,51 @@
+import json
+from typing import Any, Dict, Optional
+
+from app.db.queries.queries import queries
+from app.db.repositories.base import BaseRepository
+from app.models.domain.jobs import BackgroundJob
+
+
+class BackgroundJobsRepository(BaseRepository):
+    async def enqueue_job(self, *, name: str, payload: Dict[str, Any]) -> None:
+        await queries.enqueue_background_job(
+            self.connection,
+            name=name,
+            payload=json.dumps(payload),
+        )
+
+    async def take_job(self) -> Optional[BackgroundJob]:
+        job_row = await queries.take_background_job(self.connection)
+        if job_row is None:
+            return None
+
+        return BackgroundJob(
+            id_=job_row["id"],
+            name=job_row["name"],
+            payload=json.loads(job_row["payload"]),
+            attempts=job_row["attempts"],
+        )
+
+    async def reschedule_job(
+        self,
+        *,
+        job: BackgroundJob,
+        error: str,
+        delay: float,
+    ) -> None:
+        await queries.reschedule_background_job(
+            self.connection,
+            job_id=job.id_,
+            last_error=error,
+            delay=delay,
+        )
+
+    async def fail_job(self, *, job: BackgroundJob, error: str) -> None:
+        await queries.fail_background_job(
+            self.connection,
+            job_id=job.id_,
+            last_error=error,
+        )
+
+    async def delete_job(self, *, job: BackgroundJob) -> None:
+        await queries.delete_background_job(self.connection, job_id=job.id_)
@@ -1,5 +1,13 @@
 from asyncpg.connection import Connection
 
+_LIKE_SPECIAL_CHARACTERS = ("\\", "%", "_")
+
+
+def get_prefix_pattern(prefix: str) -> str:
+    for special_character in _LIKE_SPECIAL_CHARACTERS:
+        prefix = prefix.replace(special_character, r"\{0}".format(special_character))
+    return "{0}%".format(prefix)
+
 
 class BaseRepository:
     def __init__(self, conn: Connection) -> None:
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple, Union
 
 from asyncpg import Connection, Record
 
@@ -6,9 +6,12 @@ from app.db.errors import EntityDoesNotExist
 from app.db.queries.queries import queries
 from app.db.repositories.base import BaseRepository
 from app.db.repositories.profiles import ProfilesRepository
-from app.models.domain.articles import Article
+from app.models.domain.articles import Article, ArticleReference
 from app.models.domain.comments import Comment
-from app.models.domain.users import User
+from app.models.domain.profiles import Profile
+from app.models.domain.users import UserInDB
+
+ArticleLike = Union[Article, ArticleReference]
 
 
 class CommentsRepository(BaseRepository):
@@ -20,13 +23,13 @@ class CommentsRepository(BaseRepository):
         self,
         *,
         comment_id: int,
-        article: Article,
-        user: Optional[User] = None,
+        article: ArticleLike,
+        user: Optional[UserInDB] = None,
     ) -> Comment:
-        comment_row = await queries.get_comment_by_id_and_slug(
+        comment_row = await queries.get_comment_by_id_and_article_id(
             self.connection,
             comment_id=comment_id,
-            article_slug=article.slug,
+            article_id=article.id_,
         )
         if comment_row:
             return await self._get_comment_from_db_record(
@@ -42,12 +45,12 @@ class CommentsRepository(BaseRepository):
     async def get_comments_for_article(
         self,
         *,
-        article: Article,
-        user: Optional[User] = None,
+        article: ArticleLike,
+        user: Optional[UserInDB] = None,
     ) -> List[Comment]:
-        comments_rows = await queries.get_comments_for_article_by_slug(
+        comments_rows = await queries.get_comments_for_article_by_id(
             self.connection,
-            slug=article.slug,
+            article_id=article.id_,
         )
         return [
             await self._get_comment_from_db_record(
@@ -58,30 +61,45 @@ class CommentsRepository(BaseRepository):
             for comment_row in comments_rows
         ]
 
+    async def get_comments_version_for_article(
+        self,
+        *,
+        article: ArticleLike,
+        user: Optional[UserInDB] = None,
+    ) -> Tuple[Any, ...]:
+        version_row = await queries.get_comments_version_for_article_by_id(
+            self.connection,
+            article_id=article.id_,
+            follower_id=user.id_ if user else None,
+        )
+        return tuple(version_row)
+
     async def create_comment_for_article(
         self,
         *,
         body: str,
-        article: Article,
-        user: User,
+        article: ArticleLike,
+        user: UserInDB,
     ) -> Comment:
         comment_row = await queries.create_new_comment(
             self.connection,
             body=body,
-            article_slug=article.slug,
-            author_username=user.username,
+            author_id=user.id_,
+            article_id=article.id_,
         )
-        return await self._get_comment_from_db_record(
-            comment_row=comment_row,
-            author_username=comment_row["author_username"],
-            requested_user=user,
+        return Comment(
+            id_=comment_row["id"],
+            body=comment_row["body"],
+            author=Profile(username=user.username, bio=user.bio, image=user.image),
+            created_at=comment_row["created_at"],
+            updated_at=comment_row["updated_at"],
         )
 
-    async def delete_comment(self, *, comment: Comment) -> None:
+    async def delete_comment(self, *, comment: Comment, user: UserInDB) -> None:
         await queries.delete_comment_by_id(
             self.connection,
             comment_id=comment.id_,
-            author_username=comment.author.username,
+            author_id=user.id_,
         )
 
     async def _get_comment_from_db_record(
@@ -89,7 +107,7 @@ class CommentsRepository(BaseRepository):
         *,
         comment_row: Record,
         author_username: str,
-        requested_user: Optional[User],
+        requested_user: Optional[UserInDB],
     ) -> Comment:
         return Comment(
             id_=comment_row["id"],
@@ -0,0 +1,100 @@
+from typing import Optional
+
+from app.db.queries.queries import queries
+from app.db.repositories.base import BaseRepository
+
+
+class FeedsRepository(BaseRepository):
+    async def fan_out_article(
+        self,
+        *,
+        article_id: int,
+        author_id: int,
+        max_items: int,
+        followers_threshold: int,
+    ) -> None:
+        async with self.connection.transaction():
+            followers_count = (
+                await queries.get_followers_count_for_user(
+                    self.connection,
+                    user_id=author_id,
+                )
+            )["followers_count"]
+
+            if followers_count > followers_threshold:
+                await queries.mark_author_as_pulled(
+                    self.connection,
+                    author_id=author_id,
+                )
+            else:
+                followers_rows = await queries.add_article_to_followers_feeds(
+                    self.connection,
+                    article_id=article_id,
+                )
+                await queries.trim_followers_feeds(
+                    self.connection,
+                    follower_ids=[row["user_id"] for row in followers_rows],
+                    max_items=max_items,
+                )
+
+    async def backfill_feeds(
+        self,
+        *,
+        after_user_id: int,
+        limit: int,
+        max_items: int,
+    ) -> Optional[int]:
+        followers_rows = await queries.get_followers_after_user(
+            self.connection,
+            after_user_id=after_user_id,
+            limit=limit,
+        )
+        follower_ids = [row["follower_id"] for row in followers_rows]
+        if not follower_ids:
+            return None
+
+        async with self.connection.transaction():
+            await queries.add_followed_authors_articles_to_feeds(
+                self.connection,
+                follower_ids=follower_ids,
+                max_items=max_items,
+            )
+            await queries.trim_followers_feeds(
+                self.connection,
+                follower_ids=follower_ids,
+                max_items=max_items,
+            )
+
+        return follower_ids[-1]
+
+    async def add_author_into_feed(
+        self,
+        *,
+        user_id: int,
+        author_username: str,
+        max_items: int,
+    ) -> None:
+        async with self.connection.transaction():
+            await queries.add_author_articles_to_feed(
+                self.connection,
+                user_id=user_id,
+                author_username=author_username,
+                max_items=max_items,
+            )
+            await queries.trim_user_feed(
+                self.connection,
+                user_id=user_id,
+                max_items=max_items,
+            )
+
+    async def remove_author_from_feed(
+        self,
+        *,
+        user_id: int,
+        author_username: str,
+    ) -> None:
+        await queries.remove_author_articles_from_feed(
+            self.connection,
+            user_id=user_id,
+            author_username=author_username,
+        )
@@ -1,17 +1,16 @@
-from typing import Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from asyncpg import Connection
+from asyncpg import Connection, Record
 
+from app.db.errors import EntityDoesNotExist
 from app.db.queries.queries import queries
 from app.db.repositories.base import BaseRepository
 from app.db.repositories.users import UsersRepository
 from app.models.domain.profiles import Profile
-from app.models.domain.users import User
+from app.models.domain.users import UserInDB
 
-UserLike = Union[User, Profile]
 
-
-class ProfilesRepository(BaseRepository):
+class ProfilesRepository(BaseRepository):  # noqa: WPS214
     def __init__(self, conn: Connection):
         super().__init__(conn)
         self._users_repo = UsersRepository(conn)
@@ -20,7 +19,7 @@ class ProfilesRepository(BaseRepository):
         self,
         *,
         username: str,
-        requested_user: Optional[UserLike],
+        requested_user: Optional[UserInDB],
     ) -> Profile:
         user = await self._users_repo.get_user_by_username(username=username)
 
@@ -33,42 +32,124 @@ class ProfilesRepository(BaseRepository):
 
         return profile
 
+    async def get_profile_version_by_username(
+        self,
+        *,
+        username: str,
+        requested_user: Optional[UserInDB],
+    ) -> Tuple[Any, ...]:
+        version_row = await queries.get_profile_version_by_username(
+            self.connection,
+            username=username,
+            follower_id=requested_user.id_ if requested_user else None,
+        )
+        if version_row:
+            return tuple(version_row)
+
+        raise EntityDoesNotExist(
+            "user with username {0} does not exist".format(username),
+        )
+
+    async def get_profiles_by_usernames(
+        self,
+        *,
+        usernames: Iterable[str],
+        requested_user: Optional[UserInDB],
+    ) -> Dict[str, Profile]:
+        profiles_rows = await queries.get_profiles_by_usernames(
+            self.connection,
+            usernames=list(usernames),
+            follower_id=requested_user.id_ if requested_user else None,
+        )
+        return {
+            profile_row["username"]: Profile(**profile_row)
+            for profile_row in profiles_rows
+        }
+
     async def is_user_following_for_another_user(
         self,
         *,
-        target_user: UserLike,
-        requested_user: UserLike,
+        target_user: UserInDB,
+        requested_user: UserInDB,
     ) -> bool:
         return (
             await queries.is_user_following_for_another(
                 self.connection,
-                follower_username=requested_user.username,
-                following_username=target_user.username,
+                follower_id=requested_user.id_,
+                following_id=target_user.id_,
             )
         )["is_following"]
 
-    async def add_user_into_followers(
+    async def change_following_state(
         self,
         *,
-        target_user: UserLike,
-        requested_user: UserLike,
-    ) -> None:
-        async with self.connection.transaction():
-            await queries.subscribe_user_to_another(
-                self.connection,
-                follower_username=requested_user.username,
-                following_username=target_user.username,
-            )
+        username: str,
+        requested_user: UserInDB,
+        following: bool,
+    ) -> bool:
+        result_rows = await self._change_followings(
+            requested_user=requested_user,
+            following_by_usernames={username: following},
+            following=following,
+        )
+        if result_rows[0]["found"]:
+            return result_rows[0]["changed"]
 
-    async def remove_user_from_followers(
+        raise EntityDoesNotExist(
+            "user with username {0} does not exist".format(username),
+        )
+
+    async def change_followings_by_usernames(
         self,
         *,
-        target_user: UserLike,
-        requested_user: UserLike,
-    ) -> None:
+        requested_user: UserInDB,
+        following_by_usernames: Dict[str, bool],
+    ) -> Tuple[Set[str], Set[str]]:
+        result_rows: List[Record] = []
         async with self.connection.transaction():
-            await queries.unsubscribe_user_from_another(
-                self.connection,
-                follower_username=requested_user.username,
-                following_username=target_user.username,
-            )
+            for following in (True, False):
+                result_rows.extend(
+                    await self._change_followings(
+                        requested_user=requested_user,
+                        following_by_usernames=following_by_usernames,
+                        following=following,
+                    ),
+                )
+
+        changed_usernames = {
+            result_row["username"]
+            for result_row in result_rows
+            if result_row["changed"]
+        }
+        missing_usernames = {
+            result_row["username"]
+            for result_row in result_rows
+            if not result_row["found"]
+        }
+        return changed_usernames, missing_usernames
+
+    async def _change_followings(
+        self,
+        *,
+        requested_user: UserInDB,
+        following_by_usernames: Dict[str, bool],
+        following: bool,
+    ) -> List[Record]:
+        usernames = [
+            username
+            for username, should_be_followed in following_by_usernames.items()
+            if should_be_followed is following
+        ]
+        if not usernames:
+            return []
+
+        change_followings = (
+            queries.subscribe_user_to_others_by_usernames
+            if following
+            else queries.unsubscribe_user_from_others_by_usernames
+        )
+        return await change_followings(
+            self.connection,
+            follower_id=requested_user.id_,
+            usernames=usernames,
+        )
@@ -1,7 +1,7 @@
-from typing import List, Sequence
+from typing import List
 
 from app.db.queries.queries import queries
-from app.db.repositories.base import BaseRepository
+from app.db.repositories.base import BaseRepository, get_prefix_pattern
 
 
 class TagsRepository(BaseRepository):
@@ -9,5 +9,11 @@ class TagsRepository(BaseRepository):
         tags_row = await queries.get_all_tags(self.connection)
         return [tag[0] for tag in tags_row]
 
-    async def create_tags_that_dont_exist(self, *, tags: Sequence[str]) -> None:
-        await queries.create_new_tags(self.connection, [{"tag": tag} for tag in tags])
+    async def get_tags_for_autocomplete(self, *, prefix: str, limit: int) -> List[str]:
+        tags_rows = await queries.get_tags_for_autocomplete(
+            self.connection,
+            pattern=get_prefix_pattern(prefix),
+            prefix=prefix,
+            limit=limit,
+        )
+        return [tag[0] for tag in tags_rows]
@@ -1,9 +1,9 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from app.db.errors import EntityDoesNotExist
+from app.db.errors import EntityAlreadyExists, EntityDoesNotExist
 from app.db.queries.queries import queries
-from app.db.repositories.base import BaseRepository
-from app.models.domain.users import User, UserInDB
+from app.db.repositories.base import BaseRepository, get_prefix_pattern
+from app.models.domain.users import UserInDB
 
 
 class UsersRepository(BaseRepository):
@@ -26,6 +26,22 @@ class UsersRepository(BaseRepository):
             "user with username {0} does not exist".format(username),
         )
 
+    async def check_credentials_are_taken(
+        self,
+        *,
+        username: Optional[str] = None,
+        email: Optional[str] = None,
+    ) -> Tuple[bool, bool]:
+        if username is None and email is None:
+            return False, False
+
+        credentials_row = await queries.check_credentials_are_taken(
+            self.connection,
+            username=username,
+            email=email,
+        )
+        return credentials_row["username_taken"], credentials_row["email_taken"]
+
     async def create_user(
         self,
         *,
@@ -45,19 +61,33 @@ class UsersRepository(BaseRepository):
                 hashed_password=user.hashed_password,
             )
 
-        return user.copy(update=dict(user_row))
+        if not user_row:
+            raise EntityAlreadyExists(
+                "user with username {0} or email {1} already exists".format(
+                    username,
+                    email,
+                ),
+            )
+
+        return user.copy(
+            update={
+                "id_": user_row["id"],
+                "created_at": user_row["created_at"],
+                "updated_at": user_row["updated_at"],
+            },
+        )
 
     async def update_user(  # noqa: WPS211
         self,
         *,
-        user: User,
+        user: UserInDB,
         username: Optional[str] = None,
         email: Optional[str] = None,
         password: Optional[str] = None,
         bio: Optional[str] = None,
         image: Optional[str] = None,
     ) -> UserInDB:
-        user_in_db = await self.get_user_by_username(username=user.username)
+        user_in_db = user.copy()
 
         user_in_db.username = username or user_in_db.username
         user_in_db.email = email or user_in_db.email
@@ -67,9 +97,9 @@ class UsersRepository(BaseRepository):
             user_in_db.change_password(password)
 
         async with self.connection.transaction():
-            user_in_db.updated_at = await queries.update_user_by_username(
+            user_in_db.updated_at = await queries.update_user_by_id(
                 self.connection,
-                username=user.username,
+                user_id=user.id_,
                 new_username=user_in_db.username,
                 new_email=user_in_db.email,
                 new_salt=user_in_db.salt,
@@ -79,3 +109,17 @@ class UsersRepository(BaseRepository):
             )
 
         return user_in_db
+
+    async def get_usernames_for_autocomplete(
+        self,
+        *,
+        prefix: str,
+        limit: int,
+    ) -> List[str]:
+        users_rows = await queries.get_usernames_for_autocomplete(
+            self.connection,
+            pattern=get_prefix_pattern(prefix),
+            prefix=prefix,
+            limit=limit,
+        )
+        return [user[0] for user in users_rows]
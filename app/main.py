@@ -5,7 +5,9 @@ from starlette.middleware.cors import CORSMiddleware
 
 from app.api.errors.http_error import http_error_handler
 from app.api.errors.validation_error import http422_error_handler
-from app.api.routes.api import router as api_router
+from app.api.middlewares.compression import CompressionMiddleware
+from app.api.routes.api import include_api_routers
+from app.api.routes.health import router as health_router
 from app.core.config import get_app_settings
 from app.core.events import create_start_app_handler, create_stop_app_handler
 
@@ -25,6 +27,12 @@ def get_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    application.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        compresslevel=settings.compression_level,
+    )
+
     application.add_event_handler(
         "startup",
         create_start_app_handler(application, settings),
@@ -37,9 +45,7 @@ def get_application() -> FastAPI:
     application.add_exception_handler(HTTPException, http_error_handler)
     application.add_exception_handler(RequestValidationError, http422_error_handler)
 
-    application.include_router(api_router, prefix=settings.api_prefix)
+    include_api_routers(application, prefix=settings.api_prefix)
+    application.include_router(health_router, tags=["health"], prefix="/health")
 
     return application
-
-
-app = get_application()
@@ -0,0 +1,22 @@
+import pathlib
+
+from alembic import command
+from alembic.config import Config
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+ALEMBIC_CONFIG = PROJECT_ROOT / "alembic.ini"
+MIGRATIONS_LOCATION = PROJECT_ROOT / "app" / "db" / "migrations"
+
+
+def get_alembic_config() -> Config:
+    alembic_config = Config(str(ALEMBIC_CONFIG))
+    alembic_config.set_main_option("script_location", str(MIGRATIONS_LOCATION))
+    return alembic_config
+
+
+def main() -> None:
+    command.upgrade(get_alembic_config(), "head")
+
+
+if __name__ == "__main__":
+    main()
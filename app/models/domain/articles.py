@@ -1,16 +1,25 @@
-from typing import List
+from typing import List, Optional
 
 from app.models.common import DateTimeModelMixin, IDModelMixin
 from app.models.domain.profiles import Profile
 from app.models.domain.rwmodel import RWModel
 
 
-class Article(IDModelMixin, DateTimeModelMixin, RWModel):
+class ArticlePreview(IDModelMixin, DateTimeModelMixin, RWModel):
     slug: str
     title: str
     description: str
-    body: str
     tags: List[str]
     author: Profile
     favorited: bool
     favorites_count: int
+
+
+class Article(ArticlePreview):
+    body: str
+
+
+class ArticleReference(IDModelMixin, RWModel):
+    slug: str
+    author_id: Optional[int] = None
+    author_username: Optional[str] = None
@@ -0,0 +1,10 @@
+from typing import Any, Dict
+
+from app.models.common import IDModelMixin
+from app.models.domain.rwmodel import RWModel
+
+
+class BackgroundJob(IDModelMixin, RWModel):
+    name: str
+    payload: Dict[str, Any]
+    attempts: int = 0
@@ -1,18 +1,25 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Union
 
 from pydantic import BaseModel, Field
 
-from app.models.domain.articles import Article
+from app.models.domain.articles import Article, ArticlePreview
+from app.models.schemas.batches import BatchItemStatus
 from app.models.schemas.rwschema import RWSchema
 
 DEFAULT_ARTICLES_LIMIT = 20
 DEFAULT_ARTICLES_OFFSET = 0
+MAX_ARTICLES_BATCH_SIZE = 100
+MAX_FAVORITES_BATCH_SIZE = 100
 
 
 class ArticleForResponse(RWSchema, Article):
     tags: List[str] = Field(..., alias="tagList")
 
 
+class ArticlePreviewForResponse(RWSchema, ArticlePreview):
+    tags: List[str] = Field(..., alias="tagList")
+
+
 class ArticleInResponse(RWSchema):
     article: ArticleForResponse
 
@@ -31,13 +38,35 @@ class ArticleInUpdate(RWSchema):
 
 
 class ListOfArticlesInResponse(RWSchema):
-    articles: List[ArticleForResponse]
+    articles: Sequence[Union[ArticleForResponse, ArticlePreviewForResponse]]
     articles_count: int
 
 
+class ArticlesSearchResultsInResponse(ListOfArticlesInResponse):
+    next_cursor: Optional[str] = None
+
+
+class ArticlesBatchInResponse(ListOfArticlesInResponse):
+    missing_slugs: List[str]
+
+
+class FavoriteInBatch(RWSchema):
+    slug: str
+    favorited: bool
+
+
+class FavoriteInBatchResult(FavoriteInBatch):
+    status: BatchItemStatus
+
+
+class FavoritesBatchInResponse(RWSchema):
+    favorites: List[FavoriteInBatchResult]
+
+
 class ArticlesFilters(BaseModel):
     tag: Optional[str] = None
     author: Optional[str] = None
     favorited: Optional[str] = None
     limit: int = Field(DEFAULT_ARTICLES_LIMIT, ge=1)
     offset: int = Field(DEFAULT_ARTICLES_OFFSET, ge=0)
+    include_body: bool = True
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class BatchItemStatus(str, Enum):  # noqa: WPS600
+    applied: str = "applied"
+    unchanged: str = "unchanged"
+    not_found: str = "not_found"
+    rejected: str = "rejected"
@@ -0,0 +1,24 @@
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class HealthStatus(str, Enum):  # noqa: WPS600
+    alive: str = "alive"
+    starting: str = "starting"
+    ready: str = "ready"
+    degraded: str = "degraded"
+    unavailable: str = "unavailable"
+
+
+class DatabaseHealth(BaseModel):
+    latency: float
+    pool_wait: float
+    pool_size: int
+    pool_idle_size: int
+
+
+class HealthInResponse(BaseModel):
+    status: HealthStatus
+    database: Optional[DatabaseHealth] = None
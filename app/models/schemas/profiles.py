@@ -1,7 +1,29 @@
+from typing import List
+
 from pydantic import BaseModel
 
 from app.models.domain.profiles import Profile
+from app.models.schemas.batches import BatchItemStatus
+
+MAX_FOLLOWS_BATCH_SIZE = 100
 
 
 class ProfileInResponse(BaseModel):
     profile: Profile
+
+
+class UsernamesInList(BaseModel):
+    usernames: List[str]
+
+
+class FollowInBatch(BaseModel):
+    username: str
+    following: bool
+
+
+class FollowInBatchResult(FollowInBatch):
+    status: BatchItemStatus
+
+
+class FollowsBatchInResponse(BaseModel):
+    follows: List[FollowInBatchResult]
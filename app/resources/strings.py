@@ -19,6 +19,7 @@ MALFORMED_PAYLOAD = "could not validate credentials"
 
 ARTICLE_IS_ALREADY_FAVORITED = "you are already marked this articles as favorite"
 ARTICLE_IS_NOT_FAVORITED = "article is not favorited"
+MALFORMED_SEARCH_CURSOR = "search cursor is malformed"
 
 COMMENT_DOES_NOT_EXIST = "comment does not exist"
 
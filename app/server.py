@@ -0,0 +1,78 @@
+import os
+from importlib import util
+from typing import Any, Dict, Tuple
+
+import uvicorn
+from loguru import logger
+
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+
+APPLICATION_FACTORY = "app.main:get_application"
+
+# besides its pool every worker keeps one connection for the invalidation bus
+CONNECTIONS_OUTSIDE_POOL = 1
+
+
+def get_workers_count(settings: AppSettings) -> int:
+    return settings.server_workers or os.cpu_count() or 1
+
+
+def get_pool_size_for_worker(settings: AppSettings, *, workers: int) -> Tuple[int, int]:
+    if settings.database_connection_budget is None:
+        return settings.min_connection_count, settings.max_connection_count
+
+    max_size = settings.database_connection_budget // workers - CONNECTIONS_OUTSIDE_POOL
+    if max_size < 1:
+        logger.warning(
+            "Connection budget {0} is too small for {1} workers",
+            settings.database_connection_budget,
+            workers,
+        )
+        max_size = 1
+
+    return min(settings.min_connection_count, max_size), max_size
+
+
+def get_server_options(settings: AppSettings, *, workers: int) -> Dict[str, Any]:
+    return {
+        "factory": True,
+        "host": settings.server_host,
+        "port": settings.server_port,
+        "workers": workers,
+        "loop": "uvloop" if _is_installed("uvloop") else "asyncio",
+        "http": "httptools" if _is_installed("httptools") else "h11",
+        "timeout_keep_alive": settings.server_keep_alive,
+        "backlog": settings.server_backlog,
+    }
+
+
+def main() -> None:
+    settings = get_app_settings()
+    workers = get_workers_count(settings)
+    min_size, max_size = get_pool_size_for_worker(settings, workers=workers)
+
+    # workers are separate processes that read their settings from environment
+    os.environ["MIN_CONNECTION_COUNT"] = str(min_size)
+    os.environ["MAX_CONNECTION_COUNT"] = str(max_size)
+    # a single worker runs the factory in this process with the cached settings
+    get_app_settings.cache_clear()
+
+    server_options = get_server_options(settings, workers=workers)
+    logger.info(
+        "Starting {0} workers with {1}-{2} database connections each, {3} loop, {4}",
+        workers,
+        min_size,
+        max_size,
+        server_options["loop"],
+        server_options["http"],
+    )
+    uvicorn.run(APPLICATION_FACTORY, **server_options)
+
+
+def _is_installed(module_name: str) -> bool:
+    return util.find_spec(module_name) is not None
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,57 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Optional, Tuple
+
 from slugify import slugify
 
-from app.db.errors import EntityDoesNotExist
-from app.db.repositories.articles import ArticlesRepository
 from app.models.domain.articles import Article
 from app.models.domain.users import User
+from app.services.etags import make_etag
 
+# these slugs would be shadowed by routes declared before GET /articles/{slug}
+RESERVED_SLUGS = frozenset(("feed", "search", "batch"))
+RESERVED_SLUG_SUFFIX = "article"
 
-async def check_article_exists(articles_repo: ArticlesRepository, slug: str) -> bool:
-    try:
-        await articles_repo.get_article_by_slug(slug=slug)
-    except EntityDoesNotExist:
-        return False
-
-    return True
+SearchCursor = Tuple[float, int]
 
 
 def get_slug_for_article(title: str) -> str:
-    return slugify(title)
+    slug = slugify(title)
+    if slug in RESERVED_SLUGS:
+        return "{0}-{1}".format(slug, RESERVED_SLUG_SUFFIX)
+
+    return slug
+
+
+def check_user_can_modify_article(author_username: Optional[str], user: User) -> bool:
+    return author_username == user.username
+
+
+def make_article_etag(article: Article) -> str:
+    # the same parts, in the same order, as get-article-version-by-slug returns
+    return make_etag(
+        article.id_,
+        article.updated_at,
+        article.author.username,
+        article.author.bio,
+        article.author.image,
+        article.favorites_count,
+        article.favorited,
+        article.author.following,
+    )
+
+
+def encode_search_cursor(rank: float, article_id: int) -> str:
+    cursor = "{0!r}:{1}".format(rank, article_id)
+    return urlsafe_b64encode(cursor.encode()).decode()
+
+
+def decode_search_cursor(cursor: str) -> SearchCursor:
+    try:
+        return _parse_search_cursor(urlsafe_b64decode(cursor.encode()).decode())
+    except ValueError as decode_error:
+        raise ValueError("malformed search cursor") from decode_error
 
 
-def check_user_can_modify_article(article: Article, user: User) -> bool:
-    return article.author.username == user.username
+def _parse_search_cursor(cursor: str) -> SearchCursor:
+    rank, article_id = cursor.split(":")
+    return float(rank), int(article_id)
@@ -0,0 +1,18 @@
+from typing import AbstractSet
+
+from app.models.schemas.batches import BatchItemStatus
+
+
+def get_batch_item_status(
+    key: str,
+    *,
+    changed: AbstractSet[str],
+    missing: AbstractSet[str],
+) -> BatchItemStatus:
+    if key in missing:
+        return BatchItemStatus.not_found
+
+    if key in changed:
+        return BatchItemStatus.applied
+
+    return BatchItemStatus.unchanged
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+_LOAD_FAILED = object()
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def run(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        in_flight = self._in_flight.get(key)
+        while in_flight is not None:
+            loaded_value = await asyncio.shield(in_flight)
+            if loaded_value is not _LOAD_FAILED:
+                return loaded_value
+
+            in_flight = self._in_flight.get(key)
+
+        return await self._load(key, loader)
+
+    def forget(self, key: Hashable) -> None:
+        self._in_flight.pop(key, None)
+
+    def clear(self) -> None:
+        self._in_flight.clear()
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        in_flight = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = in_flight
+        load = asyncio.ensure_future(loader())
+        load.add_done_callback(partial(self._finish_load, key, in_flight))
+        return await load
+
+    def _finish_load(
+        self,
+        key: Hashable,
+        in_flight: "asyncio.Future[Any]",
+        load: "asyncio.Future[Any]",
+    ) -> None:
+        # the key may already belong to a newer load started after forget()
+        if self._in_flight.get(key) is in_flight:
+            self._in_flight.pop(key)
+
+        if load.cancelled() or load.exception() is not None:
+            in_flight.set_result(_LOAD_FAILED)
+        else:
+            in_flight.set_result(load.result())
+
+
+class TTLCache:
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._loads = SingleFlight()
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, cached_value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return cached_value
+
+    def set(self, key: Hashable, cached_value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, cached_value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._loads.clear()
+        self._generation += 1
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        cached_value = self.get(key)
+        if cached_value is None:
+            cached_value = await self._loads.run(key, partial(self._load, key, loader))
+
+        return cached_value
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        generation = self._generation
+        loaded_value = await loader()
+        if generation == self._generation:
+            self.set(key, loaded_value)
+
+        return loaded_value
@@ -0,0 +1,57 @@
+import gzip
+from typing import Awaitable, Callable, Optional
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, Response
+
+from app.core.settings.app import AppSettings
+
+GZIP_ENCODING = "gzip"
+
+
+class PrecompressedResponse:
+    def __init__(
+        self,
+        response_model: BaseModel,
+        *,
+        minimum_size: int,
+        compress_level: int,
+    ) -> None:
+        self.body = JSONResponse(content=jsonable_encoder(response_model)).body
+        self.gzipped_body: Optional[bytes] = None
+        if len(self.body) >= minimum_size:
+            self.gzipped_body = gzip.compress(self.body, compresslevel=compress_level)
+
+    def to_response(self, headers: Headers) -> Response:
+        response_headers = {"Vary": "Accept-Encoding"}
+        if self.gzipped_body is None or not accepts_gzip(headers):
+            return Response(
+                self.body,
+                media_type=JSONResponse.media_type,
+                headers=response_headers,
+            )
+
+        response_headers["Content-Encoding"] = GZIP_ENCODING
+        return Response(
+            self.gzipped_body,
+            media_type=JSONResponse.media_type,
+            headers=response_headers,
+        )
+
+
+async def precompress_response(
+    loader: Callable[[], Awaitable[BaseModel]],
+    *,
+    settings: AppSettings,
+) -> PrecompressedResponse:
+    return PrecompressedResponse(
+        await loader(),
+        minimum_size=settings.compression_minimum_size,
+        compress_level=settings.compression_level,
+    )
+
+
+def accepts_gzip(headers: Headers) -> bool:
+    return GZIP_ENCODING in headers.get("Accept-Encoding", "")
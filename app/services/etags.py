@@ -0,0 +1,27 @@
+import hashlib
+from typing import Any, Optional
+
+ETAG_LENGTH = 32
+
+
+def make_etag(*version_parts: Any) -> str:
+    version = ":".join(str(version_part) for version_part in version_parts)
+    version_hash = hashlib.sha256(version.encode()).hexdigest()
+    return '"{0}"'.format(version_hash[:ETAG_LENGTH])
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+
+    return False
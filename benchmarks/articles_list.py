@@ -0,0 +1,111 @@
+"""Articles list page cost with and without article bodies.
+
+Every seeded article gets a body of the given size, so the difference between
+the two modes is the price of shipping bodies that list views never show:
+
+    python -m benchmarks.articles_list --articles 200 --body-size 32768
+"""
+from asyncpg import Connection
+
+from app.db.repositories.articles import ArticlesRepository
+from app.models.domain.users import UserInDB
+from app.models.schemas.articles import (
+    ArticleForResponse,
+    ArticlePreviewForResponse,
+    ListOfArticlesInResponse,
+)
+from benchmarks.common import (
+    create_benchmark_user,
+    get_arguments_parser,
+    measure,
+    report,
+    rolled_back_connection,
+    run_benchmark,
+)
+
+SEED_ARTICLES = """
+INSERT
+INTO articles (slug, title, description, body, author_id)
+SELECT $1 || n, 'title', 'description', repeat('x', $2::integer), $3::integer
+FROM generate_series(1, $4::integer) n
+"""
+
+
+async def seed_articles(
+    conn: Connection,
+    *,
+    author: UserInDB,
+    articles: int,
+    body_size: int,
+) -> None:
+    await conn.execute(
+        SEED_ARTICLES,
+        "bench-list-",
+        body_size,
+        author.id_,
+        articles,
+    )
+    await conn.execute("ANALYZE")
+
+
+async def render_page(
+    articles_repo: ArticlesRepository,
+    *,
+    limit: int,
+    include_body: bool,
+) -> str:
+    articles = await articles_repo.filter_articles(
+        limit=limit,
+        include_body=include_body,
+    )
+    schema = ArticleForResponse if include_body else ArticlePreviewForResponse
+    return ListOfArticlesInResponse(
+        articles=[schema.from_orm(article) for article in articles],
+        articles_count=len(articles),
+    ).json()
+
+
+async def main() -> None:
+    parser = get_arguments_parser(__doc__)
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--body-size", type=int, default=32768)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    async with rolled_back_connection(args.database_url) as conn:
+        author = await create_benchmark_user(conn, "bench-author")
+        await seed_articles(
+            conn,
+            author=author,
+            articles=args.articles,
+            body_size=args.body_size,
+        )
+        articles_repo = ArticlesRepository(conn)
+
+        for include_body in (True, False):
+            page = await render_page(
+                articles_repo,
+                limit=args.limit,
+                include_body=include_body,
+            )
+
+            async def read_page(round_number: int) -> None:
+                await render_page(
+                    articles_repo,
+                    limit=args.limit,
+                    include_body=include_body,  # noqa: B023
+                )
+
+            timings = await measure(read_page, rounds=args.rounds)
+            report(
+                "list page include_body={0}, {1} bytes".format(
+                    str(include_body).lower(),
+                    len(page.encode()),
+                ),
+                timings,
+                operations=1,
+            )
+
+
+if __name__ == "__main__":
+    run_benchmark(main)
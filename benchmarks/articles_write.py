@@ -0,0 +1,48 @@
+"""Write throughput of ArticlesRepository.create_article.
+
+Runs against DATABASE_URL inside a transaction that is rolled back at the end:
+
+    python -m benchmarks.articles_write --articles 200 --tags 5
+"""
+from app.db.repositories.articles import ArticlesRepository
+from benchmarks.common import (
+    create_benchmark_user,
+    get_arguments_parser,
+    measure,
+    report,
+    rolled_back_connection,
+    run_benchmark,
+)
+
+
+async def main() -> None:
+    parser = get_arguments_parser(__doc__)
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--tags", type=int, default=5)
+    args = parser.parse_args()
+
+    async with rolled_back_connection(args.database_url) as conn:
+        author = await create_benchmark_user(conn, "bench-author")
+        articles_repo = ArticlesRepository(conn)
+
+        async def create_articles(round_number: int) -> None:
+            for index in range(args.articles):
+                await articles_repo.create_article(
+                    slug="bench-{0}-{1}".format(round_number, index),
+                    title="Benchmark article",
+                    description="Benchmark description",
+                    body="Benchmark body " * 100,
+                    author=author,
+                    tags=[
+                        "bench-tag-{0}".format(tag_index)
+                        for tag_index in range(args.tags)
+                    ],
+                )
+
+        timings = await measure(create_articles, rounds=args.rounds)
+
+    report("create_article", timings, operations=args.articles)
+
+
+if __name__ == "__main__":
+    run_benchmark(main)
@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, List
+
+import asyncpg
+from asyncpg import Connection
+
+from app.db.repositories.users import UsersRepository
+from app.models.domain.users import UserInDB
+
+
+def get_arguments_parser(description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        help="PostgreSQL DSN, defaults to DATABASE_URL environment variable",
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    return parser
+
+
+@asynccontextmanager
+async def rolled_back_connection(database_url: str) -> AsyncIterator[Connection]:
+    conn = await asyncpg.connect(database_url)
+    tx = conn.transaction()
+    await tx.start()
+    try:
+        yield conn
+    finally:
+        await tx.rollback()
+        await conn.close()
+
+
+async def create_benchmark_user(conn: Connection, name: str) -> UserInDB:
+    return await UsersRepository(conn).create_user(
+        username=name,
+        email="{0}@bench.local".format(name),
+        password="password",
+    )
+
+
+async def measure(
+    run: Callable[[int], Awaitable[None]],
+    *,
+    rounds: int,
+) -> List[float]:
+    timings = []
+    for round_number in range(rounds):
+        started_at = time.perf_counter()
+        await run(round_number)
+        timings.append(time.perf_counter() - started_at)
+    return timings
+
+
+def report(title: str, timings: List[float], operations: int) -> None:
+    best = min(timings)
+    average = sum(timings) / len(timings)
+    print(  # noqa: WPS421
+        "{0}: best {1:.2f} ms, avg {2:.2f} ms, {3:.0f} ops/s".format(
+            title,
+            best * 1000,
+            average * 1000,
+            operations / best,
+        ),
+    )
+
+
+def run_benchmark(main: Callable[[], Awaitable[None]]) -> None:
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""Feed latency depending on the number of followed authors.
+
+Every followed author gets the same number of articles, so the amount of data
+behind the feed grows linearly with follows while a page stays the same size:
+
+    python -m benchmarks.feed_read --follows 10 100 1000 --articles-per-author 100
+"""
+from asyncpg import Connection
+
+from app.db.queries.queries import queries
+from app.models.domain.users import UserInDB
+from benchmarks.common import (
+    create_benchmark_user,
+    get_arguments_parser,
+    measure,
+    report,
+    rolled_back_connection,
+    run_benchmark,
+)
+
+SEED_FOLLOWED_AUTHORS = """
+WITH authors AS (
+    INSERT INTO users (username, email, salt, hashed_password)
+    SELECT $1 || g, $1 || g || '@bench.local', '', ''
+    FROM generate_series(1, $2::integer) g
+    RETURNING id
+), followings AS (
+    INSERT INTO followers_to_followings (follower_id, following_id)
+    SELECT $3::integer, id
+    FROM authors
+)
+INSERT
+INTO articles (slug, title, description, body, author_id, created_at)
+SELECT $1 || authors.id || '-' || n,
+       'title',
+       'description',
+       'body',
+       authors.id,
+       now() - random() * interval '365 days'
+FROM authors
+         CROSS JOIN generate_series(1, $4::integer) n
+"""
+
+
+async def seed_followed_authors(
+    conn: Connection,
+    *,
+    user: UserInDB,
+    follows: int,
+    articles_per_author: int,
+) -> None:
+    await conn.execute(
+        SEED_FOLLOWED_AUTHORS,
+        "bench-{0}-".format(follows),
+        follows,
+        user.id_,
+        articles_per_author,
+    )
+    await conn.execute("ANALYZE")
+
+
+async def main() -> None:
+    parser = get_arguments_parser(__doc__)
+    parser.add_argument("--follows", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--articles-per-author", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    for follows in args.follows:
+        async with rolled_back_connection(args.database_url) as conn:
+            user = await create_benchmark_user(conn, "bench-reader")
+            await seed_followed_authors(
+                conn,
+                user=user,
+                follows=follows,
+                articles_per_author=args.articles_per_author,
+            )
+
+            async def read_feed(round_number: int) -> None:
+                await queries.get_articles_for_feed(
+                    conn,
+                    follower_id=user.id_,
+                    limit=args.limit,
+                    offset=0,
+                )
+
+            timings = await measure(read_feed, rounds=args.rounds)
+
+        report("feed page with {0} follows".format(follows), timings, operations=1)
+
+
+if __name__ == "__main__":
+    run_benchmark(main)
@@ -0,0 +1,97 @@
+"""Cold start cost of the application.
+
+Every round starts a fresh interpreter with ``-X importtime``, so nothing is
+shared between rounds except the bytecode cache. Importing ``app.main`` and
+building the application are reported separately, followed by the modules
+with the biggest own import time:
+
+    python -m benchmarks.import_time --rounds 5 --top 15
+"""
+import asyncio
+import os
+import sys
+from typing import Dict, List, Tuple
+
+from benchmarks.common import get_arguments_parser, report, run_benchmark
+
+IMPORT_APPLICATION = "import app.main"
+BUILD_APPLICATION = """
+import time
+from app.main import get_application
+started_at = time.perf_counter()
+get_application()
+print(time.perf_counter() - started_at)
+"""
+
+
+def parse_import_times(output: str) -> Dict[str, Tuple[int, int]]:
+    import_times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        self_time, cumulative_time, module = line[len("import time:") :].split("|")
+        if self_time.strip().isdigit():
+            import_times[module.strip()] = (int(self_time), int(cumulative_time))
+    return import_times
+
+
+async def run_interpreter(code: str, *, database_url: str) -> Tuple[str, str]:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-X",
+        "importtime",
+        "-c",
+        code,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env={**os.environ, "DATABASE_URL": database_url},
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode:
+        raise RuntimeError(stderr.decode())
+    return stdout.decode(), stderr.decode()
+
+
+async def main() -> None:
+    parser = get_arguments_parser(__doc__)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    import_timings: List[float] = []
+    build_timings: List[float] = []
+    import_times: Dict[str, Tuple[int, int]] = {}
+    for _ in range(args.rounds):
+        _, import_output = await run_interpreter(
+            IMPORT_APPLICATION,
+            database_url=args.database_url,
+        )
+        import_times = parse_import_times(import_output)
+        import_timings.append(import_times["app.main"][1] / 1_000_000)
+
+        build_output, _ = await run_interpreter(
+            BUILD_APPLICATION,
+            database_url=args.database_url,
+        )
+        build_timings.append(float(build_output))
+
+    report("import app.main", import_timings, operations=1)
+    report("get_application()", build_timings, operations=1)
+
+    slowest_modules = sorted(
+        import_times.items(),
+        key=lambda module_times: module_times[1][0],
+        reverse=True,
+    )
+    for module, (self_time, cumulative_time) in slowest_modules[: args.top]:
+        print(  # noqa: WPS421
+            "  {0}: self {1:.2f} ms, cumulative {2:.2f} ms".format(
+                module,
+                self_time / 1000,
+                cumulative_time / 1000,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark(main)
@@ -7,6 +7,7 @@ from fastapi import FastAPI
 from httpx import AsyncClient
 
 from app.db.repositories.articles import ArticlesRepository
+from app.db.repositories.comments import CommentsRepository
 from app.db.repositories.users import UsersRepository
 from app.models.domain.articles import Article
 from app.models.domain.users import UserInDB
@@ -27,6 +28,7 @@ def app() -> FastAPI:
 async def initialized_app(app: FastAPI) -> FastAPI:
     async with LifespanManager(app):
         app.state.pool = await FakeAsyncPGPool.create_pool(app.state.pool)
+        app.state.job_runner.pool = app.state.pool
         yield app
 
 
@@ -91,3 +93,37 @@ def authorized_client(
         **client.headers,
     }
     return client
+
+
+@pytest.fixture
+async def deleted_article(
+    app: FastAPI,
+    authorized_client: AsyncClient,
+    test_user: UserInDB,
+    pool: Pool,
+) -> Article:
+    async with pool.acquire() as connection:
+        articles_repo = ArticlesRepository(connection)
+        article = await articles_repo.create_article(
+            slug="popular-article",
+            title="Popular article",
+            description="tmp",
+            body="tmp",
+            author=test_user,
+            tags=["tag1", "tag2"],
+        )
+        for i in range(3):
+            fan = await UsersRepository(connection).create_user(
+                username=f"fan-{i}", email=f"fan-{i}@email.com", password="password"
+            )
+            await articles_repo.change_article_favorite_state(
+                slug=article.slug, user=fan, favorited=True
+            )
+            await CommentsRepository(connection).create_comment_for_article(
+                body="tmp", article=article, user=fan
+            )
+
+    await authorized_client.delete(
+        app.url_path_for("articles:delete-article", slug=article.slug)
+    )
+    return article
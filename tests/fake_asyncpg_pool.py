@@ -1,5 +1,5 @@
 from types import TracebackType
-from typing import Optional, Type
+from typing import List, Optional, Type
 
 from asyncpg import Connection
 from asyncpg.pool import Pool
@@ -44,3 +44,12 @@ class FakePoolAcquireContent:
         tb: Optional[TracebackType],
     ) -> None:
         pass
+
+
+class UnavailablePool:
+    def __init__(self) -> None:
+        self.attempts: List[int] = []
+
+    def acquire(self, *, timeout: Optional[float] = None) -> None:
+        self.attempts.append(len(self.attempts))
+        raise OSError("database is unavailable")
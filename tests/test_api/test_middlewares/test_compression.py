@@ -0,0 +1,101 @@
+import pytest
+from asyncpg.pool import Pool
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from app.db.repositories.articles import ArticlesRepository
+from app.models.domain.articles import Article
+from app.models.domain.users import UserInDB
+from app.models.schemas.articles import ListOfArticlesInResponse
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def many_articles(test_user: UserInDB, pool: Pool) -> None:
+    async with pool.acquire() as connection:
+        articles_repo = ArticlesRepository(connection)
+        for i in range(5):
+            await articles_repo.create_article(
+                slug=f"slug-{i}",
+                title="tmp",
+                description="tmp",
+                body="Long body " * 100,
+                author=test_user,
+            )
+
+
+@pytest.mark.parametrize("requests_count", (1, 2))
+async def test_large_responses_are_compressed(
+    app: FastAPI,
+    authorized_client: AsyncClient,
+    many_articles: None,
+    requests_count: int,
+) -> None:
+    for _ in range(requests_count):
+        response = await authorized_client.get(
+            app.url_path_for("articles:list-articles"),
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < len(response.content)
+    assert ListOfArticlesInResponse(**response.json()).articles_count == 5
+
+
+@pytest.mark.parametrize("requests_count", (1, 2))
+async def test_cached_anonymous_responses_are_served_precompressed(
+    app: FastAPI, client: AsyncClient, many_articles: None, requests_count: int
+) -> None:
+    for _ in range(requests_count):
+        response = await client.get(
+            app.url_path_for("articles:list-articles"),
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert ListOfArticlesInResponse(**response.json()).articles_count == 5
+
+
+async def test_etag_of_compressed_response_is_weak(
+    app: FastAPI, client: AsyncClient, many_articles: None
+) -> None:
+    article_url = app.url_path_for("articles:get-article", slug="slug-0")
+    plain_response = await client.get(
+        article_url, headers={"Accept-Encoding": "identity"}
+    )
+    response = await client.get(article_url, headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == "W/{0}".format(plain_response.headers["ETag"])
+
+    not_modified_response = await client.get(
+        article_url,
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]},
+    )
+    assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+async def test_responses_are_not_compressed_without_accept_encoding(
+    app: FastAPI, client: AsyncClient, many_articles: None
+) -> None:
+    response = await client.get(
+        app.url_path_for("articles:list-articles"),
+        headers={"Accept-Encoding": "identity"},
+    )
+
+    assert "Content-Encoding" not in response.headers
+    assert ListOfArticlesInResponse(**response.json()).articles_count == 5
+
+
+async def test_small_responses_are_not_compressed(
+    app: FastAPI, client: AsyncClient, test_article: Article
+) -> None:
+    response = await client.get(
+        app.url_path_for("tags:get-all"), headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert "Content-Encoding" not in response.headers
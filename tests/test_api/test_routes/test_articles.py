@@ -1,20 +1,52 @@
+import asyncio
+from typing import Any, List
+
 import pytest
 from asyncpg.pool import Pool
 from fastapi import FastAPI
 from httpx import AsyncClient
 from starlette import status
 
+from app.api.dependencies.articles import get_article_etag_from_path
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
 from app.db.errors import EntityDoesNotExist
 from app.db.repositories.articles import ArticlesRepository
+from app.db.repositories.feeds import FeedsRepository
 from app.db.repositories.profiles import ProfilesRepository
 from app.db.repositories.users import UsersRepository
-from app.models.domain.articles import Article
+from app.models.domain.articles import Article, ArticleReference
 from app.models.domain.users import UserInDB
-from app.models.schemas.articles import ArticleInResponse, ListOfArticlesInResponse
+from app.models.schemas.articles import (
+    MAX_ARTICLES_BATCH_SIZE,
+    ArticleInResponse,
+    ArticlesBatchInResponse,
+    FavoritesBatchInResponse,
+    ListOfArticlesInResponse,
+)
+from app.models.schemas.batches import BatchItemStatus
+from app.services.articles import make_article_etag
 
 pytestmark = pytest.mark.asyncio
 
 
+@pytest.mark.parametrize("title", ("Feed", "Search", "Batch"))
+async def test_article_slug_does_not_clash_with_articles_routes(
+    app: FastAPI, authorized_client: AsyncClient, title: str
+) -> None:
+    article_data = {"title": title, "body": "does not matter", "description": "tmp"}
+    response = await authorized_client.post(
+        app.url_path_for("articles:create-article"), json={"article": article_data}
+    )
+    slug = ArticleInResponse(**response.json()).article.slug
+    assert slug == "{0}-article".format(title.lower())
+
+    response = await authorized_client.get(
+        app.url_path_for("articles:get-article", slug=slug)
+    )
+    assert ArticleInResponse(**response.json()).article.title == title
+
+
 async def test_user_can_not_create_article_with_duplicated_slug(
     app: FastAPI, authorized_client: AsyncClient, test_article: Article
 ) -> None:
@@ -61,9 +93,36 @@ async def test_not_existing_tags_will_be_created_without_duplication(
     assert set(article.article.tags) == {"tag1", "tag2", "tag3"}
 
 
+async def test_created_article_matches_retrieved_article(
+    app: FastAPI, authorized_client: AsyncClient, test_user: UserInDB
+) -> None:
+    article_data = {
+        "title": "Test Slug",
+        "body": "does not matter",
+        "description": "¯\\_(ツ)_/¯",
+        "tagList": ["tag3", "tag1", "tag2", "tag1"],
+    }
+    created_response = await authorized_client.post(
+        app.url_path_for("articles:create-article"), json={"article": article_data}
+    )
+    created_article = ArticleInResponse(**created_response.json())
+
+    retrieved_response = await authorized_client.get(
+        app.url_path_for("articles:get-article", slug=created_article.article.slug)
+    )
+    retrieved_article = ArticleInResponse(**retrieved_response.json())
+
+    assert created_article == retrieved_article
+
+
 @pytest.mark.parametrize(
     "api_method, route_name",
-    (("GET", "articles:get-article"), ("PUT", "articles:update-article")),
+    (
+        ("GET", "articles:get-article"),
+        ("PUT", "articles:update-article"),
+        ("POST", "articles:mark-article-favorite"),
+        ("DELETE", "articles:unmark-article-favorite"),
+    ),
 )
 async def test_user_can_not_retrieve_not_existing_article(
     app: FastAPI,
@@ -78,6 +137,17 @@ async def test_user_can_not_retrieve_not_existing_article(
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+async def test_article_removed_after_version_check_is_not_found(
+    app: FastAPI, client: AsyncClient
+) -> None:
+    app.dependency_overrides[get_article_etag_from_path] = lambda: '"stale"'
+
+    response = await client.get(
+        app.url_path_for("articles:get-article", slug="wrong-slug")
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 async def test_user_can_retrieve_article_if_exists(
     app: FastAPI, authorized_client: AsyncClient, test_article: Article
 ) -> None:
@@ -124,6 +194,27 @@ async def test_user_can_update_article(
     )
 
 
+async def test_article_update_checks_author_on_the_loaded_article(
+    app: FastAPI,
+    authorized_client: AsyncClient,
+    test_article: Article,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def get_reference(*args: Any, **kwargs: Any) -> ArticleReference:
+        raise AssertionError("article reference is not needed for update")
+
+    monkeypatch.setattr(
+        ArticlesRepository, "get_article_reference_by_slug", get_reference
+    )
+
+    response = await authorized_client.put(
+        app.url_path_for("articles:update-article", slug=test_article.slug),
+        json={"article": {"title": "Updated Title"}},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+
 @pytest.mark.parametrize(
     "api_method, route_name",
     (("PUT", "articles:update-article"), ("DELETE", "articles:delete-article")),
@@ -174,6 +265,30 @@ async def test_user_can_delete_his_article(
             await articles_repo.get_article_by_slug(slug=test_article.slug)
 
 
+async def test_deleted_article_is_hidden_and_its_slug_can_be_reused(
+    app: FastAPI, authorized_client: AsyncClient, test_article: Article
+) -> None:
+    await authorized_client.delete(
+        app.url_path_for("articles:delete-article", slug=test_article.slug)
+    )
+
+    response = await authorized_client.get(app.url_path_for("articles:list-articles"))
+    assert ListOfArticlesInResponse(**response.json()).articles_count == 0
+
+    response = await authorized_client.post(
+        app.url_path_for("articles:create-article"),
+        json={
+            "article": {
+                "title": test_article.title,
+                "description": "tmp",
+                "body": "tmp",
+            }
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert ArticleInResponse(**response.json()).article.slug == test_article.slug
+
+
 @pytest.mark.parametrize(
     "api_method, route_name, favorite_state",
     (
@@ -194,13 +309,14 @@ async def test_user_can_change_favorite_state(
     if not favorite_state:
         async with pool.acquire() as connection:
             articles_repo = ArticlesRepository(connection)
-            await articles_repo.add_article_into_favorites(
-                article=test_article, user=test_user
+            await articles_repo.change_article_favorite_state(
+                slug=test_article.slug, user=test_user, favorited=True
             )
 
-    await authorized_client.request(
+    response = await authorized_client.request(
         api_method, app.url_path_for(route_name, slug=test_article.slug)
     )
+    changed_article = ArticleInResponse(**response.json())
 
     response = await authorized_client.get(
         app.url_path_for("articles:get-article", slug=test_article.slug)
@@ -208,6 +324,8 @@ async def test_user_can_change_favorite_state(
 
     article = ArticleInResponse(**response.json())
 
+    assert changed_article.article.favorited == favorite_state
+    assert changed_article.article.favorites_count == int(favorite_state)
     assert article.article.favorited == favorite_state
     assert article.article.favorites_count == int(favorite_state)
 
@@ -232,8 +350,8 @@ async def test_user_can_not_change_article_state_twice(
     if favorite_state:
         async with pool.acquire() as connection:
             articles_repo = ArticlesRepository(connection)
-            await articles_repo.add_article_into_favorites(
-                article=test_article, user=test_user
+            await articles_repo.change_article_favorite_state(
+                slug=test_article.slug, user=test_user, favorited=True
             )
 
     response = await authorized_client.request(
@@ -294,8 +412,8 @@ async def test_user_will_receive_only_following_articles(
                 username=f"user-{i}", email=f"user-{i}@email.com", password="password"
             )
             if i == 2:
-                await profiles_repo.add_user_into_followers(
-                    target_user=user, requested_user=test_user
+                await profiles_repo.change_following_state(
+                    username=user.username, requested_user=test_user, following=True
                 )
 
             for j in range(5):
@@ -339,8 +457,8 @@ async def test_user_receiving_feed_with_limit_and_offset(
                 username=f"user-{i}", email=f"user-{i}@email.com", password="password"
             )
             if i == 2:
-                await profiles_repo.add_user_into_followers(
-                    target_user=user, requested_user=test_user
+                await profiles_repo.change_following_state(
+                    username=user.username, requested_user=test_user, following=True
                 )
 
             for j in range(5):
@@ -367,6 +485,215 @@ async def test_user_receiving_feed_with_limit_and_offset(
     assert full_articles.articles[3:] == articles_from_response.articles
 
 
+async def test_user_receiving_feed_newest_articles_first(
+    app: FastAPI,
+    authorized_client: AsyncClient,
+    test_user: UserInDB,
+    pool: Pool,
+) -> None:
+    async with pool.acquire() as connection:
+        users_repo = UsersRepository(connection)
+        profiles_repo = ProfilesRepository(connection)
+        articles_repo = ArticlesRepository(connection)
+
+        for i in range(2):
+            user = await users_repo.create_user(
+                username=f"user-{i}", email=f"user-{i}@email.com", password="password"
+            )
+            await profiles_repo.change_following_state(
+                username=user.username, requested_user=test_user, following=True
+            )
+            for j in range(3):
+                await articles_repo.create_article(
+                    slug=f"slug-{j}-{i}",
+                    title="tmp",
+                    description="tmp",
+                    body="tmp",
+                    author=user,
+                )
+
+    response = await authorized_client.get(
+        app.url_path_for("articles:get-user-feed-articles")
+    )
+
+    articles_from_response = ListOfArticlesInResponse(**response.json())
+    assert [article.slug for article in articles_from_response.articles] == [
+        "slug-2-1",
+        "slug-1-1",
+        "slug-0-1",
+        "slug-2-0",
+        "slug-1-0",
+        "slug-0-0",
+    ]
+
+
+@pytest.fixture
+def fan_out_settings(app: FastAPI) -> AppSettings:
+    settings = get_app_settings().copy(
+        update={"feed_fan_out_enabled": True, "feed_max_items": 2}
+    )
+    app.dependency_overrides[get_app_settings] = lambda: settings
+    return settings
+
+
+@pytest.mark.parametrize("followers_threshold, result", ((10, 2), (0, 3)))
+async def test_fan_out_feed_receives_new_articles_of_followed_author(
+    app: FastAPI,
+    authorized_client: AsyncClient,
+    test_user: UserInDB,
+    pool: Pool,
+    fan_out_settings: AppSettings,
+    followers_threshold: int,
+    result: int,
+) -> None:
+    fan_out_settings.feed_fan_out_followers_threshold = followers_threshold
+
+    async with pool.acquire() as connection:
+        fan = await UsersRepository(connection).create_user(
+            username="fan", email="fan@email.com", password="password"
+        )
+        await ProfilesRepository(connection).change_following_state(
+            username=test_user.username, requested_user=fan, following=True
+        )
+
+    for i in range(3):
+        await authorized_client.post(
+            app.url_path_for("articles:create-article"),
+            json={
+                "article": {"title": f"Title {i}", "body": "tmp", "description": "tmp"}
+            },
+        )
+
+    async with pool.acquire() as connection:
+        feed = await ArticlesRepository(connection).get_articles_for_user_feed(
+            user=fan, materialized=True
+        )
+
+    assert len(feed) == result
+    assert all(article.author.username == test_user.username for article in feed)
+
+
+async def test_fan_out_feed_changes_with_following_state(
+    app: FastAPI,
+    authorized_client: AsyncClient,
+    pool: Pool,
+    fan_out_settings: AppSettings,
+) -> None:
+    async with pool.acquire() as connection:
+        author = await UsersRepository(connection).create_user(
+            username="author", email="author@email.com", password="password"
+        )
+        articles_repo = ArticlesRepository(connection)
+        for i in range(3):
+            await articles_repo.create_article(
+                slug=f"slug-{i}",
+                title="tmp",
+                description="tmp",
+                body="tmp",
+                author=author,
+            )
+
+    await authorized_client.post(
+        app.url_path_for("profiles:follow-user", username=author.username)
+    )
+    response = await authorized_client.get(
+        app.url_path_for("articles:get-user-feed-articles")
+    )
+    feed = ListOfArticlesInResponse(**response.json())
+    assert feed.articles_count == fan_out_settings.feed_max_items
+
+    await authorized_client.delete(
+        app.url_path_for("profiles:unsubscribe-from-user", username=author.username)
+    )
+    response = await authorized_client.get(
+        app.url_path_for("articles:get-user-feed-articles")
+    )
+    feed = ListOfArticlesInResponse(**response.json())
+    assert feed.articles_count == 0
+
+
+async def test_fan_out_feed_changes_with_batch_follows(
+    app: FastAPI,
+    authorized_client: AsyncClient,
+    pool: Pool,
+    fan_out_settings: AppSettings,
+) -> None:
+    async with pool.acquire() as connection:
+        author = await UsersRepository(connection).create_user(
+            username="author", email="author@email.com", password="password"
+        )
+        await ArticlesRepository(connection).create_article(
+            slug="slug", title="tmp", description="tmp", body="tmp", author=author
+        )
+
+    for following, result in ((True, 1), (False, 0)):
+        await authorized_client.post(
+            app.url_path_for("profiles:change-follows-batch"),
+            json={"follows": [{"username": author.username, "following": following}]},
+        )
+        response = await authorized_client.get(
+            app.url_path_for("articles:get-user-feed-articles")
+        )
+        assert ListOfArticlesInResponse(**response.json()).articles_count == result
+
+
+async def test_fan_out_feed_skips_authors_unfollowed_before_feed_update(
+    test_user: UserInDB, test_article: Article, pool: Pool
+) -> None:
+    async with pool.acquire() as connection:
+        fan = await UsersRepository(connection).create_user(
+            username="fan", email="fan@email.com", password="password"
+        )
+        profiles_repo = ProfilesRepository(connection)
+        for following in (True, False):
+            await profiles_repo.change_following_state(
+                username=test_user.username, requested_user=fan, following=following
+            )
+
+        # the feed jobs of the follow and the unfollow run in reverse order
+        feeds_repo = FeedsRepository(connection)
+        await feeds_repo.remove_author_from_feed(
+            user_id=fan.id_, author_username=test_user.username
+        )
+        await feeds_repo.add_author_into_feed(
+            user_id=fan.id_, author_username=test_user.username, max_items=2
+        )
+
+        assert not await ArticlesRepository(connection).get_articles_for_user_feed(
+            user=fan, materialized=True
+        )
+
+
+async def test_fan_out_feed_skips_deleted_articles_of_pulled_authors(
+    test_user: UserInDB, test_article: Article, pool: Pool
+) -> None:
+    async with pool.acquire() as connection:
+        fan = await UsersRepository(connection).create_user(
+            username="fan", email="fan@email.com", password="password"
+        )
+        await ProfilesRepository(connection).change_following_state(
+            username=test_user.username, requested_user=fan, following=True
+        )
+        await FeedsRepository(connection).fan_out_article(
+            article_id=test_article.id_,
+            author_id=test_user.id_,
+            max_items=2,
+            followers_threshold=0,
+        )
+        articles_repo = ArticlesRepository(connection)
+        assert await articles_repo.get_articles_for_user_feed(
+            user=fan, materialized=True
+        )
+
+        await articles_repo.delete_article(
+            article=ArticleReference(id_=test_article.id_, slug=test_article.slug),
+            author_id=test_user.id_,
+        )
+        assert not await articles_repo.get_articles_for_user_feed(
+            user=fan, materialized=True
+        )
+
+
 async def test_article_will_contain_only_attached_tags(
     app: FastAPI, authorized_client: AsyncClient, test_user: UserInDB, pool: Pool
 ) -> None:
@@ -527,9 +854,15 @@ async def test_filtering_by_favorited(
             slug=f"slug-2", title="tmp", description="tmp", body="tmp", author=test_user
         )
 
-        await articles_repo.add_article_into_favorites(article=article1, user=fan1)
-        await articles_repo.add_article_into_favorites(article=article1, user=fan2)
-        await articles_repo.add_article_into_favorites(article=article2, user=fan2)
+        await articles_repo.change_article_favorite_state(
+            slug=article1.slug, user=fan1, favorited=True
+        )
+        await articles_repo.change_article_favorite_state(
+            slug=article1.slug, user=fan2, favorited=True
+        )
+        await articles_repo.change_article_favorite_state(
+            slug=article2.slug, user=fan2, favorited=True
+        )
 
         for i in range(5, 10):
             await articles_repo.create_article(
@@ -573,3 +906,332 @@ async def test_filtering_with_limit_and_offset(
 
     articles_from_response = ListOfArticlesInResponse(**response.json())
     assert full_articles.articles[3:] == articles_from_response.articles
+
+
+async def test_articles_list_can_be_requested_without_bodies(
+    app: FastAPI,
+    client: AsyncClient,
+    test_article: Article,
+    token: str,
+    authorization_prefix: str,
+) -> None:
+    for headers in ({}, {"Authorization": f"{authorization_prefix} {token}"}):
+        response = await client.get(
+            app.url_path_for("articles:list-articles"),
+            params={"include_body": False},
+            headers=headers,
+        )
+
+        articles = response.json()["articles"]
+        assert len(articles) == 1
+        assert "body" not in articles[0]
+        assert articles[0]["slug"] == test_article.slug
+
+
+async def test_articles_batch_preserves_order_and_reports_missing_slugs(
+    app: FastAPI,
+    authorized_client: AsyncClient,
+    test_article: Article,
+    test_user: UserInDB,
+    pool: Pool,
+) -> None:
+    async with pool.acquire() as connection:
+        articles_repo = ArticlesRepository(connection)
+        await articles_repo.create_article(
+            slug="batch-article",
+            title="tmp",
+            description="tmp",
+            body="tmp",
+            author=test_user,
+        )
+        await articles_repo.change_article_favorite_state(
+            slug=test_article.slug, user=test_user, favorited=True
+        )
+
+    response = await authorized_client.get(
+        app.url_path_for("articles:get-articles-batch"),
+        params=[
+            ("slug", "batch-article"),
+            ("slug", "missing-article"),
+            ("slug", test_article.slug),
+            ("slug", "batch-article"),
+        ],
+    )
+
+    batch = ArticlesBatchInResponse(**response.json())
+    assert [article.slug for article in batch.articles] == [
+        "batch-article",
+        test_article.slug,
+    ]
+    assert batch.articles[1].favorited
+    assert batch.missing_slugs == ["missing-article"]
+
+
+async def test_articles_batch_size_is_limited(
+    app: FastAPI, client: AsyncClient
+) -> None:
+    response = await client.get(
+        app.url_path_for("articles:get-articles-batch"),
+        params=[("slug", f"slug-{i}") for i in range(MAX_ARTICLES_BATCH_SIZE + 1)],
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_user_can_change_favorites_in_batch(
+    app: FastAPI, authorized_client: AsyncClient, test_article: Article
+) -> None:
+    batches = (
+        (
+            [
+                {"slug": test_article.slug, "favorited": True},
+                {"slug": "missing-article", "favorited": True},
+                {"slug": test_article.slug, "favorited": True},
+            ],
+            [BatchItemStatus.applied, BatchItemStatus.not_found],
+        ),
+        (
+            [{"slug": test_article.slug, "favorited": True}],
+            [BatchItemStatus.unchanged],
+        ),
+        (
+            [{"slug": test_article.slug, "favorited": False}],
+            [BatchItemStatus.applied],
+        ),
+    )
+    for favorites, statuses in batches:
+        response = await authorized_client.post(
+            app.url_path_for("articles:change-favorites-batch"),
+            json={"favorites": favorites},
+        )
+        batch = FavoritesBatchInResponse(**response.json())
+        assert [favorite.status for favorite in batch.favorites] == statuses
+
+    response = await authorized_client.get(
+        app.url_path_for("articles:get-article", slug=test_article.slug)
+    )
+    article = ArticleInResponse(**response.json())
+    assert not article.article.favorited
+
+
+async def test_search_ranks_title_matches_above_body_matches(
+    app: FastAPI, client: AsyncClient, test_user: UserInDB, pool: Pool
+) -> None:
+    async with pool.acquire() as connection:
+        articles_repo = ArticlesRepository(connection)
+        await articles_repo.create_article(
+            slug="body-match",
+            title="tmp",
+            description="tmp",
+            body="notes about dragons",
+            author=test_user,
+        )
+        await articles_repo.create_article(
+            slug="title-match",
+            title="Dragons",
+            description="tmp",
+            body="tmp",
+            author=test_user,
+        )
+        await articles_repo.create_article(
+            slug="no-match",
+            title="tmp",
+            description="tmp",
+            body="tmp",
+            author=test_user,
+        )
+
+    response = await client.get(
+        app.url_path_for("articles:search-articles"), params={"q": "dragon"}
+    )
+
+    articles = ListOfArticlesInResponse(**response.json())
+    assert [article.slug for article in articles.articles] == [
+        "title-match",
+        "body-match",
+    ]
+
+
+async def test_search_paginates_with_cursor(
+    app: FastAPI, client: AsyncClient, test_user: UserInDB, pool: Pool
+) -> None:
+    async with pool.acquire() as connection:
+        articles_repo = ArticlesRepository(connection)
+
+        for i in range(3):
+            await articles_repo.create_article(
+                slug=f"search-{i}",
+                title="search me",
+                description="tmp",
+                body="tmp",
+                author=test_user,
+            )
+
+    slugs = []
+    params = {"q": "search", "limit": 2}
+    for _ in range(2):
+        response = await client.get(
+            app.url_path_for("articles:search-articles"), params=params
+        )
+        page = response.json()
+        slugs.extend(article["slug"] for article in page["articles"])
+        params["cursor"] = page["nextCursor"]
+
+    assert page["nextCursor"] is None
+    assert sorted(slugs) == ["search-0", "search-1", "search-2"]
+
+
+async def test_search_with_malformed_cursor_is_rejected(
+    app: FastAPI, client: AsyncClient
+) -> None:
+    response = await client.get(
+        app.url_path_for("articles:search-articles"),
+        params={"q": "anything", "cursor": "not a cursor"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_unchanged_article_is_not_sent_again(
+    app: FastAPI, authorized_client: AsyncClient, test_article: Article
+) -> None:
+    article_url = app.url_path_for("articles:get-article", slug=test_article.slug)
+    response = await authorized_client.get(article_url)
+    etag = response.headers["ETag"]
+
+    not_modified_response = await authorized_client.get(
+        article_url, headers={"If-None-Match": etag}
+    )
+    assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified_response.headers["ETag"] == etag
+    assert not_modified_response.content == b""
+
+    await authorized_client.post(
+        app.url_path_for("articles:mark-article-favorite", slug=test_article.slug)
+    )
+    modified_response = await authorized_client.get(
+        article_url, headers={"If-None-Match": etag}
+    )
+    assert modified_response.status_code == status.HTTP_200_OK
+    assert modified_response.headers["ETag"] != etag
+    assert ArticleInResponse(**modified_response.json()).article.favorited
+
+
+async def test_article_etag_is_made_from_the_loaded_article(
+    app: FastAPI,
+    client: AsyncClient,
+    test_article: Article,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stale_article = test_article.copy(update={"favorites_count": 5})
+
+    async def get_stale_article(*args: Any, **kwargs: Any) -> Article:
+        return stale_article
+
+    article_url = app.url_path_for("articles:get-article", slug=test_article.slug)
+    fresh_etag = (await client.get(article_url)).headers["ETag"]
+    monkeypatch.setattr(ArticlesRepository, "get_article_by_slug", get_stale_article)
+    stale_response = await client.get(article_url)
+    monkeypatch.undo()
+
+    stale_etag = stale_response.headers["ETag"]
+    assert stale_etag == make_article_etag(stale_article)
+    assert stale_etag != fresh_etag
+    response = await client.get(article_url, headers={"If-None-Match": stale_etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] == fresh_etag
+
+
+async def test_anonymous_articles_list_is_cached_until_articles_change(
+    app: FastAPI,
+    client: AsyncClient,
+    test_user: UserInDB,
+    token: str,
+    authorization_prefix: str,
+    pool: Pool,
+) -> None:
+    list_url = app.url_path_for("articles:list-articles")
+    authorization_headers = {"Authorization": f"{authorization_prefix} {token}"}
+    await client.get(list_url)
+
+    async with pool.acquire() as connection:
+        articles_repo = ArticlesRepository(connection)
+        await articles_repo.create_article(
+            slug="not-invalidated",
+            title="tmp",
+            description="tmp",
+            body="tmp",
+            author=test_user,
+        )
+
+    cached_response = await client.get(list_url)
+    assert ListOfArticlesInResponse(**cached_response.json()).articles_count == 0
+
+    authorized_response = await client.get(list_url, headers=authorization_headers)
+    assert ListOfArticlesInResponse(**authorized_response.json()).articles_count == 1
+
+    await client.post(
+        app.url_path_for("articles:create-article"),
+        json={"article": {"title": "New", "description": "tmp", "body": "tmp"}},
+        headers=authorization_headers,
+    )
+
+    invalidated_response = await client.get(list_url)
+    assert ListOfArticlesInResponse(**invalidated_response.json()).articles_count == 2
+
+
+async def test_concurrent_article_loads_are_coalesced(
+    test_article: Article, test_user: UserInDB, pool: Pool
+) -> None:
+    async with pool.acquire() as connection:
+        articles_repo = ArticlesRepository(connection)
+        await articles_repo.change_article_favorite_state(
+            slug=test_article.slug, user=test_user, favorited=True
+        )
+
+        # all loads share one connection, so they would fail
+        # with "another operation is in progress" if not coalesced
+        anonymous_article, *other_articles = await asyncio.gather(
+            *(
+                articles_repo.get_article_by_slug(slug=test_article.slug)
+                for _ in range(5)
+            )
+        )
+        user_article = await articles_repo.get_article_by_slug(
+            slug=test_article.slug, requested_user=test_user
+        )
+
+    assert all(article == anonymous_article for article in other_articles)
+    assert not anonymous_article.favorited
+    assert user_article.favorited
+    assert user_article.favorites_count == anonymous_article.favorites_count == 1
+
+
+async def test_article_loads_are_forgotten_on_invalidation(
+    initialized_app: FastAPI,
+    pool: Pool,
+    test_article: Article,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    started_loads: List[str] = []
+    loads_released = asyncio.Event()
+
+    async def load_article(repo: ArticlesRepository, *, slug: str) -> Article:
+        started_loads.append(slug)
+        await loads_released.wait()
+        return test_article
+
+    monkeypatch.setattr(ArticlesRepository, "_load_article_by_slug", load_article)
+    async with pool.acquire() as connection:
+        articles_repo = ArticlesRepository(connection)
+        first_load = asyncio.ensure_future(
+            articles_repo.get_article_by_slug(slug=test_article.slug)
+        )
+        await asyncio.sleep(0)
+        initialized_app.state.invalidation_bus.invalidate("favorites")
+        second_load = asyncio.ensure_future(
+            articles_repo.get_article_by_slug(slug=test_article.slug)
+        )
+        await asyncio.sleep(0)
+        loads_released.set()
+        await asyncio.gather(first_load, second_load)
+
+    assert started_loads == [test_article.slug, test_article.slug]
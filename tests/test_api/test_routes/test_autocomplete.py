@@ -0,0 +1,116 @@
+import pytest
+from asyncpg.pool import Pool
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.db.repositories.articles import ArticlesRepository
+from app.db.repositories.users import UsersRepository
+from app.models.domain.users import UserInDB
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_tags_autocomplete_ranks_prefix_matches_first(
+    app: FastAPI, client: AsyncClient, test_user: UserInDB, pool: Pool
+) -> None:
+    async with pool.acquire() as conn:
+        await ArticlesRepository(conn).create_article(
+            slug="tags",
+            title="tmp",
+            description="tmp",
+            body="tmp",
+            author=test_user,
+            tags=["python", "pythonic", "cpython", "rust"],
+        )
+
+    response = await client.get(
+        app.url_path_for("autocomplete:tags"), params={"q": "pyth"}
+    )
+
+    tags = response.json()["tags"]
+    assert tags[:2] == ["python", "pythonic"]
+    assert "rust" not in tags
+
+
+async def test_tags_autocomplete_matches_misspelled_tags(
+    app: FastAPI, client: AsyncClient, test_user: UserInDB, pool: Pool
+) -> None:
+    async with pool.acquire() as conn:
+        await ArticlesRepository(conn).create_article(
+            slug="tags",
+            title="tmp",
+            description="tmp",
+            body="tmp",
+            author=test_user,
+            tags=["javascript", "java"],
+        )
+
+    response = await client.get(
+        app.url_path_for("autocomplete:tags"), params={"q": "javscript"}
+    )
+
+    assert response.json()["tags"][0] == "javascript"
+
+
+async def test_tags_autocomplete_does_not_treat_prefix_as_pattern(
+    app: FastAPI, client: AsyncClient, test_user: UserInDB, pool: Pool
+) -> None:
+    async with pool.acquire() as conn:
+        await ArticlesRepository(conn).create_article(
+            slug="tags",
+            title="tmp",
+            description="tmp",
+            body="tmp",
+            author=test_user,
+            tags=["a_b", "axb"],
+        )
+
+    response = await client.get(
+        app.url_path_for("autocomplete:tags"), params={"q": "a_"}
+    )
+
+    assert response.json()["tags"] == ["a_b"]
+
+
+async def test_usernames_autocomplete_results_are_limited(
+    app: FastAPI, client: AsyncClient, test_user: UserInDB, pool: Pool
+) -> None:
+    async with pool.acquire() as conn:
+        users_repo = UsersRepository(conn)
+        for i in range(3):
+            await users_repo.create_user(
+                username=f"username-{i}",
+                email=f"user-{i}@email.com",
+                password="password",
+            )
+
+    response = await client.get(
+        app.url_path_for("autocomplete:usernames"),
+        params={"q": "username-", "limit": 2},
+    )
+
+    assert response.json()["usernames"] == ["username-0", "username-1"]
+
+
+async def test_autocomplete_serves_hot_prefixes_from_cache(
+    app: FastAPI, client: AsyncClient, test_user: UserInDB, pool: Pool
+) -> None:
+    response = await client.get(
+        app.url_path_for("autocomplete:tags"), params={"q": "cached"}
+    )
+    assert response.json()["tags"] == []
+
+    async with pool.acquire() as conn:
+        await ArticlesRepository(conn).create_article(
+            slug="tags",
+            title="tmp",
+            description="tmp",
+            body="tmp",
+            author=test_user,
+            tags=["cached"],
+        )
+
+    response = await client.get(
+        app.url_path_for("autocomplete:tags"), params={"q": "Cached"}
+    )
+    assert response.json()["tags"] == []
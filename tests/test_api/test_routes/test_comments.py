@@ -94,3 +94,38 @@ async def test_user_will_receive_error_for_not_existing_comment(
     )
 
     assert not_found_response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_user_will_receive_error_for_comments_of_not_existing_article(
+    app: FastAPI, authorized_client: AsyncClient
+) -> None:
+    not_found_response = await authorized_client.get(
+        app.url_path_for("comments:get-comments-for-article", slug="wrong-slug")
+    )
+
+    assert not_found_response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_unchanged_comments_are_not_sent_again(
+    app: FastAPI, authorized_client: AsyncClient, test_article: Article
+) -> None:
+    comments_url = app.url_path_for(
+        "comments:get-comments-for-article", slug=test_article.slug
+    )
+    response = await authorized_client.get(comments_url)
+    etag = response.headers["ETag"]
+
+    not_modified_response = await authorized_client.get(
+        comments_url, headers={"If-None-Match": etag}
+    )
+    assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    await authorized_client.post(
+        app.url_path_for("comments:create-comment-for-article", slug=test_article.slug),
+        json={"comment": {"body": "comment"}},
+    )
+    modified_response = await authorized_client.get(
+        comments_url, headers={"If-None-Match": etag}
+    )
+    assert modified_response.status_code == status.HTTP_200_OK
+    assert len(ListOfCommentsInResponse(**modified_response.json()).comments) == 1
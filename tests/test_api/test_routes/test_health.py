@@ -0,0 +1,139 @@
+import inspect
+import time
+from os import environ
+from typing import Optional
+
+import asyncpg
+import pytest
+from asyncpg.pool import Pool
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette.status import HTTP_200_OK, HTTP_503_SERVICE_UNAVAILABLE
+
+from app.api.dependencies.health import get_database_health_monitor
+from app.core.config import get_app_settings
+from app.core.events import create_start_app_handler, create_stop_app_handler
+from app.core.warm_up import WARM_UP_ROUTES
+from app.db.events import prepare_statements
+from app.db.health import DatabaseHealthMonitor
+from app.models.schemas.health import HealthInResponse, HealthStatus
+
+pytestmark = pytest.mark.asyncio
+
+PREPARED_STATEMENTS_QUERY = "SELECT statement FROM pg_prepared_statements"
+
+
+@pytest.fixture
+def monitor(app: FastAPI, pool: Pool) -> DatabaseHealthMonitor:
+    monitor = DatabaseHealthMonitor(pool)
+    app.dependency_overrides[get_database_health_monitor] = lambda: monitor
+    return monitor
+
+
+async def test_liveness_does_not_depend_on_database(
+    app: FastAPI, client: AsyncClient, monitor: DatabaseHealthMonitor
+) -> None:
+    response = await client.get(app.url_path_for("health:live"))
+
+    assert response.status_code == HTTP_200_OK
+    assert HealthInResponse(**response.json()).status == HealthStatus.alive
+
+
+async def test_application_is_ready_after_startup(
+    app: FastAPI, client: AsyncClient
+) -> None:
+    response = await client.get(app.url_path_for("health:ready"))
+
+    health = HealthInResponse(**response.json())
+    assert response.status_code == HTTP_200_OK
+    assert health.status in {HealthStatus.ready, HealthStatus.degraded}
+    assert health.database
+
+
+async def test_application_is_not_ready_until_started(
+    app: FastAPI, client: AsyncClient, monitor: DatabaseHealthMonitor
+) -> None:
+    app.state.ready = False
+
+    response = await client.get(app.url_path_for("health:ready"))
+
+    assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+    assert HealthInResponse(**response.json()).status == HealthStatus.starting
+
+
+@pytest.mark.parametrize(
+    "check_age, pool_wait, status_code, health_status",
+    (
+        (0, 0, HTTP_200_OK, HealthStatus.ready),
+        (0, 1, HTTP_200_OK, HealthStatus.degraded),
+        (60, 0, HTTP_503_SERVICE_UNAVAILABLE, HealthStatus.unavailable),
+        (None, 0, HTTP_503_SERVICE_UNAVAILABLE, HealthStatus.unavailable),
+    ),
+)
+async def test_readiness_uses_last_database_check(
+    app: FastAPI,
+    client: AsyncClient,
+    monitor: DatabaseHealthMonitor,
+    check_age: Optional[float],
+    pool_wait: float,
+    status_code: int,
+    health_status: HealthStatus,
+) -> None:
+    if check_age is not None:
+        monitor.checked_at = time.monotonic() - check_age
+    monitor.pool_wait = pool_wait
+
+    response = await client.get(app.url_path_for("health:ready"))
+
+    assert response.status_code == status_code
+    assert HealthInResponse(**response.json()).status == health_status
+
+
+async def test_application_is_warmed_up_before_it_is_ready(app: FastAPI) -> None:
+    settings = get_app_settings().copy(update={"warm_up_enabled": True})
+
+    await create_start_app_handler(app, settings)()
+    try:
+        async with app.state.pool.acquire() as connection:
+            prepared_statements = await connection.fetch(PREPARED_STATEMENTS_QUERY)
+
+        assert app.state.ready
+        assert app.openapi_schema
+        assert len(app.state.response_cache) == len(WARM_UP_ROUTES)
+        assert len(prepared_statements) > 1
+    finally:
+        await create_stop_app_handler(app)()
+
+    assert not app.state.ready
+
+
+async def test_statements_that_can_not_be_prepared_are_skipped() -> None:
+    connection = await asyncpg.connect(environ["DATABASE_URL"])
+    try:
+        await prepare_statements(
+            connection,
+            statements=["SELECT 1", "SELECT unknown_column FROM users"],
+        )
+        prepared_statements = await connection.fetch(PREPARED_STATEMENTS_QUERY)
+    finally:
+        await connection.close()
+
+    assert "SELECT 1" in {row["statement"] for row in prepared_statements}
+
+
+async def test_prepared_statements_are_reused_by_queries() -> None:
+    # prepare_statements relies on the private Connection._prepare of the
+    # pinned asyncpg version, since the public prepare() skips the cache
+    assert "use_cache" in inspect.signature(asyncpg.Connection._prepare).parameters
+
+    connection = await asyncpg.connect(environ["DATABASE_URL"])
+    try:
+        await prepare_statements(connection, statements=["SELECT $1::integer"])
+        await connection.fetch(PREPARED_STATEMENTS_QUERY)
+        prepared_statements = await connection.fetch(PREPARED_STATEMENTS_QUERY)
+        await connection.fetchval("SELECT $1::integer", 1)
+        reused_statements = await connection.fetch(PREPARED_STATEMENTS_QUERY)
+    finally:
+        await connection.close()
+
+    assert len(reused_statements) == len(prepared_statements)
@@ -4,10 +4,12 @@ from fastapi import FastAPI
 from httpx import AsyncClient
 from starlette import status
 
+from app.api.dependencies.profiles import get_profile_etag_from_path
 from app.db.repositories.profiles import ProfilesRepository
 from app.db.repositories.users import UsersRepository
 from app.models.domain.users import UserInDB
-from app.models.schemas.profiles import ProfileInResponse
+from app.models.schemas.batches import BatchItemStatus
+from app.models.schemas.profiles import FollowsBatchInResponse, ProfileInResponse
 
 pytestmark = pytest.mark.asyncio
 
@@ -54,8 +56,8 @@ async def test_user_that_follows_another_will_receive_profile_with_follow(
         )
 
         profiles_repo = ProfilesRepository(conn)
-        await profiles_repo.add_user_into_followers(
-            target_user=user, requested_user=test_user
+        await profiles_repo.change_following_state(
+            username=user.username, requested_user=test_user, following=True
         )
 
     response = await authorized_client.get(
@@ -83,6 +85,17 @@ async def test_user_can_not_retrieve_not_existing_profile(
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+async def test_profile_removed_after_version_check_is_not_found(
+    app: FastAPI, client: AsyncClient
+) -> None:
+    app.dependency_overrides[get_profile_etag_from_path] = lambda: '"stale"'
+
+    response = await client.get(
+        app.url_path_for("profiles:get-profile", username="not_existing_user")
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.parametrize(
     "api_method, route_name, following",
     (
@@ -109,8 +122,8 @@ async def test_user_can_change_following_for_another_user(
 
         if not following:
             profiles_repo = ProfilesRepository(conn)
-            await profiles_repo.add_user_into_followers(
-                target_user=user, requested_user=test_user
+            await profiles_repo.change_following_state(
+                username=user.username, requested_user=test_user, following=True
             )
 
     change_following_response = await authorized_client.request(
@@ -152,8 +165,8 @@ async def test_user_can_not_change_following_state_to_the_same_twice(
 
         if following:
             profiles_repo = ProfilesRepository(conn)
-            await profiles_repo.add_user_into_followers(
-                target_user=user, requested_user=test_user
+            await profiles_repo.change_following_state(
+                username=user.username, requested_user=test_user, following=True
             )
 
     response = await authorized_client.request(
@@ -179,3 +192,80 @@ async def test_user_can_not_change_following_state_for_him_self(
     )
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_unchanged_profile_is_not_sent_again(
+    app: FastAPI, authorized_client: AsyncClient, pool: Pool
+) -> None:
+    async with pool.acquire() as conn:
+        users_repo = UsersRepository(conn)
+        user = await users_repo.create_user(
+            username="user_for_following",
+            email="test-for-following@email.com",
+            password="password",
+        )
+
+    profile_url = app.url_path_for("profiles:get-profile", username=user.username)
+    response = await authorized_client.get(profile_url)
+    etag = response.headers["ETag"]
+
+    not_modified_response = await authorized_client.get(
+        profile_url, headers={"If-None-Match": etag}
+    )
+    assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    await authorized_client.post(
+        app.url_path_for("profiles:follow-user", username=user.username)
+    )
+    modified_response = await authorized_client.get(
+        profile_url, headers={"If-None-Match": etag}
+    )
+    assert modified_response.status_code == status.HTTP_200_OK
+    assert ProfileInResponse(**modified_response.json()).profile.following
+
+
+async def test_user_can_change_follows_in_batch(
+    app: FastAPI, authorized_client: AsyncClient, test_user: UserInDB, pool: Pool
+) -> None:
+    async with pool.acquire() as conn:
+        users_repo = UsersRepository(conn)
+        user = await users_repo.create_user(
+            username="user_for_following",
+            email="test-for-following@email.com",
+            password="password",
+        )
+
+    batches = (
+        (
+            [
+                {"username": user.username, "following": True},
+                {"username": test_user.username, "following": True},
+                {"username": "missing-user", "following": True},
+            ],
+            [
+                BatchItemStatus.applied,
+                BatchItemStatus.rejected,
+                BatchItemStatus.not_found,
+            ],
+        ),
+        (
+            [{"username": user.username, "following": True}],
+            [BatchItemStatus.unchanged],
+        ),
+        (
+            [{"username": user.username, "following": False}],
+            [BatchItemStatus.applied],
+        ),
+    )
+    for follows, statuses in batches:
+        response = await authorized_client.post(
+            app.url_path_for("profiles:change-follows-batch"),
+            json={"follows": follows},
+        )
+        batch = FollowsBatchInResponse(**response.json())
+        assert [follow.status for follow in batch.follows] == statuses
+
+    response = await authorized_client.get(
+        app.url_path_for("profiles:get-profile", username=user.username)
+    )
+    assert not ProfileInResponse(**response.json()).profile.following
@@ -3,7 +3,8 @@ from asyncpg.pool import Pool
 from fastapi import FastAPI
 from httpx import AsyncClient
 
-from app.db.repositories.tags import TagsRepository
+from app.db.repositories.articles import ArticlesRepository
+from app.models.domain.users import UserInDB
 
 pytestmark = pytest.mark.asyncio
 
@@ -14,15 +15,45 @@ async def test_empty_list_when_no_tags_exist(app: FastAPI, client: AsyncClient)
 
 
 async def test_list_of_tags_when_tags_exist(
-    app: FastAPI, client: AsyncClient, pool: Pool
+    app: FastAPI, client: AsyncClient, test_user: UserInDB, pool: Pool
 ) -> None:
     tags = ["tag1", "tag2", "tag3", "tag4", "tag1"]
 
     async with pool.acquire() as conn:
-        tags_repo = TagsRepository(conn)
-        await tags_repo.create_tags_that_dont_exist(tags=tags)
+        await ArticlesRepository(conn).create_article(
+            slug="tags",
+            title="tmp",
+            description="tmp",
+            body="tmp",
+            author=test_user,
+            tags=tags,
+        )
 
     response = await client.get(app.url_path_for("tags:get-all"))
     tags_from_response = response.json()["tags"]
     assert len(tags_from_response) == len(set(tags))
     assert all((tag in tags for tag in tags_from_response))
+
+
+async def test_anonymous_tags_list_is_cached(
+    app: FastAPI, client: AsyncClient, test_user: UserInDB, pool: Pool
+) -> None:
+    await client.get(app.url_path_for("tags:get-all"))
+
+    async with pool.acquire() as conn:
+        await ArticlesRepository(conn).create_article(
+            slug="tags",
+            title="tmp",
+            description="tmp",
+            body="tmp",
+            author=test_user,
+            tags=["tag"],
+        )
+
+    cached_response = await client.get(app.url_path_for("tags:get-all"))
+    assert cached_response.json() == {"tags": []}
+
+    authorized_response = await client.get(
+        app.url_path_for("tags:get-all"), headers={"Authorization": "Token token"}
+    )
+    assert authorized_response.json() == {"tags": ["tag"]}
@@ -0,0 +1,72 @@
+import asyncio
+from typing import Callable, Union
+
+import pytest
+from asyncpg.pool import Pool
+
+from app.db.health import DatabaseHealthMonitor
+from app.db.jobs import JobRunner
+from app.db.purger import DeletedArticlesPurger
+from app.models.domain.articles import Article
+from tests.fake_asyncpg_pool import UnavailablePool
+
+pytestmark = pytest.mark.asyncio
+
+BackgroundWorker = Union[DeletedArticlesPurger, DatabaseHealthMonitor, JobRunner]
+
+
+def create_purger(pool: Pool) -> DeletedArticlesPurger:
+    return DeletedArticlesPurger(pool, interval=0.01, pause=0)
+
+
+def create_health_monitor(pool: Pool) -> DatabaseHealthMonitor:
+    return DatabaseHealthMonitor(pool, interval=0.01)
+
+
+def create_job_runner(pool: Pool) -> JobRunner:
+    return JobRunner(pool, durable=True, workers=1, poll_interval=0.01)
+
+
+@pytest.mark.parametrize(
+    "create_worker",
+    (create_purger, create_health_monitor, create_job_runner),
+)
+async def test_workers_keep_running_when_database_is_unavailable(
+    create_worker: Callable[[Pool], BackgroundWorker]
+) -> None:
+    unavailable_pool = UnavailablePool()
+    worker = create_worker(unavailable_pool)  # type: ignore
+    worker.start()
+
+    await asyncio.wait_for(
+        _wait_until(lambda: len(unavailable_pool.attempts) >= 2),
+        timeout=5,
+    )
+    await worker.stop()
+
+
+@pytest.mark.parametrize(
+    "create_worker, worked",
+    (
+        (create_purger, lambda purger: purger.purged_count == 3 + 2 + 3 + 1),
+        (create_health_monitor, lambda monitor: monitor.checked_at is not None),
+    ),
+)
+async def test_workers_run_in_background(
+    pool: Pool,
+    deleted_article: Article,
+    create_worker: Callable[[Pool], BackgroundWorker],
+    worked: Callable[[BackgroundWorker], bool],
+) -> None:
+    worker = create_worker(pool)
+    await worker.stop()
+
+    worker.start()
+
+    await asyncio.wait_for(_wait_until(lambda: worked(worker)), timeout=5)
+    await worker.stop()
+
+
+async def _wait_until(predicate: Callable[[], bool]) -> None:
+    while not predicate():
+        await asyncio.sleep(0.01)
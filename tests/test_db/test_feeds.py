@@ -0,0 +1,70 @@
+import runpy
+import sys
+from typing import Dict, List
+
+import pytest
+from asyncpg.pool import Pool
+
+from app.backfill_feeds import BACKFILL_BATCH_SIZE, backfill_feeds
+from app.core.config import get_app_settings
+from app.db.repositories.articles import ArticlesRepository
+from app.db.repositories.feeds import FeedsRepository
+from app.db.repositories.profiles import ProfilesRepository
+from app.db.repositories.users import UsersRepository
+from app.models.domain.users import UserInDB
+
+
+# the event loop fixture closes the loop left by async tests before asyncio.run
+@pytest.mark.usefixtures("event_loop")
+def test_feeds_are_backfilled_by_entry_point(monkeypatch: pytest.MonkeyPatch) -> None:
+    backfills: List[Dict[str, int]] = []
+
+    async def fake_backfill_feeds(self: FeedsRepository, **kwargs: int) -> None:
+        assert await self.connection.fetchval("SELECT 1") == 1
+        backfills.append(kwargs)
+
+    monkeypatch.setattr(FeedsRepository, "backfill_feeds", fake_backfill_feeds)
+    monkeypatch.delitem(sys.modules, "app.backfill_feeds", raising=False)
+
+    runpy.run_module("app.backfill_feeds", run_name="__main__")
+
+    assert backfills == [
+        {
+            "after_user_id": 0,
+            "limit": BACKFILL_BATCH_SIZE,
+            "max_items": get_app_settings().feed_max_items,
+        }
+    ]
+
+
+async def test_feeds_are_backfilled_for_existing_follows(
+    test_user: UserInDB, pool: Pool
+) -> None:
+    async with pool.acquire() as connection:
+        articles_repo = ArticlesRepository(connection)
+        for i in range(3):
+            await articles_repo.create_article(
+                slug=f"slug-{i}",
+                title="tmp",
+                description="tmp",
+                body="tmp",
+                author=test_user,
+            )
+
+        fans = []
+        for i in range(2):
+            fan = await UsersRepository(connection).create_user(
+                username=f"fan-{i}", email=f"fan-{i}@email.com", password="password"
+            )
+            await ProfilesRepository(connection).change_following_state(
+                username=test_user.username, requested_user=fan, following=True
+            )
+            fans.append(fan)
+
+        await backfill_feeds(connection, max_items=2, batch_size=1)
+
+        for fan in fans:
+            feed = await articles_repo.get_articles_for_user_feed(
+                user=fan, materialized=True
+            )
+            assert [article.slug for article in feed] == ["slug-2", "slug-1"]
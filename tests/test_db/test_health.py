@@ -0,0 +1,68 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import pytest
+from fastapi import FastAPI
+
+from app.db.health import DatabaseHealthMonitor
+from tests.fake_asyncpg_pool import UnavailablePool
+
+pytestmark = pytest.mark.asyncio
+
+
+class SaturatedPool:
+    def acquire(self, *, timeout: float) -> None:
+        raise asyncio.TimeoutError
+
+    def get_size(self) -> int:
+        return 10
+
+    def get_idle_size(self) -> int:
+        return 0
+
+
+class SlowConnection:
+    async def fetchval(self, query: str, *, timeout: float) -> None:
+        raise asyncio.TimeoutError
+
+
+class SlowDatabasePool:
+    @asynccontextmanager
+    async def acquire(self, *, timeout: float) -> AsyncIterator[SlowConnection]:
+        yield SlowConnection()
+
+
+async def test_database_is_checked_on_startup(initialized_app: FastAPI) -> None:
+    monitor = initialized_app.state.database_health_monitor
+
+    assert monitor.check_age is not None
+    assert monitor.pool_size >= monitor.pool_idle_size > 0
+
+
+async def test_failed_check_resets_last_check_time() -> None:
+    monitor = DatabaseHealthMonitor(UnavailablePool())  # type: ignore
+    monitor.checked_at = 0
+
+    await monitor.check()
+
+    assert monitor.check_age is None
+
+
+async def test_saturated_pool_is_reported_as_slow_database() -> None:
+    monitor = DatabaseHealthMonitor(SaturatedPool(), interval=1)  # type: ignore
+
+    await monitor.check()
+
+    assert monitor.check_age is not None
+    assert monitor.pool_wait == 1
+    assert monitor.pool_idle_size == 0
+
+
+async def test_query_timeout_resets_last_check_time() -> None:
+    monitor = DatabaseHealthMonitor(SlowDatabasePool())  # type: ignore
+    monitor.checked_at = 0
+
+    await monitor.check()
+
+    assert monitor.check_age is None
@@ -0,0 +1,126 @@
+import asyncio
+import uuid
+from functools import partial
+from typing import AsyncGenerator, Callable, List
+
+import asyncpg
+import pytest
+
+from app.core.config import get_app_settings
+from app.db.invalidation import INVALIDATION_CHANNEL, InvalidationBus
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def database_url() -> str:
+    return str(get_app_settings().database_url)
+
+
+@pytest.fixture
+def application_name() -> str:
+    return uuid.uuid4().hex
+
+
+@pytest.fixture
+def invalidations() -> List[str]:
+    return []
+
+
+@pytest.fixture
+async def bus(
+    database_url: str, application_name: str, invalidations: List[str]
+) -> AsyncGenerator[InvalidationBus, None]:
+    invalidation_bus = InvalidationBus(
+        database_url,
+        application_name=application_name,
+        reconnect_delay=0.01,
+    )
+    invalidation_bus.subscribe("articles", partial(invalidations.append, "articles"))
+    invalidation_bus.subscribe("users", partial(invalidations.append, "users"))
+    invalidation_bus.start()
+    await asyncio.wait_for(invalidation_bus.connected.wait(), timeout=5)
+    yield invalidation_bus
+    await invalidation_bus.stop()
+
+
+async def test_bus_flushes_subscribers_on_connect(
+    bus: InvalidationBus, invalidations: List[str]
+) -> None:
+    assert sorted(invalidations) == ["articles", "users"]
+
+
+async def test_notifications_invalidate_subscribers_by_key_prefix(
+    bus: InvalidationBus, database_url: str, invalidations: List[str]
+) -> None:
+    invalidations.clear()
+
+    conn = await asyncpg.connect(database_url)
+    try:
+        await conn.execute(
+            "SELECT pg_notify($1, 'articles_to_tags')", INVALIDATION_CHANNEL
+        )
+    finally:
+        await conn.close()
+
+    await asyncio.wait_for(_wait_until(lambda: bool(invalidations)), timeout=5)
+
+    assert invalidations == ["articles"]
+
+
+async def test_bus_reconnects_and_flushes_after_connection_loss(
+    bus: InvalidationBus,
+    database_url: str,
+    application_name: str,
+    invalidations: List[str],
+) -> None:
+    invalidations.clear()
+
+    conn = await asyncpg.connect(database_url)
+    try:
+        await conn.execute(
+            """
+            SELECT pg_terminate_backend(pid)
+            FROM pg_stat_activity
+            WHERE application_name = $1
+            """,
+            application_name,
+        )
+    finally:
+        await conn.close()
+
+    await asyncio.wait_for(
+        _wait_until(lambda: "users" in invalidations and bus.connected.is_set()),
+        timeout=5,
+    )
+
+    assert set(invalidations) == {"articles", "users"}
+
+
+async def test_bus_checks_connection_health(database_url: str) -> None:
+    invalidation_bus = InvalidationBus(database_url, health_check_interval=0.01)
+    invalidation_bus.start()
+    await asyncio.wait_for(invalidation_bus.connected.wait(), timeout=5)
+    await asyncio.sleep(0.1)
+
+    assert invalidation_bus.connected.is_set()
+    await invalidation_bus.stop()
+
+
+async def test_bus_keeps_retrying_when_database_is_unavailable() -> None:
+    invalidation_bus = InvalidationBus(
+        "postgresql://postgres@localhost:1/postgres",
+        reconnect_delay=0.01,
+    )
+    await invalidation_bus.stop()
+
+    invalidation_bus.start()
+    await asyncio.sleep(0.1)
+
+    assert not invalidation_bus.connected.is_set()
+    await invalidation_bus.stop()
+
+
+async def _wait_until(predicate: Callable[[], bool]) -> None:
+    while not predicate():
+        await asyncio.sleep(0.01)
@@ -0,0 +1,155 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+from asyncpg import Connection
+from asyncpg.pool import Pool
+
+from app.db import feed_jobs
+from app.db.jobs import JobRunner
+from app.db.repositories.profiles import ProfilesRepository
+from app.db.repositories.users import UsersRepository
+from app.models.domain.articles import Article
+from app.models.domain.users import UserInDB
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def calls() -> List[Dict[str, Any]]:
+    return []
+
+
+@pytest.fixture
+def runner_factory(pool: Pool, calls: List[Dict[str, Any]]) -> Any:
+    failures: Dict[int, int] = {}
+
+    async def record(conn: Connection, payload: Dict[str, Any]) -> None:
+        assert await conn.fetchval("SELECT 1") == 1
+        calls.append(payload)
+
+    async def flaky(conn: Connection, payload: Dict[str, Any]) -> None:
+        failures[payload["key"]] = failures.get(payload["key"], 0) + 1
+        if failures[payload["key"]] == 1:
+            raise RuntimeError("temporary failure")
+
+        calls.append(payload)
+
+    async def broken(conn: Connection, payload: Dict[str, Any]) -> None:
+        raise RuntimeError("permanent failure")
+
+    def create_runner(**kwargs: Any) -> JobRunner:
+        runner = JobRunner(pool, max_attempts=2, retry_delay=0, **kwargs)
+        runner.register("record", record)
+        runner.register("flaky", flaky)
+        runner.register("broken", broken)
+        return runner
+
+    return create_runner
+
+
+async def test_runner_drains_queue_with_retries_on_stop(
+    runner_factory: Any, calls: List[Dict[str, Any]]
+) -> None:
+    runner = runner_factory(workers=1, queue_size=2)
+    runner.start()
+
+    for key in range(3):
+        await runner.submit("record", {"key": key})
+    await runner.submit("flaky", {"key": 3})
+    await runner.submit("broken", {"key": 4})
+    await runner.stop()
+
+    assert calls == [{"key": key} for key in range(4)]
+    assert runner.metrics["record"].submitted == runner.metrics["record"].succeeded
+    assert runner.metrics["flaky"].retried == runner.metrics["flaky"].succeeded == 1
+    assert runner.metrics["broken"].retried == runner.metrics["broken"].failed == 1
+    assert runner.metrics["broken"].average_duration >= 0
+
+
+async def test_runner_stops_after_drain_timeout(pool: Pool) -> None:
+    async def sleep(conn: Connection, payload: Dict[str, Any]) -> None:
+        await asyncio.sleep(payload["seconds"])
+
+    runner = JobRunner(pool, drain_timeout=0)
+    runner.register("sleep", sleep)
+    runner.start()
+
+    await runner.submit("sleep", {"seconds": 10})
+    await runner.stop()
+
+    assert runner.metrics["sleep"].average_duration == 0
+
+
+async def test_durable_jobs_are_kept_as_failed_after_max_attempts(
+    pool: Pool, runner_factory: Any, calls: List[Dict[str, Any]]
+) -> None:
+    runner = runner_factory(durable=True)
+    await runner.submit("record", {"key": 0})
+    await runner.submit("broken", {"key": 1})
+
+    processed = [await runner.process_durable_job() for _ in range(4)]
+
+    assert processed == [True, True, True, False]
+    assert calls == [{"key": 0}]
+    assert runner.metrics["broken"].retried == runner.metrics["broken"].failed == 1
+    async with pool.acquire() as connection:
+        failed_job = await connection.fetchrow(
+            "SELECT name, attempts, last_error, failed_at FROM background_jobs"
+        )
+    assert failed_job["name"] == "broken"
+    assert failed_job["attempts"] == 2
+    assert "permanent failure" in failed_job["last_error"]
+    assert failed_job["failed_at"] is not None
+
+
+async def test_durable_feed_jobs_claimed_out_of_order_keep_feed_consistent(
+    pool: Pool, test_user: UserInDB, test_article: Article
+) -> None:
+    runner = JobRunner(pool, durable=True)
+    for job_name, job_handler in feed_jobs.FEED_JOBS.items():
+        runner.register(job_name, job_handler)
+
+    async with pool.acquire() as connection:
+        fan = await UsersRepository(connection).create_user(
+            username="fan", email="fan@email.com", password="password"
+        )
+        profiles_repo = ProfilesRepository(connection)
+        for following in (True, False):
+            await profiles_repo.change_following_state(
+                username=test_user.username, requested_user=fan, following=following
+            )
+
+    # another worker claimed the unfollow job before the follow job
+    for following in (False, True):
+        await feed_jobs.submit_following_changes(
+            runner,
+            user_id=fan.id_,
+            following_by_usernames={test_user.username: following},
+            max_items=2,
+        )
+    processed = [await runner.process_durable_job() for _ in range(2)]
+
+    assert processed == [True, True]
+    async with pool.acquire() as connection:
+        feed_items_count = await connection.fetchval(
+            "SELECT count(*) FROM feed_items WHERE user_id = $1", fan.id_
+        )
+    assert feed_items_count == 0
+
+
+async def test_durable_jobs_are_processed_by_workers(
+    runner_factory: Any, calls: List[Dict[str, Any]]
+) -> None:
+    runner = runner_factory(durable=True, workers=1, poll_interval=0.01)
+    await runner.submit("record", {"key": 0})
+    runner.start()
+
+    async def processed() -> None:
+        while not runner.metrics["record"].succeeded:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(processed(), timeout=5)
+    await runner.stop()
+
+    assert calls == [{"key": 0}]
@@ -0,0 +1,27 @@
+import pytest
+from asyncpg.pool import Pool
+
+from app.db.purger import DeletedArticlesPurger
+from app.models.domain.articles import Article
+
+pytestmark = pytest.mark.asyncio
+
+DEPENDENTS_COUNT_QUERY = """
+SELECT (SELECT count(*) FROM favorites WHERE article_id = $1) +
+       (SELECT count(*) FROM articles_to_tags WHERE article_id = $1) +
+       (SELECT count(*) FROM commentaries WHERE article_id = $1) +
+       (SELECT count(*) FROM articles WHERE id = $1)
+"""
+
+
+async def test_deleted_article_is_purged_in_batches(
+    pool: Pool, deleted_article: Article
+) -> None:
+    purger = DeletedArticlesPurger(pool, batch_size=2, pause=0)
+
+    assert await purger.purge() == 3 + 2 + 3 + 1
+
+    async with pool.acquire() as connection:
+        assert (
+            await connection.fetchval(DEPENDENTS_COUNT_QUERY, deleted_article.id_) == 0
+        )
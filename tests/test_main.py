@@ -0,0 +1,18 @@
+import sys
+
+import pytest
+from fastapi import FastAPI
+
+from app import main
+
+
+def test_application_is_not_built_on_main_import() -> None:
+    assert "app" not in vars(main)
+
+
+def test_asgi_module_builds_application(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, "app.asgi", raising=False)
+
+    from app import asgi  # local import for testing purpose
+
+    assert isinstance(asgi.app, FastAPI)
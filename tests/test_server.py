@@ -0,0 +1,102 @@
+import os
+import pathlib
+import runpy
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+import uvicorn
+from alembic import command
+from alembic.config import Config
+
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.migrate import get_alembic_config
+from app.server import get_pool_size_for_worker, get_server_options, get_workers_count
+
+
+@pytest.fixture
+def settings() -> AppSettings:
+    return get_app_settings().copy(
+        update={"min_connection_count": 5, "max_connection_count": 10}
+    )
+
+
+@pytest.mark.parametrize(
+    "budget, workers, pool_size",
+    ((None, 4, (5, 10)), (40, 4, (5, 9)), (24, 4, (5, 5)), (4, 4, (1, 1))),
+)
+def test_pool_size_is_derived_from_connection_budget(
+    settings: AppSettings,
+    budget: Optional[int],
+    workers: int,
+    pool_size: Tuple[int, int],
+) -> None:
+    settings.database_connection_budget = budget
+
+    assert get_pool_size_for_worker(settings, workers=workers) == pool_size
+
+
+@pytest.mark.parametrize("server_workers", (None, 3))
+def test_workers_count_defaults_to_cpus_count(
+    settings: AppSettings, server_workers: Optional[int]
+) -> None:
+    settings.server_workers = server_workers
+
+    assert get_workers_count(settings) == (server_workers or os.cpu_count())
+
+
+def test_server_options_are_taken_from_settings(settings: AppSettings) -> None:
+    server_options = get_server_options(settings, workers=2)
+
+    assert server_options["workers"] == 2
+    assert server_options["timeout_keep_alive"] == settings.server_keep_alive
+    assert server_options["backlog"] == settings.server_backlog
+    assert server_options["loop"] in {"uvloop", "asyncio"}
+    assert server_options["http"] in {"httptools", "h11"}
+
+
+def test_server_runs_workers_with_pool_size_from_budget(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    runs: List[Tuple[str, Dict[str, Any]]] = []
+    monkeypatch.setattr(
+        uvicorn, "run", lambda app, **kwargs: runs.append((app, kwargs))
+    )
+    # setenv records the previous values, so they are restored after the test
+    monkeypatch.setenv("SERVER_WORKERS", "2")
+    monkeypatch.setenv("DATABASE_CONNECTION_BUDGET", "10")
+    monkeypatch.setenv("MIN_CONNECTION_COUNT", "10")
+    monkeypatch.setenv("MAX_CONNECTION_COUNT", "10")
+    get_app_settings.cache_clear()
+    monkeypatch.delitem(sys.modules, "app.server")
+
+    try:
+        runpy.run_module("app.server", run_name="__main__")
+        worker_settings = get_app_settings()
+    finally:
+        get_app_settings.cache_clear()
+
+    assert runs == [("app.main:get_application", runs[0][1])]
+    assert runs[0][1]["factory"]
+    assert runs[0][1]["workers"] == 2
+    assert os.environ["MAX_CONNECTION_COUNT"] == "4"
+    assert worker_settings.max_connection_count == 4
+
+
+def test_migrations_are_applied_up_to_head(monkeypatch: pytest.MonkeyPatch) -> None:
+    upgrades: List[Tuple[Config, str]] = []
+    monkeypatch.setattr(
+        command,
+        "upgrade",
+        lambda config, revision: upgrades.append((config, revision)),
+    )
+    monkeypatch.delitem(sys.modules, "app.migrate")
+
+    runpy.run_module("app.migrate", run_name="__main__")
+
+    ((alembic_config, revision),) = upgrades
+    assert revision == "head"
+    script_location = alembic_config.get_main_option("script_location")
+    assert script_location == get_alembic_config().get_main_option("script_location")
+    assert pathlib.Path(script_location).is_dir()
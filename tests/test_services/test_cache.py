@@ -0,0 +1,127 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.cache import SingleFlight, TTLCache
+
+
+def test_cached_value_is_returned_until_expiration(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = TTLCache(maxsize=10, ttl=30)
+    cache.set("key", ["value"])
+    assert cache.get("key") == ["value"]
+
+    expired_at = time.monotonic() + 31
+    monkeypatch.setattr(time, "monotonic", lambda: expired_at)
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_value_is_evicted() -> None:
+    cache = TTLCache(maxsize=2, ttl=30)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+    cache.set("third", 3)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_loader_call() -> None:
+    cache = TTLCache(maxsize=10, ttl=30)
+    loads = []
+
+    async def loader() -> str:
+        loads.append(None)
+        await asyncio.sleep(0.01)
+        return "loaded"
+
+    loaded_values = await asyncio.gather(
+        *(cache.get_or_load("key", loader) for _ in range(5))
+    )
+
+    assert loaded_values == ["loaded"] * 5
+    assert len(loads) == 1
+
+
+@pytest.mark.asyncio
+async def test_waiting_load_retries_after_failed_load() -> None:
+    cache = TTLCache(maxsize=10, ttl=30)
+
+    async def failing_loader() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError
+
+    async def loader() -> str:
+        return "loaded"
+
+    failed_load, retried_load = await asyncio.gather(
+        cache.get_or_load("key", failing_loader),
+        cache.get_or_load("key", loader),
+        return_exceptions=True,
+    )
+
+    assert isinstance(failed_load, RuntimeError)
+    assert retried_load == "loaded"
+
+
+@pytest.mark.asyncio
+async def test_value_loaded_before_clear_is_not_cached() -> None:
+    cache = TTLCache(maxsize=10, ttl=30)
+
+    async def loader() -> str:
+        cache.clear()
+        return "stale"
+
+    assert await cache.get_or_load("key", loader) == "stale"
+    assert cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_load_started_after_forget_does_not_join_older_load() -> None:
+    single_flight = SingleFlight()
+    stale_load_started = asyncio.Event()
+
+    async def stale_loader() -> str:
+        stale_load_started.set()
+        await asyncio.sleep(0.01)
+        return "stale"
+
+    async def fresh_loader() -> str:
+        return "fresh"
+
+    stale_load = asyncio.ensure_future(single_flight.run("key", stale_loader))
+    await stale_load_started.wait()
+    single_flight.forget("key")
+
+    assert await single_flight.run("key", fresh_loader) == "fresh"
+    assert await stale_load == "stale"
+    assert await single_flight.run("key", fresh_loader) == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_cleared_cache_does_not_join_older_loads() -> None:
+    cache = TTLCache(maxsize=10, ttl=30)
+    stale_load_started = asyncio.Event()
+
+    async def stale_loader() -> str:
+        stale_load_started.set()
+        await asyncio.sleep(0.01)
+        return "stale"
+
+    async def fresh_loader() -> str:
+        return "fresh"
+
+    stale_load = asyncio.ensure_future(cache.get_or_load("key", stale_loader))
+    await stale_load_started.wait()
+    cache.clear()
+
+    assert await cache.get_or_load("key", fresh_loader) == "fresh"
+    assert await stale_load == "stale"
+    assert cache.get("key") == "fresh"
@@ -0,0 +1,23 @@
+import pytest
+
+from app.services.etags import etag_matches, make_etag
+
+
+def test_etag_changes_with_version() -> None:
+    assert make_etag(1, "2020-01-01", True) == make_etag(1, "2020-01-01", True)
+    assert make_etag(1, "2020-01-01", True) != make_etag(1, "2020-01-01", False)
+
+
+@pytest.mark.parametrize(
+    "if_none_match, matches",
+    (
+        (None, False),
+        ("", False),
+        ("*", True),
+        ('"other"', False),
+        ('"other", "etag"', True),
+        ('W/"etag"', True),
+    ),
+)
+def test_etag_matching(if_none_match: str, matches: bool) -> None:
+    assert etag_matches(if_none_match, '"etag"') is matches